@@ -7,63 +7,61 @@ class ReportPartnerLedger(models.AbstractModel):
     _name = 'report.accounting_pdf_reports.report_partnerledger'
     _description = 'Partner Ledger Report'
 
-    def _lines(self, data, partner):
-        full_account = []
+    def _get_partner_lines(self, data, partner_ids):
+        """Fetch the ledger lines of all given partners in a single query.
+
+        Lines are partitioned by partner in memory; each partner's lines are
+        ordered by date and carry their running balance in 'progress'.
+        """
+        lines_by_partner = {partner_id: [] for partner_id in partner_ids}
+        if not partner_ids:
+            return lines_by_partner
         currency = self.env['res.currency']
         query_get_data = self.env['account.move.line'].with_context(data['form'].get('used_context', {}))._query_get()
         reconcile_clause = "" if data['form']['reconciled'] else ' AND "account_move_line".full_reconcile_id IS NULL '
-        params = [partner.id, tuple(data['computed']['move_state']), tuple(data['computed']['account_ids'])] + query_get_data[2]
+        params = [tuple(partner_ids), tuple(data['computed']['move_state']), tuple(data['computed']['account_ids'])] + query_get_data[2]
         query = """
-            SELECT "account_move_line".id, "account_move_line".date, j.code, acc.name->>'en_US' as a_name, "account_move_line".ref, m.name as move_name, "account_move_line".name, "account_move_line".debit, "account_move_line".credit, "account_move_line".amount_currency,"account_move_line".currency_id, c.symbol AS currency_code
+            SELECT "account_move_line".id, "account_move_line".partner_id, "account_move_line".date, j.code, acc.name->>'en_US' as a_name, "account_move_line".ref, m.name as move_name, "account_move_line".name, "account_move_line".debit, "account_move_line".credit, "account_move_line".amount_currency,"account_move_line".currency_id, c.symbol AS currency_code
             FROM """ + query_get_data[0] + """
             LEFT JOIN account_journal j ON ("account_move_line".journal_id = j.id)
             LEFT JOIN account_account acc ON ("account_move_line".account_id = acc.id)
             LEFT JOIN res_currency c ON ("account_move_line".currency_id=c.id)
             LEFT JOIN account_move m ON (m.id="account_move_line".move_id)
-            WHERE "account_move_line".partner_id = %s
+            WHERE "account_move_line".partner_id IN %s
                 AND m.state IN %s
                 AND "account_move_line".account_id IN %s AND """ + query_get_data[1] + reconcile_clause + """
-                ORDER BY "account_move_line".date"""
+                ORDER BY "account_move_line".partner_id, "account_move_line".date, "account_move_line".id"""
         self.env.cr.execute(query, tuple(params))
-        res = self.env.cr.dictfetchall()
-        sum = 0.0
-        lang_code = self.env.context.get('lang') or 'en_US'
-        lang = self.env['res.lang']
-        lang_id = lang._lang_get(lang_code)
-        date_format = lang_id.date_format
-        for r in res:
-            r['date'] = r['date']
+        progress = {}
+        for r in self.env.cr.dictfetchall():
+            partner_id = r.pop('partner_id')
             r['displayed_name'] = '-'.join(
                 r[field_name] for field_name in ('move_name', 'ref', 'name')
                 if r[field_name] not in (None, '', '/')
             )
-            sum += r['debit'] - r['credit']
-            r['progress'] = sum
+            progress[partner_id] = progress.get(partner_id, 0.0) + r['debit'] - r['credit']
+            r['progress'] = progress[partner_id]
             r['currency_id'] = currency.browse(r.get('currency_id'))
-            full_account.append(r)
-        return full_account
+            lines_by_partner[partner_id].append(r)
+        return lines_by_partner
+
+    def _get_partner_sums(self, lines_by_partner):
+        """Debit, credit and balance totals per partner from its ledger lines."""
+        sums = {}
+        for partner_id, lines in lines_by_partner.items():
+            debit = sum(line['debit'] for line in lines)
+            credit = sum(line['credit'] for line in lines)
+            sums[partner_id] = {'debit': debit, 'credit': credit, 'debit - credit': debit - credit}
+        return sums
+
+    def _lines(self, data, partner):
+        return self._get_partner_lines(data, [partner.id])[partner.id]
 
     def _sum_partner(self, data, partner, field):
         if field not in ['debit', 'credit', 'debit - credit']:
             return
-        result = 0.0
-        query_get_data = self.env['account.move.line'].with_context(data['form'].get('used_context', {}))._query_get()
-        reconcile_clause = "" if data['form']['reconciled'] else ' AND "account_move_line".full_reconcile_id IS NULL '
-
-        params = [partner.id, tuple(data['computed']['move_state']), tuple(data['computed']['account_ids'])] + query_get_data[2]
-        query = """SELECT sum(""" + field + """)
-                FROM """ + query_get_data[0] + """, account_move AS m
-                WHERE "account_move_line".partner_id = %s
-                    AND m.id = "account_move_line".move_id
-                    AND m.state IN %s
-                    AND account_id IN %s
-                    AND """ + query_get_data[1] + reconcile_clause
-        self.env.cr.execute(query, tuple(params))
-
-        contemp = self.env.cr.fetchone()
-        if contemp is not None:
-            result = contemp[0] or 0.0
-        return result
+        lines_by_partner = self._get_partner_lines(data, [partner.id])
+        return self._get_partner_sums(lines_by_partner)[partner.id][field]
 
     @api.model
     def _get_report_values(self, docids, data=None):
@@ -111,12 +109,25 @@ class ReportPartnerLedger(models.AbstractModel):
         partners = obj_partner.browse(partner_ids)
         partners = sorted(partners, key=lambda x: (x.ref or '', x.name or ''))
 
+        # All partners' lines and totals are fetched up front; the template
+        # callbacks below only look them up.
+        lines_by_partner = self._get_partner_lines(data, partner_ids)
+        partner_sums = self._get_partner_sums(lines_by_partner)
+
+        def lines(data, partner):
+            return lines_by_partner.get(partner.id, [])
+
+        def sum_partner(data, partner, field):
+            if field not in ['debit', 'credit', 'debit - credit']:
+                return
+            return partner_sums.get(partner.id, {}).get(field, 0.0)
+
         return {
             'doc_ids': partner_ids,
             'doc_model': self.env['res.partner'],
             'data': data,
             'docs': partners,
             'time': time,
-            'lines': self._lines,
-            'sum_partner': self._sum_partner,
+            'lines': lines,
+            'sum_partner': sum_partner,
         }
@@ -301,6 +301,30 @@ class OpsReportController(http.Controller):
             _logger.error(f"Error generating Excel export: {e}", exc_info=True)
             return request.not_found(str(e))
 
+    @http.route('/ops/report/xlsx/financial/<int:wizard_id>', type='http', auth='user')
+    def report_financial_xlsx_stream(self, wizard_id, **kwargs):
+        """
+        Stream the Financial Intelligence Excel export.
+
+        The workbook is written in constant memory to a temporary file and
+        sent in chunks, so large General Ledger exports stay bounded.
+
+        Args:
+            wizard_id (int): ops.general.ledger.wizard.enhanced record ID
+
+        Returns:
+            Response: Excel file download
+        """
+        try:
+            wizard = request.env['ops.general.ledger.wizard.enhanced'].browse(wizard_id)
+            if not wizard.exists():
+                return request.not_found("Wizard record not found")
+            return wizard._stream_excel_export()
+        except AccessError as e:
+            return request.render('http_routing.403', {'message': str(e)})
+        except UserError as e:
+            return self._render_error('Excel Export Error', str(e))
+
     def _render_error(self, title, message):
         """
         Render simple error page.
@@ -17,9 +17,11 @@ from . import ops_asset
 from . import ops_asset_depreciation
 from . import ops_fiscal_period
 from . import account_move
+from . import ops_journal_daily_balance
 from . import purchase_order
 from . import ops_report_template
 from . import ops_report_helpers
+from . import ops_account_tree
 from . import ops_report_audit
 from . import ops_recurring
 from . import ops_journal_template
@@ -205,11 +205,31 @@ class AccountMove(models.Model):
         - Receipt: qty_received on PO line (from stock.picking)
         - Invoice: account.move.line quantity
         """
+        results = self._evaluate_three_way_match()
+        for move in self:
+            move.three_way_match_status, move.three_way_match_details = results[move.id]
+
+    def _evaluate_three_way_match(self):
+        """
+        Evaluate the three-way match of every move in self.
+
+        PO quantities for the whole batch are fetched through the
+        ops.three.way.match quantity service, so the cost does not grow
+        with the number of bills or lines.
+
+        Returns:
+            dict: {move.id: (status, details)}
+        """
+        vendor_bills = self.filtered(lambda m: m.move_type == 'in_invoice')
+        quantities = self.env['ops.three.way.match']._get_match_quantities(
+            vendor_bills.invoice_line_ids.purchase_line_id._origin.ids
+        )
+
+        results = {}
         for move in self:
             # Only for vendor bills
             if move.move_type != 'in_invoice':
-                move.three_way_match_status = 'not_applicable'
-                move.three_way_match_details = ''
+                results[move.id] = ('not_applicable', '')
                 continue
 
             # Get invoice lines with PO reference
@@ -222,17 +242,15 @@ class AccountMove(models.Model):
 
             # No product lines at all
             if not product_lines:
-                move.three_way_match_status = 'not_applicable'
-                move.three_way_match_details = _('No product lines on invoice')
+                results[move.id] = ('not_applicable', _('No product lines on invoice'))
                 continue
 
             # No PO reference on any lines
             if not lines_with_po:
-                move.three_way_match_status = 'no_po'
-                move.three_way_match_details = _(
+                results[move.id] = ('no_po', _(
                     'No purchase order reference found on invoice lines.\n'
                     'This bill is not linked to any PO.'
-                )
+                ))
                 continue
 
             # Analyze each line for match status
@@ -245,9 +263,9 @@ class AccountMove(models.Model):
             has_partial = False
 
             for line in lines_with_po:
-                po_line = line.purchase_line_id
-                ordered = po_line.product_qty
-                received = po_line.qty_received
+                po_quantities = quantities.get(line.purchase_line_id._origin.id, {})
+                ordered = po_quantities.get('ordered', 0.0)
+                received = po_quantities.get('qty_received', 0.0)
                 billed = line.quantity
 
                 total_ordered += ordered
@@ -275,17 +293,17 @@ class AccountMove(models.Model):
 
             # Determine final status
             if has_over:
-                move.three_way_match_status = 'over_billed'
+                status = 'over_billed'
             elif total_received == 0:
-                move.three_way_match_status = 'pending_receipt'
+                status = 'pending_receipt'
             elif has_pending or total_received < total_billed:
-                move.three_way_match_status = 'partial_receipt'
+                status = 'partial_receipt'
             elif has_partial:
-                move.three_way_match_status = 'partial_match'
+                status = 'partial_match'
             elif total_billed <= total_received and total_billed <= total_ordered:
-                move.three_way_match_status = 'fully_matched'
+                status = 'fully_matched'
             else:
-                move.three_way_match_status = 'exception'
+                status = 'exception'
 
             # Build details text
             summary = _(
@@ -293,9 +311,11 @@ class AccountMove(models.Model):
             ) % {'ordered': total_ordered, 'received': total_received, 'billed': total_billed}
 
             if details:
-                move.three_way_match_details = summary + _('\n\nDiscrepancies:\n') + '\n'.join(details)
+                results[move.id] = (status, summary + _('\n\nDiscrepancies:\n') + '\n'.join(details))
             else:
-                move.three_way_match_details = summary + _('\n\n✓ All lines fully matched')
+                results[move.id] = (status, summary + _('\n\n✓ All lines fully matched'))
+
+        return results
 
     @api.depends(
         'invoice_line_ids.purchase_line_id.order_id',
@@ -487,18 +507,22 @@ class AccountMove(models.Model):
     def _check_three_way_match(self):
         """Check three-way match validation before posting vendor bills.
 
+        The match of all bills being posted is re-evaluated in one batch
+        so the check reflects receipts recorded since the last recompute.
+
         Raises:
             ValidationError: If three-way match is required and not satisfied
         """
-        for move in self:
-            # Only check vendor bills
-            if move.move_type != 'in_invoice':
-                continue
+        to_check = self.filtered(
+            lambda m: m.move_type == 'in_invoice' and m.three_way_match_required
+        )
+        if not to_check:
+            return
 
-            # Skip if three-way match not required for this company
-            if not move.three_way_match_required:
-                continue
+        results = to_check.filtered(lambda m: not m.three_way_match_override)._evaluate_three_way_match()
+        status_labels = dict(self._fields['three_way_match_status'].selection)
 
+        for move in to_check:
             # Check if override was approved
             if move.three_way_match_override:
                 # Log override usage
@@ -517,12 +541,11 @@ class AccountMove(models.Model):
                 )
                 continue
 
+            status, details = results[move.id]
+
             # Block posting for problematic statuses
             blocking_statuses = ('no_po', 'pending_receipt', 'over_billed')
-            if move.three_way_match_status in blocking_statuses:
-                status_label = dict(move._fields['three_way_match_status'].selection).get(
-                    move.three_way_match_status, move.three_way_match_status
-                )
+            if status in blocking_statuses:
                 raise ValidationError(_(
                     "Cannot post vendor bill - Three-Way Match validation failed.\n\n"
                     "Bill: %(bill)s\n"
@@ -534,21 +557,21 @@ class AccountMove(models.Model):
                     "• Correct the invoice quantities to match received goods"
                 ) % {
                     'bill': move.name or _('Draft'),
-                    'status': status_label,
-                    'details': move.three_way_match_details or _('N/A'),
+                    'status': status_labels.get(status, status),
+                    'details': details or _('N/A'),
                 })
 
             # Log warning for partial matches (don't block)
-            elif move.three_way_match_status in ('partial_receipt', 'partial_match'):
+            elif status in ('partial_receipt', 'partial_match'):
                 _logger.warning(
                     'Posting vendor bill with partial three-way match: %s (status: %s)',
-                    move.name, move.three_way_match_status
+                    move.name, status
                 )
                 move.message_post(
                     body=_(
                         '⚠️ <strong>Partial receipt warning</strong> - not all ordered items '
                         'have been received.<br/><br/>%(details)s'
-                    ) % {'details': (move.three_way_match_details or '').replace('\n', '<br/>')},
+                    ) % {'details': (details or '').replace('\n', '<br/>')},
                     message_type='notification'
                 )
 
@@ -627,6 +650,24 @@ class AccountMove(models.Model):
                         message_type='notification'
                     )
 
+    def _post(self, soft=True):
+        """Carry the newly posted moves into the journal daily balances."""
+        to_post = self.filtered(lambda m: m.state != 'posted')
+        posted = super()._post(soft=soft)
+        self.env['ops.journal.daily.balance']._apply_move_deltas(
+            (posted & to_post).filtered(lambda m: m.state == 'posted'), 1
+        )
+        return posted
+
+    def button_draft(self):
+        """Take moves leaving posted state out of the journal daily balances."""
+        was_posted = self.filtered(lambda m: m.state == 'posted')
+        res = super().button_draft()
+        self.env['ops.journal.daily.balance']._apply_move_deltas(
+            was_posted.filtered(lambda m: m.state != 'posted'), -1
+        )
+        return res
+
     def button_cancel(self):
         # Override to prevent cancellation of asset-related moves
         for move in self:
@@ -0,0 +1,428 @@
+# -*- coding: utf-8 -*-
+"""
+OPS Framework - Account Tree Aggregation
+========================================
+
+Shared service that turns journal items into the Chart of Accounts tree
+used by the financial statements (P&L, Balance Sheet, Trial Balance):
+
+- Leaf balances are read once per report run with a single grouped query
+- Accounts are attached to their most specific account.group with an
+  indexed longest-prefix lookup
+- Group totals are rolled up in one linear bottom-up pass
+
+The PDF parser, the Financial Intelligence wizard and the XLSX writers all
+consume this service instead of rebuilding the tree themselves.
+"""
+
+from bisect import bisect_right
+from collections import defaultdict
+
+from odoo import models, api
+
+# Account types shown on each statement
+REPORT_ACCOUNT_TYPES = {
+    'pl': [
+        'income', 'income_other',
+        'expense', 'expense_depreciation', 'expense_direct_cost',
+    ],
+    'bs': [
+        'asset_receivable', 'asset_cash', 'asset_current',
+        'asset_non_current', 'asset_prepayments', 'asset_fixed',
+        'liability_payable', 'liability_credit_card',
+        'liability_current', 'liability_non_current',
+        'equity', 'equity_unaffected',
+    ],
+}
+
+ACCOUNT_TYPE_LABELS = {
+    'asset_receivable': 'Accounts Receivable',
+    'asset_cash': 'Bank and Cash',
+    'asset_current': 'Current Assets',
+    'asset_non_current': 'Non-current Assets',
+    'asset_prepayments': 'Prepayments',
+    'asset_fixed': 'Fixed Assets',
+    'liability_payable': 'Accounts Payable',
+    'liability_credit_card': 'Credit Card',
+    'liability_current': 'Current Liabilities',
+    'liability_non_current': 'Non-current Liabilities',
+    'equity': 'Equity',
+    'equity_unaffected': 'Current Year Earnings',
+    'income': 'Operating Income',
+    'income_other': 'Other Income',
+    'expense': 'Operating Expenses',
+    'expense_depreciation': 'Depreciation',
+    'expense_direct_cost': 'Cost of Revenue',
+    'off_balance': 'Off-Balance Sheet',
+}
+
+# Statement sections and the root group code prefixes that feed them.
+# Typically: 1=assets, 2=liabilities, 3=equity, 4=income, 5-7=expenses.
+STATEMENT_SECTIONS = {
+    'pl': (('income', ('4',)), ('expense', ('5', '6', '7'))),
+    'bs': (('asset', ('1',)), ('liability', ('2',)), ('equity', ('3',))),
+}
+
+
+class OpsAccountTree(models.AbstractModel):
+    """Chart of Accounts tree aggregation shared by the financial reports"""
+
+    _name = 'ops.account.tree'
+    _description = 'OPS Account Tree Aggregation'
+
+    # =========================================================================
+    # CLASSIFICATION
+    # =========================================================================
+
+    @api.model
+    def get_report_account_types(self, report_type):
+        """Account types shown on the given statement ('pl' or 'bs')."""
+        return REPORT_ACCOUNT_TYPES.get(report_type, [])
+
+    @api.model
+    def get_account_type_label(self, account_type):
+        """Human-readable label for an account type."""
+        return ACCOUNT_TYPE_LABELS.get(account_type, account_type)
+
+    @api.model
+    def classify_account_type(self, account_type):
+        """Map an account type to its statement section.
+
+        Returns:
+            'income', 'expense', 'asset', 'liability', 'equity' or None
+        """
+        account_type = account_type or ''
+        if 'income' in account_type:
+            return 'income'
+        if 'expense' in account_type:
+            return 'expense'
+        for section in ('asset', 'liability', 'equity'):
+            if account_type.startswith(section):
+                return section
+        return None
+
+    # =========================================================================
+    # LEAF BALANCES
+    # =========================================================================
+
+    @api.model
+    def get_leaf_balances(self, domain):
+        """Read per-account balances for a journal item domain.
+
+        Args:
+            domain: account.move.line domain of the report run
+
+        Returns:
+            dict {account_id: {account_id, account_code, account_name,
+            account_type, debit, credit, balance}}
+        """
+        grouped = self.env['account.move.line']._read_group(
+            domain=domain,
+            groupby=['account_id'],
+            aggregates=['debit:sum', 'credit:sum', 'balance:sum'],
+        )
+        return {
+            account.id: {
+                'account_id': account.id,
+                'account_code': account.code,
+                'account_name': account.name,
+                'account_type': account.account_type,
+                'debit': debit or 0.0,
+                'credit': credit or 0.0,
+                'balance': balance or 0.0,
+            }
+            for account, debit, credit, balance in grouped
+            if account
+        }
+
+    @api.model
+    def get_sections(self, leaves):
+        """Group leaf balances into flat per-account-type sections."""
+        sections = {}
+        for leaf in leaves.values():
+            account_type = leaf['account_type']
+            section = sections.get(account_type)
+            if section is None:
+                section = sections[account_type] = {
+                    'type': account_type,
+                    'label': self.get_account_type_label(account_type),
+                    'accounts': [],
+                    'total_debit': 0,
+                    'total_credit': 0,
+                    'total_balance': 0,
+                }
+            section['accounts'].append(leaf)
+            section['total_debit'] += leaf['debit']
+            section['total_credit'] += leaf['credit']
+            section['total_balance'] += leaf['balance']
+        return list(sections.values())
+
+    # =========================================================================
+    # TREE BUILDING
+    # =========================================================================
+
+    @api.model
+    def _build_group_index(self, groups):
+        """Index account groups by prefix length for longest-prefix lookups.
+
+        Returns:
+            list of (prefix_length, starts, ranges) sorted longest first,
+            where ranges are (prefix_start, prefix_end, group_id) sorted by
+            prefix_start and starts is the matching list of prefix_start
+        """
+        by_length = defaultdict(list)
+        for group in groups:
+            start = group.code_prefix_start
+            if start:
+                by_length[len(start)].append((start, group.code_prefix_end or start, group.id))
+        index = []
+        for length in sorted(by_length, reverse=True):
+            ranges = sorted(by_length[length])
+            index.append((length, [r[0] for r in ranges], ranges))
+        return index
+
+    @api.model
+    def _match_group(self, code, index):
+        """Return the id of the most specific group covering an account code."""
+        for length, starts, ranges in index:
+            if len(code) < length:
+                continue
+            key = code[:length]
+            pos = bisect_right(starts, key) - 1
+            if pos >= 0 and key <= ranges[pos][1]:
+                return ranges[pos][2]
+        return None
+
+    @api.model
+    def build_tree(self, company, account_types, leaves):
+        """Build the account.group tree with rolled-up balances.
+
+        Every account of the given types is listed, zero balances included.
+
+        Args:
+            company: res.company record
+            account_types: list of account types to include
+            leaves: leaf balances from get_leaf_balances()
+
+        Returns:
+            dict with 'groups' (root group nodes) and 'ungrouped' (accounts
+            not covered by any group)
+        """
+        accounts = self.env['account.account'].search([
+            ('account_type', 'in', account_types),
+            ('company_ids', 'in', [company.id]),
+        ], order='code')
+        groups = self.env['account.group'].search([
+            ('company_id', '=', company.id),
+        ], order='code_prefix_start')
+
+        group_map = {g.id: {
+            'id': g.id,
+            'name': g.name,
+            'code_prefix': g.code_prefix_start or '',
+            'parent_id': g.parent_id.id or None,
+            'children': [],
+            'accounts': [],
+            'total_debit': 0,
+            'total_credit': 0,
+            'total_balance': 0,
+            'level': 0,
+            'is_group': True,
+        } for g in groups}
+
+        # Groups come ordered by prefix, so children end up sorted as well
+        root_groups = []
+        for node in group_map.values():
+            parent = group_map.get(node['parent_id'])
+            if parent:
+                parent['children'].append(node)
+            else:
+                root_groups.append(node)
+
+        # Attach accounts (ordered by code) to their most specific group
+        index = self._build_group_index(groups)
+        ungrouped = []
+        for account in accounts:
+            leaf = leaves.get(account.id, {})
+            account_data = {
+                'id': account.id,
+                'code': account.code,
+                'name': account.name,
+                'account_type': account.account_type,
+                'debit': leaf.get('debit', 0),
+                'credit': leaf.get('credit', 0),
+                'balance': leaf.get('balance', 0),
+                'is_group': False,
+            }
+            node = group_map.get(self._match_group(account.code or '', index))
+            if node:
+                node['accounts'].append(account_data)
+                node['total_debit'] += account_data['debit']
+                node['total_credit'] += account_data['credit']
+                node['total_balance'] += account_data['balance']
+            else:
+                ungrouped.append(account_data)
+
+        # Top-down pass assigns levels; walking it backwards rolls totals up
+        ordered = list(root_groups)
+        for node in ordered:
+            for child in node['children']:
+                child['level'] = node['level'] + 1
+                ordered.append(child)
+        for node in reversed(ordered):
+            parent = group_map.get(node['parent_id'])
+            if parent:
+                parent['total_debit'] += node['total_debit']
+                parent['total_credit'] += node['total_credit']
+                parent['total_balance'] += node['total_balance']
+
+        return {
+            'groups': root_groups,
+            'ungrouped': ungrouped,
+        }
+
+    # =========================================================================
+    # FLATTENING
+    # =========================================================================
+
+    @api.model
+    def _flatten_group(self, node, lines, indent=0):
+        """Append a group, its sub-groups, accounts and subtotal to lines."""
+        lines.append({
+            'type': 'group',
+            'indent': indent,
+            'code': node.get('code_prefix', ''),
+            'name': node['name'],
+            'debit': node['total_debit'],
+            'credit': node['total_credit'],
+            'balance': node['total_balance'],
+            'is_subtotal': False,
+        })
+        for child in node['children']:
+            self._flatten_group(child, lines, indent + 1)
+        for account in node['accounts']:
+            lines.append(self._account_line(account, indent + 1))
+        if node['accounts'] or node['children']:
+            lines.append({
+                'type': 'subtotal',
+                'indent': indent,
+                'code': '',
+                'name': f"Total {node['name']}",
+                'debit': node['total_debit'],
+                'credit': node['total_credit'],
+                'balance': node['total_balance'],
+                'is_subtotal': True,
+            })
+
+    @api.model
+    def _account_line(self, account, indent):
+        return {
+            'type': 'account',
+            'indent': indent,
+            'code': account['code'],
+            'name': account['name'],
+            'account_type': account['account_type'],
+            'debit': account['debit'],
+            'credit': account['credit'],
+            'balance': account['balance'],
+            'is_subtotal': False,
+        }
+
+    @api.model
+    def flatten_tree(self, tree, report_type):
+        """Flatten the tree into per-section line lists for rendering.
+
+        Root groups are assigned to sections by code prefix; ungrouped
+        accounts by account type. Asset balances keep their sign, every
+        other section total is reported as an absolute amount.
+
+        Returns:
+            dict with '<section>_hierarchy' line lists and '<section>_total'
+            amounts (plus 'net_profit' for the P&L)
+        """
+        sections = STATEMENT_SECTIONS.get(report_type)
+        if not sections:
+            lines = []
+            for group in tree.get('groups', []):
+                self._flatten_group(group, lines)
+            return {'lines': lines}
+
+        result = {}
+        for section, prefixes in sections:
+            lines = []
+            total = 0
+            for group in tree.get('groups', []):
+                if group['code_prefix'].startswith(prefixes):
+                    self._flatten_group(group, lines)
+                    balance = group['total_balance']
+                    total += balance if section == 'asset' else abs(balance)
+            for account in tree.get('ungrouped', []):
+                if self.classify_account_type(account['account_type']) == section:
+                    lines.append(self._account_line(account, 0))
+                    balance = account['balance']
+                    total += balance if section == 'asset' else abs(balance)
+            result[f'{section}_hierarchy'] = lines
+            result[f'{section}_total'] = total
+
+        if report_type == 'pl':
+            result['net_profit'] = result['income_total'] - result['expense_total']
+        return result
+
+    @api.model
+    def flatten_by_parent(self, lines, parent_field='parent_id', sort_by='code'):
+        """Order flat dicts depth-first by a parent reference.
+
+        Each line gets 'level' and 'row_class' set from its depth.
+        """
+        if not lines:
+            return []
+
+        by_parent = defaultdict(list)
+        roots = []
+        for line in lines:
+            parent_id = line.get(parent_field)
+            if parent_id:
+                by_parent[parent_id].append(line)
+            else:
+                roots.append(line)
+
+        def sort_key(line):
+            return line.get(sort_by, '')
+
+        result = []
+        stack = [(root, 0) for root in reversed(sorted(roots, key=sort_key) if sort_by else roots)]
+        while stack:
+            item, level = stack.pop()
+            item['level'] = level
+            item['row_class'] = f"level-{level}"
+            result.append(item)
+            children = by_parent.get(item.get('id') or item.get('account_id'), [])
+            if sort_by:
+                children = sorted(children, key=sort_key)
+            stack.extend((child, level + 1) for child in reversed(children))
+        return result
+
+    # =========================================================================
+    # ENTRY POINT
+    # =========================================================================
+
+    @api.model
+    def get_statement_data(self, domain, company, report_type):
+        """Compute everything a statement needs from one leaf-balance read.
+
+        Args:
+            domain: account.move.line domain of the report run
+            company: res.company record whose chart is rendered
+            report_type: 'pl' or 'bs'
+
+        Returns:
+            dict with 'leaves', 'sections' (flat, per account type) and
+            'hierarchy' (flattened account.group tree)
+        """
+        leaves = self.get_leaf_balances(domain)
+        tree = self.build_tree(company, self.get_report_account_types(report_type), leaves)
+        return {
+            'leaves': leaves,
+            'sections': self.get_sections(leaves),
+            'hierarchy': self.flatten_tree(tree, report_type),
+        }
@@ -182,8 +182,8 @@ class OpsAsset(models.Model):
                 raise UserError(_("Please assign an asset category before confirming."))
             if asset.state != 'draft':
                 raise UserError(_("Only draft assets can be confirmed."))
-            asset.generate_depreciation_schedule()
-            asset.write({'state': 'running'})
+        self.generate_depreciation_schedule()
+        self.write({'state': 'running'})
         return True
 
     def action_pause(self):
@@ -269,17 +269,38 @@ class OpsAsset(models.Model):
         - Prorata temporis (partial first period)
         - Monthly or yearly periods
         - Salvage value
-        """
-        self.ensure_one()
-        _logger.info(f"Generating depreciation schedule for asset: {self.name} (ID: {self.id})")
 
+        Works on the whole recordset: draft lines are removed in one call and
+        the new schedules of all assets are created with a single create().
+        """
         # Clear existing draft lines
         self.depreciation_ids.filtered(lambda l: l.state == 'draft').unlink()
 
+        vals_list = []
+        for asset in self:
+            vals_list.extend(asset._prepare_depreciation_schedule())
+
+        # Create depreciation lines
+        if vals_list:
+            self.env['ops.asset.depreciation'].create(vals_list)
+            _logger.info(f"Created {len(vals_list)} depreciation lines for {len(self)} assets")
+
+        return True
+
+    def _prepare_depreciation_schedule(self):
+        """
+        Compute the depreciation line values for a single asset.
+
+        Returns:
+            list: values dicts for ops.asset.depreciation
+        """
+        self.ensure_one()
+        _logger.info(f"Generating depreciation schedule for asset: {self.name} (ID: {self.id})")
+
         # Validations
         if self.depreciable_value <= 0:
             _logger.warning(f"Asset {self.name} has no depreciable value. No schedule generated.")
-            return
+            return []
 
         category = self.category_id
         if not category:
@@ -338,12 +359,7 @@ class OpsAsset(models.Model):
         else:
             raise UserError(_("Unknown depreciation method: %s") % method)
 
-        # Create depreciation lines
-        if lines:
-            self.env['ops.asset.depreciation'].create(lines)
-            _logger.info(f"Created {len(lines)} depreciation lines for asset {self.name}")
-
-        return True
+        return lines or []
 
     def _compute_linear_depreciation(self, depreciable_value, total_periods, period_months,
                                       first_date, prorata, purchase_date):
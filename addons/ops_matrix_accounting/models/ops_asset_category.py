@@ -154,6 +154,12 @@ class OpsAssetCategory(models.Model):
         help='Automatically post depreciation entries when due via daily cron job. '
              'Only applies to assets in "Running" state.'
     )
+    group_entries = fields.Boolean(
+        string='Group Journal Entries',
+        default=False,
+        help='Post one journal entry per branch, business unit and date for all '
+             'assets of this category instead of one entry per depreciation line.'
+    )
     auto_post_day = fields.Integer(
         string='Auto-Post Day',
         default=0,
@@ -280,6 +286,12 @@ class OpsAssetCategory(models.Model):
             'context': {'default_category_id': self.id}
         }
 
+    def _check_depreciation_accounting(self):
+        """Ensure the accounting configuration needed to post depreciation is set."""
+        for category in self:
+            if not all([category.journal_id, category.expense_account_id, category.depreciation_account_id]):
+                raise UserError(_('The asset category is missing some accounting configuration (Journal, Expense Account, or Depreciation Account).'))
+
     def unlink(self):
         for category in self:
             if category.asset_ids:
@@ -18,12 +18,15 @@ Reference: om_account_asset cron pattern
 """
 from odoo import api, fields, models, _
 from odoo.exceptions import UserError, ValidationError
-from odoo.tools import float_is_zero, float_round
+from odoo.tools import float_is_zero, float_round, split_every
 from datetime import timedelta
 import logging
 
 _logger = logging.getLogger(__name__)
 
+# Depreciation lines posted (and committed) per cron transaction
+DEPRECIATION_BATCH_SIZE = 500
+
 
 class OpsAssetDepreciation(models.Model):
     _name = 'ops.asset.depreciation'
@@ -106,20 +109,42 @@ class OpsAssetDepreciation(models.Model):
     # COMPUTED FIELDS
     # ============================================
 
-    @api.depends('asset_id', 'sequence', 'amount')
+    @api.depends(
+        'asset_id', 'sequence', 'amount',
+        'asset_id.depreciation_ids.sequence', 'asset_id.depreciation_ids.amount',
+    )
     def _compute_cumulative(self):
-        """Compute cumulative depreciation for each line."""
-        for line in self:
-            if not line.asset_id:
-                line.cumulative_depreciation = 0.0
-                continue
-
-            # Sum all amounts for this asset up to and including this sequence
-            previous_lines = self.search([
-                ('asset_id', '=', line.asset_id.id),
-                ('sequence', '<=', line.sequence),
-            ])
-            line.cumulative_depreciation = sum(previous_lines.mapped('amount'))
+        """
+        Compute cumulative depreciation for each line.
+
+        Depending on the sibling lines means that changing one line's amount
+        or sequence marks every line of the asset for recompute, not only
+        the edited one. All lines of the affected assets are read in one
+        search, then a prefix sum over the sequence gives every line's
+        running total. Lines sharing a sequence are accumulated together.
+        """
+        lines_with_asset = self.filtered('asset_id')
+        (self - lines_with_asset).cumulative_depreciation = 0.0
+        if not lines_with_asset:
+            return
+
+        siblings = self.search([
+            ('asset_id', 'in', lines_with_asset.asset_id._origin.ids),
+        ]) | lines_with_asset
+
+        cumulative = {}
+        for asset, asset_lines in siblings.grouped('asset_id').items():
+            amount_by_sequence = {}
+            for line in asset_lines:
+                amount_by_sequence[line.sequence] = amount_by_sequence.get(line.sequence, 0.0) + line.amount
+
+            running_total = 0.0
+            for sequence in sorted(amount_by_sequence):
+                running_total += amount_by_sequence[sequence]
+                cumulative[(asset.id, sequence)] = running_total
+
+        for line in lines_with_asset:
+            line.cumulative_depreciation = cumulative.get((line.asset_id.id, line.sequence), 0.0)
     
     def action_post(self):
         if not self:
@@ -128,13 +153,7 @@ class OpsAssetDepreciation(models.Model):
         created_moves = self.env['account.move']
         for line in self.filtered(lambda l: l.state == 'draft' and not float_is_zero(l.amount, precision_digits=2)):
             try:
-                move = line._create_journal_entry()
-                move.action_post()
-                line.write({
-                    'state': 'posted',
-                    'move_id': move.id
-                })
-                created_moves |= move
+                created_moves |= line._create_depreciation_moves()
                 _logger.info(f"Posted depreciation for asset {line.asset_id.name} on {line.depreciation_date}")
             except UserError as e:
                 _logger.error(f"Failed to post depreciation for asset {line.asset_id.name}: {e}")
@@ -151,44 +170,96 @@ class OpsAssetDepreciation(models.Model):
 
     def _create_journal_entry(self):
         self.ensure_one()
-        asset = self.asset_id
-        category = asset.category_id
-        
-        if not all([category.journal_id, category.expense_account_id, category.depreciation_account_id]):
-            raise UserError(_('The asset category is missing some accounting configuration (Journal, Expense Account, or Depreciation Account).'))
-
-        move_lines = [
+        self.category_id._check_depreciation_accounting()
+        return self.env['account.move'].create(self._prepare_move_vals())
+
+    def _prepare_move_line_vals(self, amount, name):
+        """Debit/credit line pair for a depreciation amount, dimensions taken from the first line."""
+        asset = self[:1].asset_id
+        category = self[:1].category_id
+        common = {
+            'name': name,
+            'ops_branch_id': asset.ops_branch_id.id,
+            'ops_business_unit_id': asset.ops_business_unit_id.id,
+        }
+        if len(self) == 1 and asset.analytic_account_id:
+            common['analytic_distribution'] = {str(asset.analytic_account_id.id): 100}
+        return [
             # Debit: Depreciation Expense
-            (0, 0, {
-                'account_id': category.expense_account_id.id,
-                'debit': self.amount,
-                'credit': 0.0,
-                'name': _('Depreciation of %s') % asset.name,
-                'partner_id': asset.partner_id.id if hasattr(asset, 'partner_id') else None,
-                'analytic_account_id': asset.analytic_account_id.id if hasattr(asset, 'analytic_account_id') else None,
-            }),
+            (0, 0, dict(common, account_id=category.expense_account_id.id, debit=amount, credit=0.0)),
             # Credit: Accumulated Depreciation
-            (0, 0, {
-                'account_id': category.depreciation_account_id.id,
-                'debit': 0.0,
-                'credit': self.amount,
-                'name': _('Depreciation of %s') % asset.name,
-                'partner_id': asset.partner_id.id if hasattr(asset, 'partner_id') else None,
-                'analytic_account_id': asset.analytic_account_id.id if hasattr(asset, 'analytic_account_id') else None,
-            }),
+            (0, 0, dict(common, account_id=category.depreciation_account_id.id, debit=0.0, credit=amount)),
         ]
 
-        move_vals = {
-            'journal_id': category.journal_id.id,
+    def _prepare_move_vals(self):
+        """Journal entry values for a single depreciation line."""
+        self.ensure_one()
+        asset = self.asset_id
+        return {
+            'journal_id': self.category_id.journal_id.id,
             'date': self.depreciation_date,
             'ref': asset.code,
-            'line_ids': move_lines,
+            'line_ids': self._prepare_move_line_vals(self.amount, _('Depreciation of %s') % asset.name),
             'asset_id': asset.id, # Link back to the asset
-            'branch_id': asset.branch_id.id,
-            'business_unit_id': asset.business_unit_id.id,
+            'asset_depreciation_id': self.id,
+            'ops_branch_id': asset.ops_branch_id.id,
+            'ops_business_unit_id': asset.ops_business_unit_id.id,
+        }
+
+    def _prepare_grouped_move_vals(self):
+        """
+        Journal entry values for lines sharing category, branch, BU and date.
+
+        Mirrors the om_account_asset ``group_entries`` option: one debit and
+        one credit line carrying the total depreciation of the group.
+        """
+        first = self[:1]
+        category = first.category_id
+        amount = sum(self.mapped('amount'))
+        return {
+            'journal_id': category.journal_id.id,
+            'date': first.depreciation_date,
+            'ref': category.name,
+            'line_ids': self._prepare_move_line_vals(amount, _('Grouped depreciation of %s') % category.name),
+            'ops_branch_id': first.branch_id.id,
+            'ops_business_unit_id': first.business_unit_id.id,
         }
 
-        return self.env['account.move'].create(move_vals)
+    def _create_depreciation_moves(self):
+        """
+        Create and post the journal entries for all lines in self at once.
+
+        Lines of categories with ``group_entries`` enabled share one entry per
+        (category, branch, business unit, date); all others get one entry
+        each. Entries are created with a single ``create(vals_list)`` and
+        posted in one call.
+
+        Returns:
+            account.move recordset of the created entries
+        """
+        self.category_id._check_depreciation_accounting()
+
+        vals_list = []
+        line_groups = []
+        for category, category_lines in self.grouped('category_id').items():
+            if category.group_entries:
+                groups = category_lines.grouped(
+                    lambda l: (l.branch_id, l.business_unit_id, l.depreciation_date)
+                ).values()
+                for group in groups:
+                    vals_list.append(group._prepare_grouped_move_vals())
+                    line_groups.append(group)
+            else:
+                for line in category_lines:
+                    vals_list.append(line._prepare_move_vals())
+                    line_groups.append(line)
+
+        moves = self.env['account.move'].create(vals_list)
+        moves.action_post()
+        for move, lines in zip(moves, line_groups):
+            lines.move_id = move
+        self.write({'state': 'posted'})
+        return moves
 
     def action_view_move(self):
         self.ensure_one()
@@ -252,63 +323,75 @@ class OpsAssetDepreciation(models.Model):
         skipped_count = 0
         failed_details = []
 
-        # Group by company for proper context
-        for company in due_lines.mapped('asset_id.company_id'):
-            company_lines = due_lines.filtered(
-                lambda l: l.asset_id.company_id == company
+        # Resolve period locks once for every (company, date) in the run
+        locked_keys = self._get_locked_period_keys(due_lines)
+        locked_lines = due_lines.filtered(
+            lambda l: (l.company_id.id, l.depreciation_date) in locked_keys
+        )
+        for depreciation_date, lines in locked_lines.grouped('depreciation_date').items():
+            _logger.warning(
+                "Skipping %d lines - period locked for date %s",
+                len(lines), depreciation_date
             )
+            lines.write({
+                'auto_post_error': _('Period locked for %s') % depreciation_date
+            })
+        skipped_count += len(locked_lines)
+        if locked_lines:
+            self.env.cr.commit()
+
+        postable = (due_lines - locked_lines).filtered(
+            lambda l: not float_is_zero(l.amount, precision_digits=2)
+        )
 
-            _logger.info("Processing %d lines for company: %s", len(company_lines), company.name)
+        # Post in committed batches; rows already taken by a concurrent run are skipped
+        for batch_ids in split_every(DEPRECIATION_BATCH_SIZE, postable.ids):
+            batch = self.browse(self._lock_draft_lines(batch_ids))
+
+            for company, company_lines in batch.grouped('company_id').items():
+                _logger.info("Processing %d lines for company: %s", len(company_lines), company.name)
+                company_lines = company_lines.with_company(company).with_context(auto_post=True)
 
-            for line in company_lines.with_company(company):
                 try:
-                    # Check period lock
-                    if self._is_period_locked(line):
-                        _logger.warning(
-                            "Skipping line %d - period locked for date %s",
-                            line.id, line.depreciation_date
-                        )
+                    with self.env.cr.savepoint():
+                        company_lines._post_auto_depreciation()
+                    posted_count += len(company_lines)
+                    continue
+                except Exception as e:
+                    _logger.warning(
+                        "Batch posting failed for %d lines (%s), retrying line by line",
+                        len(company_lines), e
+                    )
+
+                # Isolate the failing lines so the rest of the batch still posts
+                for line in company_lines:
+                    try:
+                        with self.env.cr.savepoint():
+                            line._post_auto_depreciation()
+                        posted_count += 1
+                    except Exception as e:
+                        failed_count += 1
+                        error_msg = str(e)
+                        failed_details.append({
+                            'line_id': line.id,
+                            'asset': line.asset_id.name,
+                            'date': str(line.depreciation_date),
+                            'error': error_msg,
+                        })
+
+                        # Store error on line
                         line.write({
-                            'auto_post_error': _('Period locked for %s') % line.depreciation_date
+                            'auto_post_error': error_msg[:500]  # Truncate if too long
                         })
-                        skipped_count += 1
-                        continue
-
-                    # Post the depreciation
-                    line.with_context(auto_post=True).action_post()
-
-                    # Mark as auto-posted
-                    line.write({
-                        'auto_posted': True,
-                        'auto_post_date': fields.Datetime.now(),
-                        'auto_post_error': False,
-                    })
-
-                    posted_count += 1
-                    _logger.info(
-                        "Posted depreciation: Asset=%s, Date=%s, Amount=%s",
-                        line.asset_id.name, line.depreciation_date, line.amount
-                    )
 
-                except Exception as e:
-                    failed_count += 1
-                    error_msg = str(e)
-                    failed_details.append({
-                        'line_id': line.id,
-                        'asset': line.asset_id.name,
-                        'date': str(line.depreciation_date),
-                        'error': error_msg,
-                    })
-
-                    # Store error on line
-                    line.write({
-                        'auto_post_error': error_msg[:500]  # Truncate if too long
-                    })
-
-                    _logger.error(
-                        "Failed to post depreciation: Asset=%s, Date=%s, Error=%s",
-                        line.asset_id.name, line.depreciation_date, error_msg
-                    )
+                        _logger.error(
+                            "Failed to post depreciation: Asset=%s, Date=%s, Error=%s",
+                            line.asset_id.name, line.depreciation_date, error_msg
+                        )
+
+            # Commit progress so a later failure or restart resumes from here
+            self.env.cr.commit()
+            _logger.info("💾 Progress: %d posted, %d failed", posted_count, failed_count)
 
         # Log summary
         _logger.info("=" * 60)
@@ -348,6 +431,69 @@ class OpsAssetDepreciation(models.Model):
         ], limit=1)
         return bool(period)
 
+    def _get_locked_period_keys(self, lines):
+        """
+        Resolve hard-locked periods for a set of depreciation lines at once.
+
+        Args:
+            lines: ops.asset.depreciation recordset
+
+        Returns:
+            set: (company_id, depreciation_date) tuples falling in a hard-locked period
+        """
+        if not lines:
+            return set()
+
+        dates = lines.mapped('depreciation_date')
+        periods = self.env['ops.fiscal.period'].search([
+            ('company_id', 'in', lines.company_id.ids),
+            ('date_from', '<=', max(dates)),
+            ('date_to', '>=', min(dates)),
+            ('lock_state', '=', 'hard_lock'),
+        ])
+
+        locked_ranges = {}
+        for period in periods:
+            locked_ranges.setdefault(period.company_id.id, []).append(
+                (period.date_from, period.date_to)
+            )
+
+        locked_keys = set()
+        for company_id, depreciation_date in {(l.company_id.id, l.depreciation_date) for l in lines}:
+            if any(date_from <= depreciation_date <= date_to
+                   for date_from, date_to in locked_ranges.get(company_id, [])):
+                locked_keys.add((company_id, depreciation_date))
+        return locked_keys
+
+    @api.model
+    def _lock_draft_lines(self, ids):
+        """
+        Row-lock the given lines that are still in draft.
+
+        Lines locked by a concurrent posting run are skipped rather than
+        waited for, so parallel runs never post the same line twice.
+
+        Returns:
+            list: IDs of the lines locked by this transaction
+        """
+        self.flush_model(['state'])
+        self.env.cr.execute("""
+            SELECT id FROM ops_asset_depreciation
+            WHERE id IN %s AND state = 'draft'
+            ORDER BY id
+            FOR UPDATE SKIP LOCKED
+        """, (tuple(ids),))
+        return [row[0] for row in self.env.cr.fetchall()]
+
+    def _post_auto_depreciation(self):
+        """Post the lines in self and flag them as auto-posted."""
+        self._create_depreciation_moves()
+        self.write({
+            'auto_posted': True,
+            'auto_post_date': fields.Datetime.now(),
+            'auto_post_error': False,
+        })
+
     def _notify_depreciation_failures(self, failed_details):
         """
         Send notification to accounting managers about failed auto-posts.
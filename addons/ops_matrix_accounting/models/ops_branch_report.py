@@ -16,6 +16,9 @@ import logging
 
 _logger = logging.getLogger(__name__)
 
+INCOME_ACCOUNT_TYPES = ('income', 'income_other')
+EXPENSE_ACCOUNT_TYPES = ('expense', 'expense_depreciation', 'expense_direct_cost')
+
 
 class OpsBranchReport(models.TransientModel):
     """Branch-Level Profit & Loss Report"""
@@ -82,25 +85,29 @@ class OpsBranchReport(models.TransientModel):
                     ('branch_ids', 'in', [wizard.branch_id.id])
                 ])
 
-            for bu in bus:
-                bu_domain = base_domain + [('ops_business_unit_id', '=', bu.id)]
-
-                # Income for this BU
-                income_result = MoveLine._read_group(
-                    domain=bu_domain + [('account_id.account_type', 'in', ['income', 'income_other'])],
-                    groupby=[],
-                    aggregates=['credit:sum', 'debit:sum']
-                )
-                bu_income = income_result[0]['credit'] - income_result[0]['debit'] if income_result else 0
-
-                # Expense for this BU
-                expense_result = MoveLine._read_group(
-                    domain=bu_domain + [('account_id.account_type', 'in', ['expense', 'expense_depreciation', 'expense_direct_cost'])],
-                    groupby=[],
-                    aggregates=['debit:sum', 'credit:sum']
-                )
-                bu_expense = expense_result[0]['debit'] - expense_result[0]['credit'] if expense_result else 0
+            # One grouped query: (BU, account type) -> debit, credit, count
+            bu_totals = {}
+            total_income = total_expense = 0.0
+            total_transactions = 0
+            for bu, account_type, debit, credit, count in MoveLine._read_group(
+                domain=base_domain,
+                groupby=['ops_business_unit_id', 'account_id.account_type'],
+                aggregates=['debit:sum', 'credit:sum', '__count'],
+            ):
+                totals = bu_totals.setdefault(bu.id, {'income': 0.0, 'expense': 0.0, 'count': 0})
+                if account_type in INCOME_ACCOUNT_TYPES:
+                    totals['income'] += credit - debit
+                    total_income += credit - debit
+                elif account_type in EXPENSE_ACCOUNT_TYPES:
+                    totals['expense'] += debit - credit
+                    total_expense += debit - credit
+                totals['count'] += count
+                total_transactions += count
 
+            for bu in bus:
+                totals = bu_totals.get(bu.id, {'income': 0.0, 'expense': 0.0, 'count': 0})
+                bu_income = totals['income']
+                bu_expense = totals['expense']
                 bu_performance[bu.id] = {
                     'bu_id': bu.id,
                     'bu_code': bu.code,
@@ -109,24 +116,9 @@ class OpsBranchReport(models.TransientModel):
                     'expense': bu_expense,
                     'net_profit': bu_income - bu_expense,
                     'margin': ((bu_income - bu_expense) / bu_income * 100) if bu_income else 0,
-                    'transaction_count': MoveLine.search_count(bu_domain),
+                    'transaction_count': totals['count'],
                 }
 
-            # Get branch totals
-            income_result = MoveLine._read_group(
-                domain=base_domain + [('account_id.account_type', 'in', ['income', 'income_other'])],
-                groupby=[],
-                aggregates=['credit:sum', 'debit:sum']
-            )
-            total_income = income_result[0]['credit'] - income_result[0]['debit'] if income_result else 0
-
-            expense_result = MoveLine._read_group(
-                domain=base_domain + [('account_id.account_type', 'in', ['expense', 'expense_depreciation', 'expense_direct_cost'])],
-                groupby=[],
-                aggregates=['debit:sum', 'credit:sum']
-            )
-            total_expense = expense_result[0]['debit'] - expense_result[0]['credit'] if expense_result else 0
-
             # Get top products/services (if sale/purchase modules installed)
             top_products = []
             if 'sale.order.line' in self.env:
@@ -158,7 +150,7 @@ class OpsBranchReport(models.TransientModel):
                     'total_expense': total_expense,
                     'net_profit': total_income - total_expense,
                     'bu_count': len(bus),
-                    'transaction_count': MoveLine.search_count(base_domain),
+                    'transaction_count': total_transactions,
                 },
                 'top_products': top_products[:5],
             }
@@ -11,11 +11,15 @@ Author: OPS Matrix Framework
 
 from odoo import models, fields, api, _
 from odoo.tools import date_utils
-from datetime import datetime, timedelta
+from datetime import datetime
+from dateutil.relativedelta import relativedelta
 import logging
 
 _logger = logging.getLogger(__name__)
 
+INCOME_ACCOUNT_TYPES = ('income', 'income_other')
+EXPENSE_ACCOUNT_TYPES = ('expense', 'expense_depreciation', 'expense_direct_cost')
+
 
 class OpsBusinessUnitReport(models.TransientModel):
     """Business Unit Profitability Report"""
@@ -94,54 +98,41 @@ class OpsBusinessUnitReport(models.TransientModel):
             if wizard.branch_ids:
                 base_domain.append(('ops_branch_id', 'in', wizard.branch_ids.ids))
 
+            # One grouped query: (branch, account type) -> debit, credit, count
+            branch_totals = {}
+            total_income = total_expense = 0.0
+            total_transactions = 0
+            for branch, account_type, debit, credit, count in MoveLine._read_group(
+                domain=base_domain,
+                groupby=['ops_branch_id', 'account_id.account_type'],
+                aggregates=['debit:sum', 'credit:sum', '__count'],
+            ):
+                totals = branch_totals.setdefault(branch.id, {'income': 0.0, 'expense': 0.0, 'count': 0})
+                if account_type in INCOME_ACCOUNT_TYPES:
+                    totals['income'] += credit - debit
+                    total_income += credit - debit
+                elif account_type in EXPENSE_ACCOUNT_TYPES:
+                    totals['expense'] += debit - credit
+                    total_expense += debit - credit
+                totals['count'] += count
+                total_transactions += count
+
             # Branch performance breakdown
             branch_performance = {}
             if wizard.consolidate_by_branch:
                 for branch in branches:
-                    branch_domain = base_domain + [('ops_branch_id', '=', branch.id)]
-
-                    # Income for this branch
-                    income_result = MoveLine._read_group(
-                        domain=branch_domain + [('account_id.account_type', 'in', ['income', 'income_other'])],
-                        groupby=[],
-                        aggregates=['credit:sum', 'debit:sum']
-                    )
-                    branch_income = income_result[0]['credit'] - income_result[0]['debit'] if income_result else 0
-
-                    # Expense for this branch
-                    expense_result = MoveLine._read_group(
-                        domain=branch_domain + [('account_id.account_type', 'in', ['expense', 'expense_depreciation', 'expense_direct_cost'])],
-                        groupby=[],
-                        aggregates=['debit:sum', 'credit:sum']
-                    )
-                    branch_expense = expense_result[0]['debit'] - expense_result[0]['credit'] if expense_result else 0
-
+                    totals = branch_totals.get(branch.id, {'income': 0.0, 'expense': 0.0, 'count': 0})
                     branch_performance[branch.id] = {
                         'branch_id': branch.id,
                         'branch_code': branch.code,
                         'branch_name': branch.name,
-                        'income': branch_income,
-                        'expense': branch_expense,
-                        'net_profit': branch_income - branch_expense,
+                        'income': totals['income'],
+                        'expense': totals['expense'],
+                        'net_profit': totals['income'] - totals['expense'],
                         'contribution_percentage': 0,  # Will calculate after totals
-                        'transaction_count': MoveLine.search_count(branch_domain),
+                        'transaction_count': totals['count'],
                     }
 
-            # Get BU totals
-            income_result = MoveLine._read_group(
-                domain=base_domain + [('account_id.account_type', 'in', ['income', 'income_other'])],
-                groupby=[],
-                aggregates=['credit:sum', 'debit:sum']
-            )
-            total_income = income_result[0]['credit'] - income_result[0]['debit'] if income_result else 0
-
-            expense_result = MoveLine._read_group(
-                domain=base_domain + [('account_id.account_type', 'in', ['expense', 'expense_depreciation', 'expense_direct_cost'])],
-                groupby=[],
-                aggregates=['debit:sum', 'credit:sum']
-            )
-            total_expense = expense_result[0]['debit'] - expense_result[0]['credit'] if expense_result else 0
-
             total_net = total_income - total_expense
 
             # Calculate contribution percentages
@@ -171,53 +162,51 @@ class OpsBusinessUnitReport(models.TransientModel):
                     'profit_margin': (total_net / total_income * 100) if total_income else 0,
                     'branch_count': len(branches),
                     'active_branches': len([b for b in branch_performance.values() if b['transaction_count'] > 0]),
-                    'total_transactions': MoveLine.search_count(base_domain),
+                    'total_transactions': total_transactions,
                 },
                 'trend_data': wizard._get_trend_data(),
             }
 
     def _get_trend_data(self):
-        """Get monthly trend data for the past 6 months."""
-        MoveLine = self.env['account.move.line']
-        trend_data = []
+        """Get monthly trend data for the past 6 months.
 
-        for i in range(6, -1, -1):  # Last 6 months plus current
-            month_start = date_utils.start_of(datetime.now() - timedelta(days=30*i), 'month')
-            month_end = date_utils.end_of(month_start, 'month')
-
-            domain = [
-                ('date', '>=', month_start),
-                ('date', '<=', month_end),
-                ('ops_business_unit_id', '=', self.business_unit_id.id),
-                ('move_id.state', '=', 'posted'),
-            ]
-
-            if self.branch_ids:
-                domain.append(('ops_branch_id', 'in', self.branch_ids.ids))
-
-            income_result = MoveLine._read_group(
-                domain=domain + [('account_id.account_type', 'in', ['income', 'income_other'])],
-                groupby=[],
-                aggregates=['credit:sum', 'debit:sum']
-            )
-            month_income = income_result[0]['credit'] - income_result[0]['debit'] if income_result else 0
-
-            expense_result = MoveLine._read_group(
-                domain=domain + [('account_id.account_type', 'in', ['expense', 'expense_depreciation', 'expense_direct_cost'])],
-                groupby=[],
-                aggregates=['debit:sum', 'credit:sum']
-            )
-            month_expense = expense_result[0]['debit'] - expense_result[0]['credit'] if expense_result else 0
-
-            trend_data.append({
-                'month': month_start.strftime('%b %Y'),
-                'income': month_income,
-                'expense': month_expense,
-                'net_profit': month_income - month_expense,
-                'transaction_count': MoveLine.search_count(domain),
-            })
-
-        return trend_data
+        All seven months come out of a single ``_read_group`` bucketed by
+        ``date:month`` (``date_trunc('month', date)``) and account type.
+        """
+        MoveLine = self.env['account.move.line']
+        current_month = date_utils.start_of(fields.Date.context_today(self), 'month')
+        months = [current_month - relativedelta(months=i) for i in range(6, -1, -1)]  # Last 6 months plus current
+
+        domain = [
+            ('date', '>=', months[0]),
+            ('date', '<=', date_utils.end_of(current_month, 'month')),
+            ('ops_business_unit_id', '=', self.business_unit_id.id),
+            ('move_id.state', '=', 'posted'),
+        ]
+
+        if self.branch_ids:
+            domain.append(('ops_branch_id', 'in', self.branch_ids.ids))
+
+        month_totals = {month: {'income': 0.0, 'expense': 0.0, 'count': 0} for month in months}
+        for month, account_type, debit, credit, count in MoveLine._read_group(
+            domain=domain,
+            groupby=['date:month', 'account_id.account_type'],
+            aggregates=['debit:sum', 'credit:sum', '__count'],
+        ):
+            totals = month_totals[month]
+            if account_type in INCOME_ACCOUNT_TYPES:
+                totals['income'] += credit - debit
+            elif account_type in EXPENSE_ACCOUNT_TYPES:
+                totals['expense'] += debit - credit
+            totals['count'] += count
+
+        return [{
+            'month': month.strftime('%b %Y'),
+            'income': totals['income'],
+            'expense': totals['expense'],
+            'net_profit': totals['income'] - totals['expense'],
+            'transaction_count': totals['count'],
+        } for month, totals in month_totals.items()]
 
     def action_generate_pdf(self):
         """Generate PDF report for business unit."""
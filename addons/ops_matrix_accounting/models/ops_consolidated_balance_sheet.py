@@ -10,6 +10,7 @@ Author: OPS Matrix Framework
 """
 
 from odoo import models, fields, api, _
+from odoo.tools import float_is_zero
 import logging
 
 _logger = logging.getLogger(__name__)
@@ -64,43 +65,39 @@ class OpsConsolidatedBalanceSheet(models.TransientModel):
 
             MoveLine = self.env['account.move.line']
 
-            # Get balance sheet data for each company
-            company_data = []
-            total_assets = total_liabilities = total_equity = 0
-
-            for company in wizard.company_ids:
-                domain = [
+            # Balance sheet figures for every company from one grouped query
+            result = MoveLine._read_group(
+                domain=[
                     ('date', '<=', wizard.date),
-                    ('company_id', '=', company.id),
+                    ('company_id', 'in', wizard.company_ids.ids),
                     ('move_id.state', '=', 'posted'),
                     ('account_id.include_initial_balance', '=', True),
-                ]
+                ],
+                groupby=['company_id', 'account_id.account_type'],
+                aggregates=['balance:sum'],
+            )
+            type_balances = {}
+            for company, account_type, balance in result:
+                type_balances.setdefault(company.id, []).append((account_type, balance))
 
-                # Group by account type
-                result = MoveLine._read_group(
-                    domain=domain,
-                    groupby=['account_id'],
-                    aggregates=['balance:sum']
-                )
+            company_data = []
+            total_assets = total_liabilities = total_equity = 0
 
+            for company in wizard.company_ids:
                 # Initialize totals
                 assets = liabilities = equity = income = expense = 0
 
-                for group in result:
-                    if group.get('account_id'):
-                        account = self.env['account.account'].browse(group['account_id'][0])
-                        balance = group.get('balance', 0)
-
-                        if account.account_type and account.account_type.startswith('asset'):
-                            assets += balance
-                        elif account.account_type and account.account_type.startswith('liability'):
-                            liabilities += balance
-                        elif account.account_type == 'equity':
-                            equity += balance
-                        elif account.account_type in ['income', 'income_other']:
-                            income += balance
-                        elif account.account_type in ['expense', 'expense_depreciation', 'expense_direct_cost']:
-                            expense += balance
+                for account_type, balance in type_balances.get(company.id, []):
+                    if account_type and account_type.startswith('asset'):
+                        assets += balance
+                    elif account_type and account_type.startswith('liability'):
+                        liabilities += balance
+                    elif account_type == 'equity':
+                        equity += balance
+                    elif account_type in ['income', 'income_other']:
+                        income += balance
+                    elif account_type in ['expense', 'expense_depreciation', 'expense_direct_cost']:
+                        expense += balance
 
                 # Calculate net income/loss for period
                 net_income = income + expense  # Expense is negative in accounting
@@ -122,7 +119,7 @@ class OpsConsolidatedBalanceSheet(models.TransientModel):
                 total_equity += equity + net_income
 
             # Apply intercompany eliminations if requested
-            eliminations = {'asset_eliminations': 0, 'liability_eliminations': 0}
+            eliminations = {'asset_eliminations': 0, 'liability_eliminations': 0, 'pairs': [], 'mismatch_count': 0}
             if wizard.include_intercompany and len(wizard.company_ids) > 1:
                 eliminations = wizard._calculate_intercompany_eliminations(wizard.company_ids.ids, wizard.date)
                 total_assets -= eliminations.get('asset_eliminations', 0)
@@ -143,48 +140,88 @@ class OpsConsolidatedBalanceSheet(models.TransientModel):
             }
 
     def _calculate_intercompany_eliminations(self, company_ids, date):
-        """Calculate intercompany eliminations for consolidation."""
+        """
+        Calculate intercompany eliminations for consolidation.
+
+        Intercompany balances are the balance-sheet move lines of a group
+        company whose partner belongs to another group company. They are
+        summed in one grouped query keyed by (company, partner, account
+        type), the partner being mapped to its counterparty company.
+        Reciprocal positions are compared in the same pass: company A's net
+        position on B must offset B's net position on A, otherwise the
+        pair is flagged as mismatched.
+
+        Args:
+            company_ids: ids of the consolidated companies
+            date: balance sheet date
+
+        Returns:
+            dict: asset/liability elimination totals, per-pair details and
+            the number of mismatched pairs
+        """
         MoveLine = self.env['account.move.line']
+        companies = self.env['res.company'].browse(company_ids)
+        partner_company = {company.partner_id.id: company.id for company in companies}
 
-        # Find intercompany accounts (accounts marked as intercompany)
-        intercompany_accounts = self.env['account.account'].search([
-            ('company_id', 'in', company_ids),
-            ('reconcile', '=', True),  # Use reconcile flag as proxy for intercompany
-        ])
-
-        asset_eliminations = 0
-        liability_eliminations = 0
-
-        for account in intercompany_accounts:
-            if 'intercompany' not in account.name.lower():
-                continue
-
-            domain = [
+        result = MoveLine._read_group(
+            domain=[
                 ('date', '<=', date),
-                ('account_id', '=', account.id),
                 ('company_id', 'in', company_ids),
                 ('move_id.state', '=', 'posted'),
-            ]
-
-            result = MoveLine._read_group(
-                domain=domain,
-                groupby=['company_id'],
-                aggregates=['balance:sum']
-            )
-
-            # Sum balances across companies
-            total_balance = sum(item.get('balance', 0) for item in result)
+                ('account_id.include_initial_balance', '=', True),
+                ('partner_id', 'child_of', list(partner_company)),
+            ],
+            groupby=['company_id', 'partner_id', 'account_id.account_type'],
+            aggregates=['balance:sum'],
+        )
+
+        # {(company_id, counterparty_id): {'asset': x, 'liability': y}}
+        positions = {}
+        for company, partner, account_type, balance in result:
+            counterparty_id = partner_company.get(partner.commercial_partner_id.id)
+            if not counterparty_id or counterparty_id == company.id or not account_type:
+                continue
+            if account_type.startswith('asset'):
+                side = 'asset'
+            elif account_type.startswith('liability'):
+                side = 'liability'
+            else:
+                continue
+            position = positions.setdefault((company.id, counterparty_id), {'asset': 0.0, 'liability': 0.0})
+            position[side] += balance
 
-            # If total balance across companies is not zero, there's an elimination
-            if abs(total_balance) > 0.01:  # Tolerance for floating point
-                if account.account_type and account.account_type.startswith('asset'):
-                    asset_eliminations += total_balance
-                elif account.account_type and account.account_type.startswith('liability'):
-                    liability_eliminations += total_balance
+        rounding = self.currency_id.rounding or 0.01
+        company_names = dict(zip(companies.ids, companies.mapped('name')))
+        asset_eliminations = 0
+        liability_eliminations = 0
+        pairs = []
+        for (company_id, counterparty_id), position in positions.items():
+            asset_eliminations += position['asset']
+            liability_eliminations += position['liability']
+
+            # Each unordered pair is reported once, from its lower company id
+            reciprocal = positions.get((counterparty_id, company_id), {'asset': 0.0, 'liability': 0.0})
+            if (counterparty_id, company_id) in positions and counterparty_id < company_id:
+                continue
+            net = position['asset'] + position['liability']
+            reciprocal_net = reciprocal['asset'] + reciprocal['liability']
+            difference = net + reciprocal_net
+            pairs.append({
+                'company_id': company_id,
+                'company_name': company_names.get(company_id),
+                'counterparty_id': counterparty_id,
+                'counterparty_name': company_names.get(counterparty_id),
+                'net_position': net,
+                'reciprocal_net_position': reciprocal_net,
+                'difference': difference,
+                'mismatch': not float_is_zero(difference, precision_rounding=rounding),
+            })
 
         return {
             'asset_eliminations': asset_eliminations,
             'liability_eliminations': liability_eliminations,
+            'pairs': pairs,
+            'mismatch_count': len([pair for pair in pairs if pair['mismatch']]),
         }
 
     def action_generate_pdf(self):
@@ -9,12 +9,17 @@ Adopted from OM om_account_followup, enhanced with:
 
 from odoo import models, fields, api, _, Command
 from odoo.exceptions import UserError, ValidationError
-from odoo.tools import SQL
+from odoo.tools import SQL, split_every
+from bisect import bisect_right
+from collections import defaultdict
 from datetime import date, timedelta
 import logging
 
 _logger = logging.getLogger(__name__)
 
+# Number of (partner, company) pairs handled per cron transaction
+FOLLOWUP_BATCH_SIZE = 1000
+
 
 class OpsFollowup(models.Model):
     """Follow-up configuration for a company."""
@@ -275,40 +280,71 @@ class OpsPartnerFollowup(models.Model):
                  'partner_id.invoice_ids.invoice_date_due', 'partner_id.invoice_ids.state',
                  'partner_id.invoice_ids.payment_state')
     def _compute_overdue(self):
-        """Compute overdue amount and days."""
-        today = fields.Date.today()
+        """Compute overdue amount and days for the whole recordset at once."""
+        summary = self._get_overdue_summary(self.partner_id.ids, self.company_id.ids)
 
         for record in self:
-            # Get overdue invoices
-            invoices = self.env['account.move'].search([
-                ('partner_id', '=', record.partner_id.id),
-                ('company_id', '=', record.company_id.id),
-                ('move_type', '=', 'out_invoice'),
-                ('state', '=', 'posted'),
-                ('payment_state', 'in', ['not_paid', 'partial']),
-                ('invoice_date_due', '<', today),
-            ])
+            data = summary.get((record.partner_id.id, record.company_id.id), {})
+            record.total_overdue_amount = data.get('total_overdue_amount', 0.0)
+            record.overdue_invoice_count = data.get('overdue_invoice_count', 0)
+            record.max_overdue_days = data.get('max_overdue_days', 0)
+            record.total_balance = data.get('total_balance', 0.0)
 
-            # Get total balance (all unpaid invoices)
-            all_invoices = self.env['account.move'].search([
-                ('partner_id', '=', record.partner_id.id),
-                ('company_id', '=', record.company_id.id),
-                ('move_type', '=', 'out_invoice'),
-                ('state', '=', 'posted'),
-                ('payment_state', 'in', ['not_paid', 'partial']),
-            ])
+    @api.model
+    def _get_overdue_summary(self, partner_ids, company_ids, today=None):
+        """
+        Aggregate unpaid customer invoices per (partner, company).
+
+        Runs two grouped queries regardless of the number of partners,
+        one for the open balance and one for the overdue subset.
+
+        Args:
+            partner_ids: list of res.partner IDs
+            company_ids: list of res.company IDs
+            today: reference date for overdue computation (default: today)
+
+        Returns:
+            dict: {(partner_id, company_id): {total_balance, total_overdue_amount,
+                   overdue_invoice_count, max_overdue_days}}
+        """
+        if not partner_ids or not company_ids:
+            return {}
+
+        today = today or fields.Date.today()
+        Move = self.env['account.move']
+        domain = [
+            ('partner_id', 'in', list(partner_ids)),
+            ('company_id', 'in', list(company_ids)),
+            ('move_type', '=', 'out_invoice'),
+            ('state', '=', 'posted'),
+            ('payment_state', 'in', ['not_paid', 'partial']),
+        ]
 
-            if invoices:
-                record.total_overdue_amount = sum(invoices.mapped('amount_residual'))
-                record.overdue_invoice_count = len(invoices)
-                oldest_due = min(invoices.mapped('invoice_date_due'))
-                record.max_overdue_days = (today - oldest_due).days
-            else:
-                record.total_overdue_amount = 0.0
-                record.overdue_invoice_count = 0
-                record.max_overdue_days = 0
+        summary = defaultdict(lambda: {
+            'total_balance': 0.0,
+            'total_overdue_amount': 0.0,
+            'overdue_invoice_count': 0,
+            'max_overdue_days': 0,
+        })
 
-            record.total_balance = sum(all_invoices.mapped('amount_residual'))
+        for partner, company, residual in Move._read_group(
+            domain=domain,
+            groupby=['partner_id', 'company_id'],
+            aggregates=['amount_residual:sum'],
+        ):
+            summary[(partner.id, company.id)]['total_balance'] = residual or 0.0
+
+        for partner, company, residual, count, oldest_due in Move._read_group(
+            domain=domain + [('invoice_date_due', '<', today)],
+            groupby=['partner_id', 'company_id'],
+            aggregates=['amount_residual:sum', '__count', 'invoice_date_due:min'],
+        ):
+            data = summary[(partner.id, company.id)]
+            data['total_overdue_amount'] = residual or 0.0
+            data['overdue_invoice_count'] = count or 0
+            data['max_overdue_days'] = (today - oldest_due).days if oldest_due else 0
+
+        return dict(summary)
 
     @api.depends('last_followup_date', 'followup_level_id', 'followup_level_id.followup_id.followup_line_ids')
     def _compute_next_followup(self):
@@ -337,79 +373,100 @@ class OpsPartnerFollowup(models.Model):
         if not self.followup_level_id:
             raise UserError(_('No follow-up level set.'))
 
-        level = self.followup_level_id
+        return self._execute_followup_actions()
 
-        # Create history record
-        history_vals = {
-            'partner_followup_id': self.id,
-            'followup_level_id': level.id,
-            'date': fields.Date.today(),
-            'user_id': self.env.uid,
-            'action_taken': [],
-        }
-        actions = []
-
-        # Send email
-        if level.send_email and level.email_template_id:
-            try:
-                level.email_template_id.send_mail(self.partner_id.id)
-                actions.append('Email sent')
-                _logger.info(f"Sent follow-up email to {self.partner_id.name}")
-            except Exception as e:
-                _logger.error(f"Failed to send follow-up email: {e}")
-                actions.append(f'Email failed: {e}')
-
-        # Create activity
-        if level.create_activity and level.activity_type_id:
-            user = level.activity_user_id or self.partner_id.user_id or self.env.user
-            try:
-                self.partner_id.activity_schedule(
-                    activity_type_id=level.activity_type_id.id,
-                    summary=f'Follow-up Level {level.sequence}: {level.name}',
-                    note=level.manual_action_note or '',
-                    user_id=user.id,
-                    date_deadline=fields.Date.today() + timedelta(days=level.activity_days),
-                )
-                actions.append('Activity created')
-            except Exception as e:
-                _logger.error(f"Failed to create activity: {e}")
-                actions.append(f'Activity failed: {e}')
+    def _execute_followup_actions(self):
+        """
+        Execute the current level's actions for every record in self.
 
-        # Apply credit block
-        if level.block_credit and not self.credit_override:
-            self.write({
-                'credit_blocked': True,
-                'credit_block_reason': f'Auto-blocked at follow-up level {level.sequence}: {level.name}',
-                'state': 'blocked',
-            })
-            actions.append('Credit blocked')
+        Records are grouped per follow-up level so each email template is
+        rendered once per group and the mails are queued rather than sent
+        inline. History, status updates and chatter notes are written in
+        bulk.
+        """
+        today = fields.Date.today()
+        history_vals_list = []
+        chatter_bodies = {}
 
-        # Update history
-        history_vals['action_taken'] = ', '.join(actions) if actions else 'No action'
-        self.env['ops.partner.followup.history'].create(history_vals)
+        for level, records in self.grouped('followup_level_id').items():
+            if not level:
+                continue
 
-        # Update status
-        self.write({
-            'last_followup_date': fields.Date.today(),
-            'last_followup_level_id': level.id,
-            'state': 'active' if not self.credit_blocked else self.state,
-        })
+            actions = []
+
+            # Queue emails
+            if level.send_email and level.email_template_id:
+                try:
+                    level.email_template_id.send_mail_batch(records.partner_id.ids)
+                    actions.append('Email sent')
+                    _logger.info(f"Queued follow-up emails ({level.name}) for {len(records.partner_id)} partners")
+                except Exception as e:
+                    _logger.error(f"Failed to queue follow-up emails: {e}")
+                    actions.append(f'Email failed: {e}')
+
+            # Create activities, one batch per assignee
+            if level.create_activity and level.activity_type_id:
+                by_user = defaultdict(lambda: self.env['res.partner'])
+                for record in records:
+                    user = level.activity_user_id or record.partner_id.user_id or self.env.user
+                    by_user[user] |= record.partner_id
+                try:
+                    for user, partners in by_user.items():
+                        partners.activity_schedule(
+                            activity_type_id=level.activity_type_id.id,
+                            summary=f'Follow-up Level {level.sequence}: {level.name}',
+                            note=level.manual_action_note or '',
+                            user_id=user.id,
+                            date_deadline=today + timedelta(days=level.activity_days),
+                        )
+                    actions.append('Activity created')
+                except Exception as e:
+                    _logger.error(f"Failed to create activity: {e}")
+                    actions.append(f'Activity failed: {e}')
+
+            # Apply credit block
+            blocked = self.browse()
+            if level.block_credit:
+                blocked = records.filtered(lambda r: not r.credit_override)
+                blocked.write({
+                    'credit_blocked': True,
+                    'credit_block_reason': f'Auto-blocked at follow-up level {level.sequence}: {level.name}',
+                    'state': 'blocked',
+                })
 
-        # Advance to next level
-        next_level = self.env['ops.followup.line'].search([
-            ('followup_id', '=', level.followup_id.id),
-            ('sequence', '>', level.sequence),
-        ], limit=1, order='sequence asc')
+            # Update status
+            unblocked = records.filtered(lambda r: not r.credit_blocked)
+            unblocked.write({'state': 'active'})
+            records.write({
+                'last_followup_date': today,
+                'last_followup_level_id': level.id,
+            })
 
-        if next_level:
-            self.followup_level_id = next_level.id
+            # Advance to next level
+            next_level = level.followup_id.followup_line_ids.filtered(
+                lambda l: l.sequence > level.sequence
+            ).sorted('sequence')[:1]
+            if next_level:
+                records.write({'followup_level_id': next_level.id})
+
+            for record in records:
+                record_actions = actions + (['Credit blocked'] if record in blocked else [])
+                history_vals_list.append({
+                    'partner_followup_id': record.id,
+                    'followup_level_id': level.id,
+                    'date': today,
+                    'user_id': self.env.uid,
+                    'action_taken': ', '.join(record_actions) if record_actions else 'No action',
+                })
+                chatter_bodies[record.id] = _(
+                    'Follow-up Level %(level)s sent. Actions: %(actions)s',
+                    level=level.name,
+                    actions=', '.join(record_actions) if record_actions else 'None'
+                )
 
-        # Post message
-        self.message_post(body=_(
-            'Follow-up Level %(level)s sent. Actions: %(actions)s',
-            level=level.name,
-            actions=', '.join(actions) if actions else 'None'
-        ))
+        self.env['ops.partner.followup.history'].create(history_vals_list)
+        if chatter_bodies:
+            self._message_log_batch(bodies=chatter_bodies)
 
         return True
 
@@ -507,65 +564,45 @@ class OpsPartnerFollowup(models.Model):
 
     @api.model
     def cron_process_followups(self):
-        """Scheduled action to process all follow-ups."""
+        """
+        Scheduled action to process all follow-ups.
+
+        Overdue exposure for every customer is read with one grouped query,
+        levels are resolved against an in-memory sorted list of delays per
+        company, and partners are processed in chunks that are committed
+        independently.
+        """
         today = fields.Date.today()
         _logger.info("Starting follow-up processing cron job")
 
-        # Find all partners with overdue invoices
-        overdue_invoices = self.env['account.move'].search([
-            ('move_type', '=', 'out_invoice'),
-            ('state', '=', 'posted'),
-            ('payment_state', 'in', ['not_paid', 'partial']),
-            ('invoice_date_due', '<', today),
-        ])
-
-        partner_ids = overdue_invoices.mapped('partner_id').ids
-
-        for partner_id in partner_ids:
-            partner = self.env['res.partner'].browse(partner_id)
-
-            # Get or create follow-up record
-            followup_status = self.search([
-                ('partner_id', '=', partner_id),
-                ('company_id', '=', self.env.company.id),
-            ], limit=1)
-
-            if not followup_status:
-                # Create new follow-up record
-                followup_config = self.env['ops.followup'].get_or_create_followup()
-                first_level = self.env['ops.followup.line'].search([
-                    ('followup_id', '=', followup_config.id),
-                ], limit=1, order='sequence asc')
+        # Oldest due date per (partner, company) in a single grouped query
+        overdue_groups = self.env['account.move']._read_group(
+            domain=[
+                ('move_type', '=', 'out_invoice'),
+                ('state', '=', 'posted'),
+                ('payment_state', 'in', ['not_paid', 'partial']),
+                ('invoice_date_due', '<', today),
+            ],
+            groupby=['partner_id', 'company_id'],
+            aggregates=['invoice_date_due:min'],
+        )
+        overdue_days = {
+            (partner.id, company.id): (today - oldest_due).days
+            for partner, company, oldest_due in overdue_groups
+            if partner and oldest_due
+        }
 
-                followup_status = self.create({
-                    'partner_id': partner_id,
-                    'company_id': self.env.company.id,
-                    'followup_level_id': first_level.id if first_level else False,
-                    'state': 'draft',
-                })
+        # Follow-up levels per company, sorted by delay
+        level_index = {}
+        for company_id in {company_id for _partner_id, company_id in overdue_days}:
+            config = self.env['ops.followup'].get_or_create_followup(company_id)
+            levels = config.followup_line_ids.sorted('delay')
+            level_index[company_id] = (config, levels, levels.mapped('delay'))
 
-            # Determine appropriate follow-up level based on overdue days
-            if followup_status.max_overdue_days > 0:
-                followup_config = self.env['ops.followup'].get_or_create_followup()
-
-                # Find appropriate level based on days overdue
-                appropriate_level = self.env['ops.followup.line'].search([
-                    ('followup_id', '=', followup_config.id),
-                    ('delay', '<=', followup_status.max_overdue_days),
-                ], limit=1, order='delay desc')
-
-                if appropriate_level and appropriate_level != followup_status.followup_level_id:
-                    followup_status.followup_level_id = appropriate_level.id
-
-                # Check if auto-send is enabled and we should send
-                if followup_config.auto_send_email and followup_status.followup_level_id:
-                    # Only send if we haven't sent recently for this level
-                    if (not followup_status.last_followup_date or
-                        followup_status.last_followup_level_id != followup_status.followup_level_id):
-                        try:
-                            followup_status.action_send_followup()
-                        except Exception as e:
-                            _logger.error(f"Error processing follow-up for {partner.name}: {e}")
+        keys = sorted(overdue_days)
+        for chunk in split_every(FOLLOWUP_BATCH_SIZE, keys):
+            self._process_followup_chunk(chunk, overdue_days, level_index)
+            self.env.cr.commit()
 
         # Check for expired credit overrides
         expired_overrides = self.search([
@@ -577,10 +614,82 @@ class OpsPartnerFollowup(models.Model):
             record.action_revoke_credit_override()
             _logger.info(f"Credit override expired for {record.partner_id.name}")
 
-        _logger.info(f"Follow-up processing complete. Processed {len(partner_ids)} partners.")
+        _logger.info(f"Follow-up processing complete. Processed {len(keys)} partners.")
 
         return True
 
+    @api.model
+    def _process_followup_chunk(self, keys, overdue_days, level_index):
+        """
+        Resolve levels and run follow-up actions for a chunk of partners.
+
+        Args:
+            keys: iterable of (partner_id, company_id) tuples
+            overdue_days: dict mapping (partner_id, company_id) to max days overdue
+            level_index: dict mapping company_id to (config, levels, sorted delays)
+        """
+        keys = list(keys)
+        existing = self.search([
+            ('partner_id', 'in', list({partner_id for partner_id, _company_id in keys})),
+            ('company_id', 'in', list({company_id for _partner_id, company_id in keys})),
+        ])
+        status_by_key = {(rec.partner_id.id, rec.company_id.id): rec for rec in existing}
+
+        # Create missing follow-up records in one call
+        vals_list = []
+        for partner_id, company_id in keys:
+            if (partner_id, company_id) not in status_by_key:
+                levels = level_index[company_id][1]
+                vals_list.append({
+                    'partner_id': partner_id,
+                    'company_id': company_id,
+                    'followup_level_id': levels[:1].id or False,
+                    'state': 'draft',
+                })
+        for rec in self.create(vals_list):
+            status_by_key[(rec.partner_id.id, rec.company_id.id)] = rec
+
+        # Resolve appropriate level from the sorted delays
+        to_update = defaultdict(lambda: self.browse())
+        to_send = self.browse()
+        for key in keys:
+            status = status_by_key[key]
+            config, levels, delays = level_index[key[1]]
+            position = bisect_right(delays, overdue_days[key]) - 1
+            level = status.followup_level_id
+            if position >= 0 and levels[position] != level:
+                level = levels[position]
+                to_update[level] |= status
+
+            # Only send if we haven't sent for this level yet
+            if config.auto_send_email and level and (
+                not status.last_followup_date or status.last_followup_level_id != level
+            ):
+                to_send |= status
+
+        for level, records in to_update.items():
+            records.write({'followup_level_id': level.id})
+
+        if not to_send:
+            return
+        try:
+            with self.env.cr.savepoint():
+                to_send._execute_followup_actions()
+        except Exception as e:
+            _logger.warning(
+                "Follow-up batch of %d partners failed (%s), retrying one by one",
+                len(to_send), e
+            )
+
+            # Isolate the failing partners so the rest of the chunk is followed up
+            for status in to_send:
+                try:
+                    with self.env.cr.savepoint():
+                        status._execute_followup_actions()
+                except Exception as e:
+                    _logger.error("Error processing follow-up for %s: %s",
+                                  status.partner_id.display_name, e)
+
 
 class OpsPartnerFollowupHistory(models.Model):
     """Follow-up action history."""
@@ -0,0 +1,296 @@
+# -*- coding: utf-8 -*-
+"""
+OPS Matrix Accounting - Journal Daily Balances
+===============================================
+
+Carry-forward table of posted movements per (journal, account, branch,
+day). Maintained incrementally when entries are posted or reset to draft so
+that the opening balance of the cash and bank books is a single indexed
+lookup instead of a scan of the journal's whole history.
+
+Author: OPS Matrix Framework
+"""
+
+from odoo import models, fields, api, _
+from odoo.tools import SQL
+from odoo.tools.sql import create_unique_index
+import logging
+
+_logger = logging.getLogger(__name__)
+
+# Expressions of the unique (journal, account, branch, day) key; lines
+# without a branch are stored under branch 0 so that they upsert like any
+# other key
+DAILY_BALANCE_KEY = ('journal_id', 'account_id', 'COALESCE(ops_branch_id, 0)', 'date')
+
+
+class OpsJournalDailyBalance(models.Model):
+    """
+    Posted debit/credit totals per journal, account, branch and day.
+
+    Rows only ever hold posted movements. The account is part of the key
+    because a balanced entry nets to zero over its journal: a book's
+    opening balance is the sum of the rows of the journal's default (cash
+    or bank) account dated before the report start. The running balance of
+    the period itself is computed by a window function over the journal
+    items.
+    """
+    _name = 'ops.journal.daily.balance'
+    _description = 'Journal Daily Balance'
+    _order = 'date desc, journal_id'
+    _rec_name = 'date'
+
+    journal_id = fields.Many2one(
+        'account.journal',
+        required=True,
+        index=True,
+        ondelete='cascade'
+    )
+    account_id = fields.Many2one(
+        'account.account',
+        required=True,
+        index=True,
+        ondelete='cascade'
+    )
+    company_id = fields.Many2one(
+        'res.company',
+        required=True,
+        index=True,
+        ondelete='cascade'
+    )
+    # A branch with carried balances cannot be deleted: its journal items
+    # would keep the money while the table silently dropped it
+    ops_branch_id = fields.Many2one(
+        'ops.branch',
+        string='Branch',
+        index=True,
+        ondelete='restrict'
+    )
+    date = fields.Date(required=True, index=True)
+    currency_id = fields.Many2one(related='company_id.currency_id')
+    debit = fields.Monetary(currency_field='currency_id')
+    credit = fields.Monetary(currency_field='currency_id')
+    balance = fields.Monetary(
+        currency_field='currency_id',
+        help='Net posted movement of the day (debit - credit)'
+    )
+
+    def init(self):
+        super().init()
+        create_unique_index(
+            self.env.cr, 'ops_journal_daily_balance_key_uniq',
+            self._table, list(DAILY_BALANCE_KEY),
+        )
+        # First install (or a table emptied by hand): seed from the ledger
+        self.env.cr.execute(SQL("SELECT 1 FROM %s LIMIT 1", SQL.identifier(self._table)))
+        if not self.env.cr.fetchone():
+            self.rebuild_daily_balances()
+
+    # ========================================================================
+    # MAINTENANCE
+    # ========================================================================
+
+    def _apply_move_deltas(self, moves, sign):
+        """
+        Add (sign=1) or remove (sign=-1) the lines of moves from the table.
+
+        Concurrent postings on the same (journal, branch, day) serialize on
+        the row lock of the upsert, so no total is ever lost.
+
+        Args:
+            moves: account.move recordset
+            sign: 1 when the moves get posted, -1 when they leave posted state
+        """
+        if not moves:
+            return
+        self.env['account.move.line'].flush_model(
+            ['move_id', 'journal_id', 'account_id', 'company_id', 'ops_branch_id', 'date',
+             'debit', 'credit', 'balance']
+        )
+        self.flush_model()
+        self.env.cr.execute(SQL(
+            """
+            INSERT INTO ops_journal_daily_balance
+                (journal_id, account_id, company_id, ops_branch_id, date, debit, credit, balance,
+                 create_uid, create_date, write_uid, write_date)
+            SELECT journal_id, account_id, company_id, ops_branch_id, date,
+                   %(sign)s * SUM(debit), %(sign)s * SUM(credit), %(sign)s * SUM(balance),
+                   %(uid)s, NOW() AT TIME ZONE 'UTC', %(uid)s, NOW() AT TIME ZONE 'UTC'
+              FROM account_move_line
+             WHERE move_id IN %(move_ids)s
+             GROUP BY journal_id, account_id, company_id, ops_branch_id, date
+            ON CONFLICT (%(key)s) DO UPDATE SET
+                debit = ops_journal_daily_balance.debit + EXCLUDED.debit,
+                credit = ops_journal_daily_balance.credit + EXCLUDED.credit,
+                balance = ops_journal_daily_balance.balance + EXCLUDED.balance,
+                write_uid = EXCLUDED.write_uid,
+                write_date = EXCLUDED.write_date
+            """,
+            sign=sign,
+            uid=self.env.uid,
+            move_ids=tuple(moves.ids),
+            key=SQL(', '.join(DAILY_BALANCE_KEY)),
+        ))
+        self.invalidate_model()
+
+    @api.model
+    def rebuild_daily_balances(self, company=None):
+        """
+        Recompute the table from the posted journal items.
+
+        Args:
+            company: Optional res.company to limit the rebuild to
+
+        Returns:
+            int: Number of (journal, account, branch, day) rows written
+        """
+        self.env['account.move.line'].flush_model()
+        company_filter = SQL("AND company_id = %s", company.id) if company else SQL()
+        self.env.cr.execute(SQL(
+            "DELETE FROM ops_journal_daily_balance WHERE TRUE %s", company_filter,
+        ))
+        self.env.cr.execute(SQL(
+            """
+            INSERT INTO ops_journal_daily_balance
+                (journal_id, account_id, company_id, ops_branch_id, date, debit, credit, balance,
+                 create_uid, create_date, write_uid, write_date)
+            SELECT journal_id, account_id, company_id, ops_branch_id, date,
+                   SUM(debit), SUM(credit), SUM(balance),
+                   %(uid)s, NOW() AT TIME ZONE 'UTC', %(uid)s, NOW() AT TIME ZONE 'UTC'
+              FROM account_move_line
+             WHERE parent_state = 'posted' %(company_filter)s
+             GROUP BY journal_id, account_id, company_id, ops_branch_id, date
+            """,
+            uid=self.env.uid,
+            company_filter=company_filter,
+        ))
+        count = self.env.cr.rowcount
+        self.invalidate_model()
+        _logger.info("Rebuilt %s journal daily balance row(s)", count)
+        return count
+
+    def action_rebuild_daily_balances(self):
+        """Button/server action: resync the current company's balances."""
+        count = self.rebuild_daily_balances(self.env.company)
+        return {
+            'type': 'ir.actions.client',
+            'tag': 'display_notification',
+            'params': {
+                'title': _('Daily Balances Rebuilt'),
+                'message': _('%s journal daily balance row(s) recomputed.', count),
+                'type': 'success',
+            },
+        }
+
+    # ========================================================================
+    # REPORTING
+    # ========================================================================
+
+    @api.model
+    def get_opening_balances(self, journals, date_from, branches=None):
+        """
+        Posted balance of each journal's default account before date_from.
+
+        Args:
+            journals: account.journal recordset
+            date_from: First day of the report; rows before it are summed
+            branches: Optional ops.branch recordset to restrict to
+
+        Returns:
+            dict: {journal_id: opening balance}
+        """
+        domain = [
+            ('journal_id', 'in', journals.ids),
+            ('account_id', 'in', journals.default_account_id.ids),
+            ('date', '<', date_from),
+        ]
+        if branches:
+            domain.append(('ops_branch_id', 'in', branches.ids))
+
+        return {
+            journal.id: balance
+            for journal, account, balance in self._read_group(
+                domain, ['journal_id', 'account_id'], ['balance:sum'],
+            )
+            if account == journal.default_account_id
+        }
+
+    @api.model
+    def get_running_lines(self, domain, order='date asc, id asc', opening_balances=None,
+                          per_journal=False):
+        """
+        Journal items of a book with their running balance.
+
+        The running balance is a SUM() window evaluated by PostgreSQL in the
+        listing order. Rows are streamed through a server-side cursor and
+        yielded one by one; account and branch labels are read once per
+        distinct record.
+
+        Args:
+            domain: account.move.line domain of the period
+            order: Listing order, also the order of the running sum
+            opening_balances: {journal_id: opening balance} from
+                get_opening_balances()
+            per_journal: Restart the running balance for every journal
+                instead of running over all journals together
+
+        Yields:
+            dict: Line dicts in listing order, as used by the book templates
+        """
+        opening_balances = opening_balances or {}
+        total_opening = sum(opening_balances.values())
+
+        MoveLine = self.env['account.move.line']
+        MoveLine.flush_model()
+        self.env['account.move'].flush_model(['name'])
+        self.env['res.partner'].flush_model(['name'])
+
+        query = MoveLine._search(domain, order=order)
+        line = query.table
+        move_alias = query.make_alias(line, 'book_move')
+        query.add_join('JOIN', move_alias, 'account_move', SQL(
+            "%s = %s", SQL.identifier(move_alias, 'id'), SQL.identifier(line, 'move_id'),
+        ))
+        partner_alias = query.make_alias(line, 'book_partner')
+        query.add_join('LEFT JOIN', partner_alias, 'res_partner', SQL(
+            "%s = %s", SQL.identifier(partner_alias, 'id'), SQL.identifier(line, 'partner_id'),
+        ))
+        partition = SQL("PARTITION BY %s", SQL.identifier(line, 'journal_id')) if per_journal else SQL()
+        rows = self.env['ops.report.helpers'].iter_cursor_rows(query.select(
+            SQL.identifier(line, 'journal_id'),
+            SQL.identifier(line, 'date'),
+            SQL("%s AS move_name", SQL.identifier(move_alias, 'name')),
+            SQL("%s AS partner_name", SQL.identifier(partner_alias, 'name')),
+            SQL.identifier(line, 'account_id'),
+            SQL.identifier(line, 'ops_branch_id'),
+            SQL.identifier(line, 'name'),
+            SQL.identifier(line, 'debit'),
+            SQL.identifier(line, 'credit'),
+            SQL("SUM(%s) OVER (%s ORDER BY %s) AS running_balance",
+                SQL.identifier(line, 'balance'), partition, query.order),
+        ))
+
+        account_names = {}
+        branch_names = {None: ''}
+        for row in rows:
+            account_id = row['account_id']
+            if account_id not in account_names:
+                account_names[account_id] = self.env['account.account'].browse(account_id).display_name
+            branch_id = row['ops_branch_id']
+            if branch_id not in branch_names:
+                branch_names[branch_id] = self.env['ops.branch'].browse(branch_id).name
+
+            yield {
+                'journal_id': row['journal_id'],
+                'date': row['date'],
+                'ref': row['move_name'],
+                'partner': row['partner_name'] or '',
+                'account': account_names[account_id] or '',
+                'label': row['name'] or '',
+                'debit': row['debit'],
+                'credit': row['credit'],
+                'balance': row['running_balance'] + (
+                    opening_balances.get(row['journal_id'], 0.0) if per_journal else total_opening
+                ),
+                'branch': branch_names[branch_id] or '',
+            }
@@ -16,6 +16,14 @@ import logging
 
 _logger = logging.getLogger(__name__)
 
+INCOME_ACCOUNT_TYPES = ('income', 'income_other')
+COGS_ACCOUNT_TYPES = ('expense_direct_cost',)
+OPEX_ACCOUNT_TYPES = ('expense', 'expense_depreciation')
+
+# Heatmap ramp from least to most profitable cell
+HEAT_COLOR_STOPS = ('#d9534f', '#f0ad4e', '#5cb85c')
+HEAT_EMPTY_COLOR = '#e9ecef'
+
 
 class OpsMatrixProfitabilityAnalysis(models.TransientModel):
     """Matrix Profitability Analysis (Branch x BU)"""
@@ -88,9 +96,8 @@ class OpsMatrixProfitabilityAnalysis(models.TransientModel):
             ])
 
             # Initialize matrix
-            matrix = {}
-            branch_totals = {branch.id: {'income': 0, 'expense': 0} for branch in branches}
-            bu_totals = {bu.id: {'income': 0, 'expense': 0} for bu in bus}
+            branch_totals = {branch.id: wizard._empty_cell() for branch in branches}
+            bu_totals = {bu.id: wizard._empty_cell() for bu in bus}
 
             # Build branch-BU relationship map for validation
             bu_branch_map = {}
@@ -114,6 +121,7 @@ class OpsMatrixProfitabilityAnalysis(models.TransientModel):
                         'bottom_performers': [],
                         'average_profitability': 0,
                     },
+                    'heat_scale': wizard._compute_heat_scale([]),
                     'query_count': 0
                 }
                 continue
@@ -132,47 +140,19 @@ class OpsMatrixProfitabilityAnalysis(models.TransientModel):
                 domain=base_domain,
                 groupby=['ops_branch_id', 'ops_business_unit_id', 'account_id.account_type'],
                 aggregates=['credit:sum', 'debit:sum', '__count'],
-                having=[
-                    ('ops_branch_id', '!=', False),
-                    ('ops_business_unit_id', '!=', False)
-                ]
             )
 
-            # Build matrix from aggregated results
+            # Build matrix cells from aggregated results
             matrix_map = {}
-            for result in results:
-                branch_tuple = result.get('ops_branch_id')
-                bu_tuple = result.get('ops_business_unit_id')
-
-                if not branch_tuple or not bu_tuple:
-                    continue
-
-                branch_id = branch_tuple[0] if isinstance(branch_tuple, tuple) else branch_tuple
-                bu_id = bu_tuple[0] if isinstance(bu_tuple, tuple) else bu_tuple
-                account_type = result.get('account_id.account_type')
-                credit = result.get('credit', 0)
-                debit = result.get('debit', 0)
-                count = result.get('__count', 0)
-
-                key = f"{branch_id}-{bu_id}"
-
-                # Initialize matrix cell
-                if key not in matrix_map:
-                    matrix_map[key] = {
-                        'branch_id': branch_id,
-                        'bu_id': bu_id,
-                        'income': 0,
-                        'expense': 0,
-                        'transaction_count': 0,
-                    }
-
-                # Aggregate by account type
-                if account_type in ['income', 'income_other']:
-                    matrix_map[key]['income'] += credit - debit
-                elif account_type in ['expense', 'expense_depreciation', 'expense_direct_cost']:
-                    matrix_map[key]['expense'] += debit - credit
-
-                matrix_map[key]['transaction_count'] += count
+            for branch, bu, account_type, credit, debit, count in results:
+                cell = matrix_map.setdefault((branch.id, bu.id), wizard._empty_cell())
+                if account_type in INCOME_ACCOUNT_TYPES:
+                    cell['income'] += credit - debit
+                elif account_type in COGS_ACCOUNT_TYPES:
+                    cell['cogs'] += debit - credit
+                elif account_type in OPEX_ACCOUNT_TYPES:
+                    cell['opex'] += debit - credit
+                cell['transaction_count'] += count
 
             # Build final matrix with metadata and validation
             matrix_values = []
@@ -182,36 +162,24 @@ class OpsMatrixProfitabilityAnalysis(models.TransientModel):
                     if branch.id not in bu_branch_map.get(bu.id, set()):
                         continue
 
-                    key = f"{branch.id}-{bu.id}"
-                    cell_data = matrix_map.get(key, {
-                        'income': 0,
-                        'expense': 0,
-                        'transaction_count': 0,
-                    })
-
-                    income = cell_data['income']
-                    expense = cell_data['expense']
-                    net_profit = income - expense
-
-                    matrix_values.append({
+                    cell = matrix_map.get((branch.id, bu.id)) or wizard._empty_cell()
+                    matrix_values.append(wizard._finalize_cell({
                         'branch_id': branch.id,
                         'branch_code': branch.code,
                         'branch_name': branch.name,
                         'bu_id': bu.id,
                         'bu_code': bu.code,
                         'bu_name': bu.name,
-                        'income': income,
-                        'expense': expense,
-                        'net_profit': net_profit,
-                        'profitability': (net_profit / income * 100) if income else 0,
-                        'transaction_count': cell_data['transaction_count'],
-                    })
-
-                    # Update totals
-                    branch_totals[branch.id]['income'] += income
-                    branch_totals[branch.id]['expense'] += expense
-                    bu_totals[bu.id]['income'] += income
-                    bu_totals[bu.id]['expense'] += expense
+                        **cell,
+                    }))
+
+                    # Update row/column totals
+                    for total in (branch_totals[branch.id], bu_totals[bu.id]):
+                        for key in ('income', 'cogs', 'opex', 'transaction_count'):
+                            total[key] += cell[key]
+
+            branch_totals = {branch_id: wizard._finalize_cell(total) for branch_id, total in branch_totals.items()}
+            bu_totals = {bu_id: wizard._finalize_cell(total) for bu_id, total in bu_totals.items()}
 
             # Calculate overall totals
             total_income = sum(data['income'] for data in matrix_values)
@@ -223,6 +191,8 @@ class OpsMatrixProfitabilityAnalysis(models.TransientModel):
             top_performers = matrix_values[:5]
             bottom_performers = matrix_values[-5:] if len(matrix_values) >= 5 else []
 
+            heat_scale = wizard._compute_heat_scale(matrix_values)
+
             wizard.matrix_data = {
                 'company': wizard.company_id.name,
                 'period': f"{wizard.date_from} to {wizard.date_to}",
@@ -231,6 +201,8 @@ class OpsMatrixProfitabilityAnalysis(models.TransientModel):
                 'bu_totals': bu_totals,
                 'summary': {
                     'total_income': total_income,
+                    'total_cogs': sum(data['cogs'] for data in matrix_values),
+                    'total_opex': sum(data['opex'] for data in matrix_values),
                     'total_expense': total_expense,
                     'total_net_profit': total_net,
                     'total_combinations': len(matrix_values),
@@ -239,9 +211,76 @@ class OpsMatrixProfitabilityAnalysis(models.TransientModel):
                     'bottom_performers': bottom_performers,
                     'average_profitability': sum(m['profitability'] for m in matrix_values) / len(matrix_values) if matrix_values else 0,
                 },
+                'heat_scale': heat_scale,
                 'query_count': 1  # Performance monitoring: 1 query instead of 3*N*M
             }
 
+    def _empty_cell(self):
+        """Return an empty matrix cell / total accumulator."""
+        return {'income': 0.0, 'cogs': 0.0, 'opex': 0.0, 'transaction_count': 0}
+
+    def _finalize_cell(self, cell):
+        """Add expense, profit and margin figures derived from a cell's sums."""
+        income = cell['income']
+        expense = cell['cogs'] + cell['opex']
+        net_profit = income - expense
+        return {
+            **cell,
+            'expense': expense,
+            'gross_profit': income - cell['cogs'],
+            'net_profit': net_profit,
+            'gross_margin_pct': ((income - cell['cogs']) / income * 100) if income else 0,
+            'profitability': (net_profit / income * 100) if income else 0,
+        }
+
+    def _compute_heat_scale(self, matrix_values):
+        """
+        Compute the heatmap colour scale from the matrix cells.
+
+        Each cell with activity gets a ``heat`` position (0 = least, 1 = most
+        profitable) on the min/max profitability range and a matching colour
+        on a red-amber-green ramp.
+
+        Args:
+            matrix_values: list of finalized matrix cells (updated in place)
+
+        Returns:
+            dict: min/max profitability and the colour stops
+        """
+        active = [cell for cell in matrix_values if cell['transaction_count']]
+        low = min((cell['profitability'] for cell in active), default=0.0)
+        high = max((cell['profitability'] for cell in active), default=0.0)
+        span = high - low
+
+        for cell in matrix_values:
+            if not cell['transaction_count']:
+                cell['heat'] = None
+                cell['heat_color'] = HEAT_EMPTY_COLOR
+                continue
+            heat = (cell['profitability'] - low) / span if span else 1.0
+            cell['heat'] = heat
+            cell['heat_color'] = self._heat_color(heat)
+
+        return {
+            'min': low,
+            'max': high,
+            'stops': list(HEAT_COLOR_STOPS),
+            'empty_color': HEAT_EMPTY_COLOR,
+        }
+
+    def _heat_color(self, heat):
+        """Interpolate a hex colour for a heat position in [0, 1]."""
+        position = heat * (len(HEAT_COLOR_STOPS) - 1)
+        index = min(int(position), len(HEAT_COLOR_STOPS) - 2)
+        ratio = position - index
+        start = HEAT_COLOR_STOPS[index]
+        end = HEAT_COLOR_STOPS[index + 1]
+        channels = (
+            round(int(start[i:i + 2], 16) + (int(end[i:i + 2], 16) - int(start[i:i + 2], 16)) * ratio)
+            for i in (1, 3, 5)
+        )
+        return '#' + ''.join(f'{channel:02x}' for channel in channels)
+
     def action_generate_heatmap(self):
         """Generate heatmap visualization data (displays as notification for now)."""
         self.ensure_one()
@@ -257,7 +296,8 @@ class OpsMatrixProfitabilityAnalysis(models.TransientModel):
             "Total Expense: %(expense).2f\n"
             "Total Net Profit: %(profit).2f\n"
             "Active Combinations: %(combinations)d\n"
-            "Average Profitability: %(avg_profit).2f%%\n\n"
+            "Average Profitability: %(avg_profit).2f%%\n"
+            "Heatmap Scale: %(scale_min).2f%% to %(scale_max).2f%%\n\n"
             "View the detailed data in the wizard form below."
         ) % {
             'income': summary.get('total_income', 0),
@@ -265,6 +305,8 @@ class OpsMatrixProfitabilityAnalysis(models.TransientModel):
             'profit': summary.get('total_net_profit', 0),
             'combinations': summary.get('active_combinations', 0),
             'avg_profit': summary.get('average_profitability', 0),
+            'scale_min': matrix_data.get('heat_scale', {}).get('min', 0),
+            'scale_max': matrix_data.get('heat_scale', {}).get('max', 0),
         }
 
         # Return action to show notification and keep wizard open
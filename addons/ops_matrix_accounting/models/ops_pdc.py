@@ -6,12 +6,217 @@ import logging
 _logger = logging.getLogger(__name__)
 
 
+class OpsPDCMixin(models.AbstractModel):
+    """
+    Batch processing shared by receivable and payable PDCs.
+
+    Configuration is validated once per (company, journal) and once per
+    partner, journal entries of a whole selection are created with a single
+    account.move create() and posted with a single action_post(). Bank
+    clearances can optionally be consolidated into one deposit slip entry
+    with a line per cheque.
+    """
+    _name = 'ops.pdc.mixin'
+    _description = 'PDC Batch Processing'
+
+    # Company field holding the default PDC clearing account
+    _pdc_company_account_field = None
+    # Partner property holding the receivable/payable counterpart account
+    _pdc_partner_account_field = None
+
+    # ==================================================================
+    # ACCOUNT RESOLUTION
+    # ==================================================================
+    def _pdc_journal(self):
+        self.ensure_one()
+        return self.journal_id or self.company_id.pdc_journal_id
+
+    def _pdc_account(self):
+        self.ensure_one()
+        return self.pdc_account_id or self.company_id[self._pdc_company_account_field]
+
+    def _pdc_partner_account(self):
+        self.ensure_one()
+        return self.partner_id.with_company(self.company_id)[self._pdc_partner_account_field]
+
+    def _pdc_line(self, account, name, debit=0.0, credit=0.0):
+        """Journal item values of one cheque."""
+        self.ensure_one()
+        return {
+            'account_id': account.id,
+            'partner_id': self.partner_id.id,
+            'name': name,
+            'debit': debit,
+            'credit': credit,
+        }
+
+    # ==================================================================
+    # VALIDATION
+    # ==================================================================
+    def _check_pdc_config(self, account_error, partner_error):
+        """
+        Validate PDC configuration for the whole selection.
+
+        Journal and clearing account defaults are checked once per
+        (company, journal, account) and partner accounts once per
+        (partner, company), instead of once per cheque.
+
+        Args:
+            account_error: Message when no PDC clearing account is configured
+            partner_error: Message when the partner has no counterpart account
+        """
+        errors = []
+
+        def with_names(message, pdcs):
+            if len(self) == 1:
+                return message
+            return f"{message} ({', '.join(pdcs.mapped('name'))})"
+
+        config_groups = self.grouped(lambda r: (r.company_id, r.journal_id, r.pdc_account_id))
+        for (company, journal, account), pdcs in config_groups.items():
+            if not journal and not company.pdc_journal_id:
+                errors.append(with_names(_("PDC Journal is not configured."), pdcs))
+            if not account and not company[self._pdc_company_account_field]:
+                errors.append(with_names(account_error, pdcs))
+
+        partner_groups = self.grouped(lambda r: (r.partner_id, r.company_id))
+        for (partner, company), pdcs in partner_groups.items():
+            if not partner.with_company(company)[self._pdc_partner_account_field]:
+                errors.append(with_names(partner_error, pdcs))
+
+        if errors:
+            raise UserError(_("PDC Configuration Error:\n%s\n\nPlease configure in Settings > Accounting > PDC Settings.") % '\n'.join(errors))
+
+    def _check_pdc_state(self, states, message):
+        if self.filtered(lambda r: r.state not in states):
+            raise UserError(message)
+
+    def _check_pdc_bank_journal(self, bank_journal_field, message):
+        """Ensure every PDC has a bank journal with a default account."""
+        if self.filtered(lambda r: not r[bank_journal_field]):
+            raise UserError(message)
+        for bank_journal in self[bank_journal_field]:
+            if not bank_journal.default_account_id:
+                raise UserError(_("Bank journal '%s' has no default account configured.") % bank_journal.name)
+
+    # ==================================================================
+    # JOURNAL ENTRIES
+    # ==================================================================
+    def _create_pdc_journal_entry(self, journal, date, lines, ref=None, auto_post=True):
+        """
+        Create a journal entry for PDC operations.
+
+        Args:
+            journal: account.journal record
+            date: Entry date
+            lines: List of dicts with keys: account_id, debit, credit, partner_id, name
+            ref: Reference string
+            auto_post: Whether to post immediately
+
+        Returns:
+            account.move record
+        """
+        self.ensure_one()
+        return self._create_pdc_journal_entries([(self, journal, date, lines, ref)], auto_post)[self.id]
+
+    def _create_pdc_journal_entries(self, entries, auto_post=True):
+        """
+        Create the journal entries of many PDCs in one batch.
+
+        Args:
+            entries: List of (pdcs, journal, date, lines, ref) tuples. pdcs
+                is the PDC recordset settled by the entry: a single cheque,
+                or every cheque of a consolidated deposit slip.
+            auto_post: Whether to post the entries (in a single call)
+
+        Returns:
+            dict: {pdc id: account.move record}
+        """
+        vals_list = []
+        for pdcs, journal, date, lines, ref in entries:
+            pdc = pdcs[:1]
+            move_vals = {
+                'date': date,
+                'journal_id': journal.id,
+                'ref': ref or f"{pdc.name} - {pdc.check_number}",
+                'company_id': pdc.company_id.id,
+                'line_ids': [(0, 0, line) for line in lines],
+            }
+
+            # Add OPS dimensions if available
+            if pdc.ops_branch_id:
+                move_vals['ops_branch_id'] = pdc.ops_branch_id.id
+            if pdc.ops_business_unit_id:
+                move_vals['ops_business_unit_id'] = pdc.ops_business_unit_id.id
+
+            vals_list.append(move_vals)
+
+        moves = self.env['account.move'].create(vals_list)
+
+        if auto_post:
+            moves.action_post()
+
+        move_by_pdc = {}
+        for (pdcs, *__), move in zip(entries, moves):
+            for pdc in pdcs:
+                move_by_pdc[pdc.id] = move
+        return move_by_pdc
+
+    def _prepare_pdc_slip_entries(self, bank_journal_field, date, bank_side, label, ref):
+        """
+        Build consolidated deposit slip entries.
+
+        PDCs sharing company, PDC journal, bank journal and matrix dimensions
+        go into one entry: a line per cheque on the PDC clearing account and
+        a single bank line for the slip total.
+
+        Args:
+            bank_journal_field: PDC field holding the bank journal
+            date: Entry date
+            bank_side: 'debit' or 'credit' side of the bank line
+            label: Callable returning the cheque line label of a PDC
+            ref: Slip reference, formatted with the cheque count
+
+        Returns:
+            list of (pdcs, journal, date, lines, ref) tuples
+        """
+        pdc_side = 'credit' if bank_side == 'debit' else 'debit'
+        groups = self.grouped(lambda r: (
+            r.company_id, r._pdc_journal(), r[bank_journal_field], r.ops_branch_id, r.ops_business_unit_id,
+        ))
+
+        entries = []
+        for (company, journal, bank_journal, branch, business_unit), pdcs in groups.items():
+            slip_ref = ref % len(pdcs)
+            total = sum(pdcs.mapped('amount'))
+            lines = [{
+                'account_id': bank_journal.default_account_id.id,
+                'name': slip_ref,
+                bank_side: total,
+                pdc_side: 0.0,
+            }]
+            lines += [pdc._pdc_line(pdc._pdc_account(), label(pdc), **{pdc_side: pdc.amount}) for pdc in pdcs]
+            entries.append((pdcs, journal, date, lines, slip_ref))
+        return entries
+
+    def _apply_pdc_moves(self, move_by_pdc, values, move_field, body, subject, **message_kwargs):
+        """Write the new state and link each PDC to its journal entry."""
+        self.write(values)
+        for rec in self:
+            move = move_by_pdc[rec.id]
+            rec[move_field] = move
+            rec.message_post(body=body % (move.id, move.name), subject=subject, **message_kwargs)
+
+
 class OpsPDCReceivable(models.Model):
     _name = 'ops.pdc.receivable'
     _description = 'Post-Dated Check Receivable'
-    _inherit = ['mail.thread', 'mail.activity.mixin']
+    _inherit = ['mail.thread', 'mail.activity.mixin', 'ops.pdc.mixin']
     _order = 'maturity_date desc, id desc'
 
+    _pdc_company_account_field = 'pdc_receivable_account_id'
+    _pdc_partner_account_field = 'property_account_receivable_id'
+
     # ==================================================================
     # BASIC FIELDS
     # ==================================================================
@@ -190,251 +395,134 @@ class OpsPDCReceivable(models.Model):
                 raise ValidationError(_('Maturity date must be after check date'))
 
     # ==================================================================
-    # HELPER: CREATE JOURNAL ENTRY
+    # HELPER: VALIDATION
     # ==================================================================
-    def _create_pdc_journal_entry(self, journal, date, lines, ref=None, auto_post=True):
-        """
-        Create a journal entry for PDC operations.
-
-        Args:
-            journal: account.journal record
-            date: Entry date
-            lines: List of dicts with keys: account_id, debit, credit, partner_id, name
-            ref: Reference string
-            auto_post: Whether to post immediately
-
-        Returns:
-            account.move record
-        """
-        self.ensure_one()
-
-        move_vals = {
-            'date': date,
-            'journal_id': journal.id,
-            'ref': ref or f"{self.name} - {self.check_number}",
-            'company_id': self.company_id.id,
-            'line_ids': [(0, 0, line) for line in lines],
-        }
-
-        # Add OPS dimensions if available
-        if self.ops_branch_id:
-            move_vals['ops_branch_id'] = self.ops_branch_id.id
-        if self.ops_business_unit_id:
-            move_vals['ops_business_unit_id'] = self.ops_business_unit_id.id
-
-        move = self.env['account.move'].create(move_vals)
-
-        if auto_post:
-            move.action_post()
-
-        return move
-
     def _validate_pdc_config(self):
         """Validate that PDC configuration is complete."""
-        self.ensure_one()
-        errors = []
-
-        if not self.journal_id and not self.company_id.pdc_journal_id:
-            errors.append(_("PDC Journal is not configured."))
-
-        if not self.pdc_account_id and not self.company_id.pdc_receivable_account_id:
-            errors.append(_("PDC Receivable Account is not configured."))
-
-        if not self.partner_id.property_account_receivable_id:
-            errors.append(_("Customer has no receivable account configured."))
-
-        if errors:
-            raise UserError(_("PDC Configuration Error:\n%s\n\nPlease configure in Settings > Accounting > PDC Settings.") % '\n'.join(errors))
+        self._check_pdc_config(
+            _("PDC Receivable Account is not configured."),
+            _("Customer has no receivable account configured."),
+        )
 
     # ==================================================================
     # ACTION METHODS
     # ==================================================================
     def action_deposit(self):
         """
-        Deposit the PDC - Create journal entry:
+        Deposit the PDCs - Create journal entries:
         Dr: PDC Clearing Account
         Cr: Accounts Receivable
         """
-        for rec in self:
-            if rec.state != 'draft':
-                raise UserError(_("Only draft PDCs can be deposited."))
-
-            rec._validate_pdc_config()
-
-            # Get accounts
-            journal = rec.journal_id or rec.company_id.pdc_journal_id
-            pdc_account = rec.pdc_account_id or rec.company_id.pdc_receivable_account_id
-            receivable_account = rec.partner_id.property_account_receivable_id
-
-            deposit_date = fields.Date.today()
-
-            # Create journal entry lines
-            lines = [
-                {
-                    'account_id': pdc_account.id,
-                    'partner_id': rec.partner_id.id,
-                    'name': _("PDC Deposit: %s") % rec.check_number,
-                    'debit': rec.amount,
-                    'credit': 0.0,
-                },
-                {
-                    'account_id': receivable_account.id,
-                    'partner_id': rec.partner_id.id,
-                    'name': _("PDC Deposit: %s") % rec.check_number,
-                    'debit': 0.0,
-                    'credit': rec.amount,
-                },
-            ]
-
-            # Create and post the journal entry
-            move = rec._create_pdc_journal_entry(
-                journal=journal,
-                date=deposit_date,
-                lines=lines,
-                ref=_("PDC Deposit: %s - %s") % (rec.name, rec.check_number),
-            )
-
-            # Update PDC record
-            rec.write({
-                'state': 'deposited',
-                'deposit_date': deposit_date,
-                'deposit_move_id': move.id,
-            })
+        self._check_pdc_state(('draft',), _("Only draft PDCs can be deposited."))
+        self._validate_pdc_config()
 
-            # Post message to chatter
-            rec.message_post(
-                body=_("PDC deposited. Journal Entry: <a href='#' data-oe-model='account.move' data-oe-id='%s'>%s</a>") % (move.id, move.name),
-                subject=_("PDC Deposited"),
-            )
+        deposit_date = fields.Date.today()
 
-            _logger.info("PDC %s deposited with JE %s", rec.name, move.name)
-
-    def action_clear(self):
+        entries = []
+        for rec in self:
+            label = _("PDC Deposit: %s") % rec.check_number
+            entries.append((rec, rec._pdc_journal(), deposit_date, [
+                rec._pdc_line(rec._pdc_account(), label, debit=rec.amount),
+                rec._pdc_line(rec._pdc_partner_account(), label, credit=rec.amount),
+            ], _("PDC Deposit: %s - %s") % (rec.name, rec.check_number)))
+
+        # Create and post all journal entries at once
+        move_by_pdc = self._create_pdc_journal_entries(entries)
+
+        self._apply_pdc_moves(
+            move_by_pdc,
+            {'state': 'deposited', 'deposit_date': deposit_date},
+            'deposit_move_id',
+            _("PDC deposited. Journal Entry: <a href='#' data-oe-model='account.move' data-oe-id='%s'>%s</a>"),
+            _("PDC Deposited"),
+        )
+
+        _logger.info("%d PDCs deposited with %d JEs", len(self), len(entries))
+
+    def action_clear(self, consolidate=False):
         """
-        Clear the PDC - Create journal entry:
+        Clear the PDCs - Create journal entries:
         Dr: Bank Account
         Cr: PDC Clearing Account
-        """
-        for rec in self:
-            if rec.state != 'deposited':
-                raise UserError(_("Only deposited PDCs can be cleared."))
-
-            if not rec.deposit_bank_journal_id:
-                raise UserError(_("Please select a Bank Journal for clearance."))
 
-            # Get accounts
-            bank_journal = rec.deposit_bank_journal_id
-            bank_account = bank_journal.default_account_id
-            if not bank_account:
-                raise UserError(_("Bank journal '%s' has no default account configured.") % bank_journal.name)
-
-            pdc_account = rec.pdc_account_id or rec.company_id.pdc_receivable_account_id
-            journal = rec.journal_id or rec.company_id.pdc_journal_id
-
-            clearance_date = fields.Date.today()
-
-            # Create journal entry lines
-            lines = [
-                {
-                    'account_id': bank_account.id,
-                    'partner_id': rec.partner_id.id,
-                    'name': _("PDC Clearance: %s") % rec.check_number,
-                    'debit': rec.amount,
-                    'credit': 0.0,
-                },
-                {
-                    'account_id': pdc_account.id,
-                    'partner_id': rec.partner_id.id,
-                    'name': _("PDC Clearance: %s") % rec.check_number,
-                    'debit': 0.0,
-                    'credit': rec.amount,
-                },
-            ]
-
-            # Create and post the journal entry
-            move = rec._create_pdc_journal_entry(
-                journal=journal,
-                date=clearance_date,
-                lines=lines,
-                ref=_("PDC Clearance: %s - %s") % (rec.name, rec.check_number),
-            )
-
-            # Update PDC record
-            rec.write({
-                'state': 'cleared',
-                'clearance_date': clearance_date,
-                'clearance_move_id': move.id,
-            })
-
-            # Post message to chatter
-            rec.message_post(
-                body=_("PDC cleared. Journal Entry: <a href='#' data-oe-model='account.move' data-oe-id='%s'>%s</a>") % (move.id, move.name),
-                subject=_("PDC Cleared"),
+        Args:
+            consolidate: Book one deposit slip entry per bank journal (and
+                matrix dimensions) with a line per cheque, instead of one
+                entry per cheque
+        """
+        self._check_pdc_state(('deposited',), _("Only deposited PDCs can be cleared."))
+        self._check_pdc_bank_journal(
+            'deposit_bank_journal_id', _("Please select a Bank Journal for clearance."),
+        )
+
+        clearance_date = fields.Date.today()
+
+        if consolidate:
+            entries = self._prepare_pdc_slip_entries(
+                'deposit_bank_journal_id', clearance_date, 'debit',
+                label=lambda rec: _("PDC Clearance: %s") % rec.check_number,
+                ref=_("PDC Deposit Slip: %s cheques"),
             )
-
-            _logger.info("PDC %s cleared with JE %s", rec.name, move.name)
+        else:
+            entries = []
+            for rec in self:
+                label = _("PDC Clearance: %s") % rec.check_number
+                entries.append((rec, rec._pdc_journal(), clearance_date, [
+                    rec._pdc_line(rec.deposit_bank_journal_id.default_account_id, label, debit=rec.amount),
+                    rec._pdc_line(rec._pdc_account(), label, credit=rec.amount),
+                ], _("PDC Clearance: %s - %s") % (rec.name, rec.check_number)))
+
+        # Create and post all journal entries at once
+        move_by_pdc = self._create_pdc_journal_entries(entries)
+
+        self._apply_pdc_moves(
+            move_by_pdc,
+            {'state': 'cleared', 'clearance_date': clearance_date},
+            'clearance_move_id',
+            _("PDC cleared. Journal Entry: <a href='#' data-oe-model='account.move' data-oe-id='%s'>%s</a>"),
+            _("PDC Cleared"),
+        )
+
+        _logger.info("%d PDCs cleared with %d JEs", len(self), len(entries))
+
+    def action_clear_deposit_slip(self):
+        """Clear the selected PDCs as consolidated bank deposit slips."""
+        return self.action_clear(consolidate=True)
 
     def action_bounce(self):
         """
-        Bounce the PDC - Reverse the deposit entry:
+        Bounce the PDCs - Reverse the deposit entries:
         Dr: Accounts Receivable
         Cr: PDC Clearing Account
         """
-        for rec in self:
-            if rec.state != 'deposited':
-                raise UserError(_("Only deposited PDCs can be bounced."))
-
-            if not rec.deposit_move_id:
-                raise UserError(_("No deposit entry found to reverse."))
-
-            # Get accounts (reverse of deposit)
-            journal = rec.journal_id or rec.company_id.pdc_journal_id
-            pdc_account = rec.pdc_account_id or rec.company_id.pdc_receivable_account_id
-            receivable_account = rec.partner_id.property_account_receivable_id
-
-            bounce_date = fields.Date.today()
-
-            # Create reversal lines (opposite of deposit)
-            lines = [
-                {
-                    'account_id': receivable_account.id,
-                    'partner_id': rec.partner_id.id,
-                    'name': _("PDC Bounce Reversal: %s") % rec.check_number,
-                    'debit': rec.amount,
-                    'credit': 0.0,
-                },
-                {
-                    'account_id': pdc_account.id,
-                    'partner_id': rec.partner_id.id,
-                    'name': _("PDC Bounce Reversal: %s") % rec.check_number,
-                    'debit': 0.0,
-                    'credit': rec.amount,
-                },
-            ]
-
-            # Create and post the reversal entry
-            move = rec._create_pdc_journal_entry(
-                journal=journal,
-                date=bounce_date,
-                lines=lines,
-                ref=_("PDC Bounce (Reversal): %s - %s") % (rec.name, rec.check_number),
-            )
+        self._check_pdc_state(('deposited',), _("Only deposited PDCs can be bounced."))
+        if self.filtered(lambda r: not r.deposit_move_id):
+            raise UserError(_("No deposit entry found to reverse."))
 
-            # Update PDC record
-            rec.write({
-                'state': 'bounced',
-                'bounce_date': bounce_date,
-                'bounce_move_id': move.id,
-            })
-
-            # Post message to chatter
-            rec.message_post(
-                body=_("PDC bounced! Reversal Entry: <a href='#' data-oe-model='account.move' data-oe-id='%s'>%s</a>") % (move.id, move.name),
-                subject=_("PDC Bounced"),
-                message_type='notification',
-            )
+        bounce_date = fields.Date.today()
 
-            _logger.warning("PDC %s bounced with reversal JE %s", rec.name, move.name)
+        # Create reversal lines (opposite of deposit)
+        entries = []
+        for rec in self:
+            label = _("PDC Bounce Reversal: %s") % rec.check_number
+            entries.append((rec, rec._pdc_journal(), bounce_date, [
+                rec._pdc_line(rec._pdc_partner_account(), label, debit=rec.amount),
+                rec._pdc_line(rec._pdc_account(), label, credit=rec.amount),
+            ], _("PDC Bounce (Reversal): %s - %s") % (rec.name, rec.check_number)))
+
+        # Create and post all reversal entries at once
+        move_by_pdc = self._create_pdc_journal_entries(entries)
+
+        self._apply_pdc_moves(
+            move_by_pdc,
+            {'state': 'bounced', 'bounce_date': bounce_date},
+            'bounce_move_id',
+            _("PDC bounced! Reversal Entry: <a href='#' data-oe-model='account.move' data-oe-id='%s'>%s</a>"),
+            _("PDC Bounced"),
+            message_type='notification',
+        )
+
+        _logger.warning("%d PDCs bounced: %s", len(self), ', '.join(self.mapped('name')))
 
     def action_cancel(self):
         """Cancel a PDC - only allowed for draft state."""
@@ -456,9 +544,12 @@ class OpsPDCReceivable(models.Model):
 class OpsPDCPayable(models.Model):
     _name = 'ops.pdc.payable'
     _description = 'Post-Dated Check Payable'
-    _inherit = ['mail.thread', 'mail.activity.mixin']
+    _inherit = ['mail.thread', 'mail.activity.mixin', 'ops.pdc.mixin']
     _order = 'maturity_date desc, id desc'
 
+    _pdc_company_account_field = 'pdc_payable_account_id'
+    _pdc_partner_account_field = 'property_account_payable_id'
+
     # ==================================================================
     # BASIC FIELDS
     # ==================================================================
@@ -631,124 +722,49 @@ class OpsPDCPayable(models.Model):
                 raise ValidationError(_('Amount must be positive'))
 
     # ==================================================================
-    # HELPER: CREATE JOURNAL ENTRY
+    # HELPER: VALIDATION
     # ==================================================================
-    def _create_pdc_journal_entry(self, journal, date, lines, ref=None, auto_post=True):
-        """
-        Create a journal entry for PDC operations.
-
-        Args:
-            journal: account.journal record
-            date: Entry date
-            lines: List of dicts with keys: account_id, debit, credit, partner_id, name
-            ref: Reference string
-            auto_post: Whether to post immediately
-
-        Returns:
-            account.move record
-        """
-        self.ensure_one()
-
-        move_vals = {
-            'date': date,
-            'journal_id': journal.id,
-            'ref': ref or f"{self.name} - {self.check_number}",
-            'company_id': self.company_id.id,
-            'line_ids': [(0, 0, line) for line in lines],
-        }
-
-        # Add OPS dimensions if available
-        if self.ops_branch_id:
-            move_vals['ops_branch_id'] = self.ops_branch_id.id
-        if self.ops_business_unit_id:
-            move_vals['ops_business_unit_id'] = self.ops_business_unit_id.id
-
-        move = self.env['account.move'].create(move_vals)
-
-        if auto_post:
-            move.action_post()
-
-        return move
-
     def _validate_pdc_config(self):
         """Validate that PDC configuration is complete."""
-        self.ensure_one()
-        errors = []
-
-        if not self.journal_id and not self.company_id.pdc_journal_id:
-            errors.append(_("PDC Journal is not configured."))
-
-        if not self.pdc_account_id and not self.company_id.pdc_payable_account_id:
-            errors.append(_("PDC Payable Account is not configured."))
-
-        if not self.partner_id.property_account_payable_id:
-            errors.append(_("Vendor has no payable account configured."))
-
-        if errors:
-            raise UserError(_("PDC Configuration Error:\n%s\n\nPlease configure in Settings > Accounting > PDC Settings.") % '\n'.join(errors))
+        self._check_pdc_config(
+            _("PDC Payable Account is not configured."),
+            _("Vendor has no payable account configured."),
+        )
 
     # ==================================================================
     # ACTION METHODS
     # ==================================================================
     def action_issue(self):
         """
-        Issue the PDC - Create journal entry:
+        Issue the PDCs - Create journal entries:
         Dr: Accounts Payable
         Cr: PDC Clearing Account
         """
+        self._check_pdc_state(('draft',), _("Only draft PDCs can be issued."))
+        self._validate_pdc_config()
+
+        issue_date = fields.Date.today()
+
+        entries = []
         for rec in self:
-            if rec.state != 'draft':
-                raise UserError(_("Only draft PDCs can be issued."))
-
-            rec._validate_pdc_config()
-
-            # Get accounts
-            journal = rec.journal_id or rec.company_id.pdc_journal_id
-            pdc_account = rec.pdc_account_id or rec.company_id.pdc_payable_account_id
-            payable_account = rec.partner_id.property_account_payable_id
-
-            issue_date = fields.Date.today()
-
-            # Create journal entry lines
-            lines = [
-                {
-                    'account_id': payable_account.id,
-                    'partner_id': rec.partner_id.id,
-                    'name': _("PDC Issue: %s") % rec.check_number,
-                    'debit': rec.amount,
-                    'credit': 0.0,
-                },
-                {
-                    'account_id': pdc_account.id,
-                    'partner_id': rec.partner_id.id,
-                    'name': _("PDC Issue: %s") % rec.check_number,
-                    'debit': 0.0,
-                    'credit': rec.amount,
-                },
-            ]
-
-            # Create and post the journal entry
-            move = rec._create_pdc_journal_entry(
-                journal=journal,
-                date=issue_date,
-                lines=lines,
-                ref=_("PDC Issue: %s - %s") % (rec.name, rec.check_number),
-            )
+            label = _("PDC Issue: %s") % rec.check_number
+            entries.append((rec, rec._pdc_journal(), issue_date, [
+                rec._pdc_line(rec._pdc_partner_account(), label, debit=rec.amount),
+                rec._pdc_line(rec._pdc_account(), label, credit=rec.amount),
+            ], _("PDC Issue: %s - %s") % (rec.name, rec.check_number)))
 
-            # Update PDC record
-            rec.write({
-                'state': 'issued',
-                'issue_date': issue_date,
-                'issue_move_id': move.id,
-            })
+        # Create and post all journal entries at once
+        move_by_pdc = self._create_pdc_journal_entries(entries)
 
-            # Post message to chatter
-            rec.message_post(
-                body=_("PDC issued. Journal Entry: <a href='#' data-oe-model='account.move' data-oe-id='%s'>%s</a>") % (move.id, move.name),
-                subject=_("PDC Issued"),
-            )
+        self._apply_pdc_moves(
+            move_by_pdc,
+            {'state': 'issued', 'issue_date': issue_date},
+            'issue_move_id',
+            _("PDC issued. Journal Entry: <a href='#' data-oe-model='account.move' data-oe-id='%s'>%s</a>"),
+            _("PDC Issued"),
+        )
 
-            _logger.info("PDC Payable %s issued with JE %s", rec.name, move.name)
+        _logger.info("%d PDC Payables issued with %d JEs", len(self), len(entries))
 
     def action_present(self):
         """Mark PDC as presented to bank (status only, no JE)."""
@@ -761,70 +777,55 @@ class OpsPDCPayable(models.Model):
             })
             rec.message_post(body=_("PDC presented to bank."), subject=_("PDC Presented"))
 
-    def action_clear(self):
+    def action_clear(self, consolidate=False):
         """
-        Clear the PDC - Create journal entry:
+        Clear the PDCs - Create journal entries:
         Dr: PDC Clearing Account
         Cr: Bank Account
-        """
-        for rec in self:
-            if rec.state not in ('issued', 'presented'):
-                raise UserError(_("Only issued or presented PDCs can be cleared."))
 
-            if not rec.bank_journal_id:
-                raise UserError(_("Please select a Bank Account for clearance."))
-
-            # Get accounts
-            bank_journal = rec.bank_journal_id
-            bank_account = bank_journal.default_account_id
-            if not bank_account:
-                raise UserError(_("Bank journal '%s' has no default account configured.") % bank_journal.name)
-
-            pdc_account = rec.pdc_account_id or rec.company_id.pdc_payable_account_id
-            journal = rec.journal_id or rec.company_id.pdc_journal_id
-
-            clearance_date = fields.Date.today()
-
-            # Create journal entry lines
-            lines = [
-                {
-                    'account_id': pdc_account.id,
-                    'partner_id': rec.partner_id.id,
-                    'name': _("PDC Clearance: %s") % rec.check_number,
-                    'debit': rec.amount,
-                    'credit': 0.0,
-                },
-                {
-                    'account_id': bank_account.id,
-                    'partner_id': rec.partner_id.id,
-                    'name': _("PDC Clearance: %s") % rec.check_number,
-                    'debit': 0.0,
-                    'credit': rec.amount,
-                },
-            ]
-
-            # Create and post the journal entry
-            move = rec._create_pdc_journal_entry(
-                journal=journal,
-                date=clearance_date,
-                lines=lines,
-                ref=_("PDC Clearance: %s - %s") % (rec.name, rec.check_number),
-            )
-
-            # Update PDC record
-            rec.write({
-                'state': 'cleared',
-                'clearance_date': clearance_date,
-                'clearance_move_id': move.id,
-            })
-
-            # Post message to chatter
-            rec.message_post(
-                body=_("PDC cleared. Journal Entry: <a href='#' data-oe-model='account.move' data-oe-id='%s'>%s</a>") % (move.id, move.name),
-                subject=_("PDC Cleared"),
+        Args:
+            consolidate: Book one entry per bank account (and matrix
+                dimensions) with a line per cheque, instead of one entry
+                per cheque
+        """
+        self._check_pdc_state(('issued', 'presented'), _("Only issued or presented PDCs can be cleared."))
+        self._check_pdc_bank_journal(
+            'bank_journal_id', _("Please select a Bank Account for clearance."),
+        )
+
+        clearance_date = fields.Date.today()
+
+        if consolidate:
+            entries = self._prepare_pdc_slip_entries(
+                'bank_journal_id', clearance_date, 'credit',
+                label=lambda rec: _("PDC Clearance: %s") % rec.check_number,
+                ref=_("PDC Clearance Batch: %s cheques"),
             )
-
-            _logger.info("PDC Payable %s cleared with JE %s", rec.name, move.name)
+        else:
+            entries = []
+            for rec in self:
+                label = _("PDC Clearance: %s") % rec.check_number
+                entries.append((rec, rec._pdc_journal(), clearance_date, [
+                    rec._pdc_line(rec._pdc_account(), label, debit=rec.amount),
+                    rec._pdc_line(rec.bank_journal_id.default_account_id, label, credit=rec.amount),
+                ], _("PDC Clearance: %s - %s") % (rec.name, rec.check_number)))
+
+        # Create and post all journal entries at once
+        move_by_pdc = self._create_pdc_journal_entries(entries)
+
+        self._apply_pdc_moves(
+            move_by_pdc,
+            {'state': 'cleared', 'clearance_date': clearance_date},
+            'clearance_move_id',
+            _("PDC cleared. Journal Entry: <a href='#' data-oe-model='account.move' data-oe-id='%s'>%s</a>"),
+            _("PDC Cleared"),
+        )
+
+        _logger.info("%d PDC Payables cleared with %d JEs", len(self), len(entries))
+
+    def action_clear_consolidated(self):
+        """Clear the selected PDCs with one entry per bank account."""
+        return self.action_clear(consolidate=True)
 
     def action_cancel(self):
         """
@@ -10,11 +10,15 @@ Adopted from OM recurring_payments, enhanced with:
 
 from odoo import models, fields, api, _
 from odoo.exceptions import UserError, ValidationError
+from odoo.tools import split_every
 from dateutil.relativedelta import relativedelta
 import logging
 
 _logger = logging.getLogger(__name__)
 
+# Occurrences generated (and committed) together by the recurring cron
+RECURRING_BATCH_SIZE = 100
+
 
 class OpsRecurringTemplate(models.Model):
     """
@@ -249,6 +253,19 @@ class OpsRecurringTemplate(models.Model):
         """
         self.ensure_one()
 
+        entry = self._generate_entries([(self, entry_date)])
+        if not entry:
+            raise UserError(_(
+                'A recurring entry for %(template)s already exists on %(date)s.'
+            ) % {'template': self.name, 'date': entry_date})
+
+        _logger.info("Generated recurring entry %s from template %s", entry.name, self.name)
+        return entry
+
+    def _prepare_entry_vals(self, entry_date):
+        """Values of the recurring entry generated for an occurrence date."""
+        self.ensure_one()
+
         entry_vals = {
             'template_id': self.id,
             'entry_date': entry_date,
@@ -274,23 +291,100 @@ class OpsRecurringTemplate(models.Model):
             }))
 
         entry_vals['line_ids'] = line_vals
+        return entry_vals
 
-        entry = self.env['ops.recurring.entry'].create(entry_vals)
+    def _get_due_occurrences(self, until_date):
+        """
+        List every occurrence of the templates that is due by a date.
 
-        _logger.info("Generated recurring entry %s from template %s", entry.name, self.name)
+        Starts at each template's next execution date so that occurrences
+        missed while the cron was down are caught up in a single run.
+
+        Args:
+            until_date: Last date to generate (inclusive)
+
+        Returns:
+            list of (template, occurrence date) tuples, in date order per template
+        """
+        occurrences = []
+        for template in self:
+            first_date = template.next_execution_date
+            if not first_date:
+                continue
+            if template.recurring_interval < 1:
+                _logger.warning("Skipping template %s: invalid interval %d",
+                                template.name, template.recurring_interval)
+                continue
+
+            last_date = min(until_date, template.date_end) if template.date_end else until_date
+            step = template._get_relativedelta()
+            # Offsets from the first date avoid month-end drift (31st -> 28th -> 28th)
+            occurrence_date, count = first_date, 0
+            while occurrence_date <= last_date:
+                occurrences.append((template, occurrence_date))
+                count += 1
+                occurrence_date = first_date + step * count
+        return occurrences
+
+    @api.model
+    def _get_existing_occurrence_keys(self, occurrences):
+        """Return the (template id, date) keys that already have an entry."""
+        if not occurrences:
+            return set()
+        template_ids = list({template.id for template, entry_date in occurrences})
+        entry_dates = list({entry_date for template, entry_date in occurrences})
+        groups = self.env['ops.recurring.entry']._read_group(
+            domain=[
+                ('template_id', 'in', template_ids),
+                ('entry_date', 'in', entry_dates),
+            ],
+            groupby=['template_id', 'entry_date:day'],
+        )
+        return {(template.id, entry_date) for template, entry_date in groups}
+
+    @api.model
+    def _generate_entries(self, occurrences):
+        """
+        Create the recurring entries of a list of occurrences in bulk.
+
+        Occurrences are keyed by (template, date): keys that already have an
+        entry are skipped, so a retried batch never duplicates entries.
+        Entries of auto-post templates get their journal entries created and
+        posted together.
+
+        Args:
+            occurrences: list of (template, occurrence date) tuples
+
+        Returns:
+            ops.recurring.entry recordset of the created entries
+        """
+        done_keys = self._get_existing_occurrence_keys(occurrences)
+        vals_list = []
+        for template, entry_date in occurrences:
+            key = (template.id, entry_date)
+            if key in done_keys:
+                continue
+            done_keys.add(key)
+            vals_list.append(template._prepare_entry_vals(entry_date))
+
+        entries = self.env['ops.recurring.entry'].create(vals_list)
 
         # Auto-post if configured
-        if self.journal_state == 'posted' and not self.require_approval:
-            entry.action_create_move()
-            entry.action_post_move()
+        to_post = entries.filtered(
+            lambda e: e.template_id.journal_state == 'posted' and not e.template_id.require_approval
+        )
+        if to_post:
+            to_post.action_create_move()
+            to_post.action_post_move()
 
-        return entry
+        return entries
 
     @api.model
     def cron_generate_recurring_entries(self):
         """
         Cron job to generate recurring entries.
-        Runs daily, creates entries for all active templates due today.
+        Runs daily, creates entries for every occurrence due up to today,
+        including occurrences missed while the cron was not running.
         """
         _logger.info("=" * 60)
         _logger.info("OPS Recurring Entry Generation Cron Started")
@@ -302,33 +396,57 @@ class OpsRecurringTemplate(models.Model):
         templates = self.search([
             ('state', '=', 'active'),
             ('next_execution_date', '<=', today),
-            '|',
-            ('date_end', '=', False),
-            ('date_end', '>=', today),
         ])
+        occurrences = templates._get_due_occurrences(today)
 
-        _logger.info("Found %d templates due for execution", len(templates))
+        _logger.info("Found %d templates due for execution (%d occurrences)",
+                     len(templates), len(occurrences))
 
         created_count = 0
         error_count = 0
+        failed_template_ids = set()
 
-        for template in templates:
-            try:
-                entry = template._generate_entry(template.next_execution_date)
-                created_count += 1
-                _logger.info("Generated entry %s from %s", entry.name, template.name)
-
-                # Check if template is complete
-                if template.date_end and template.next_execution_date >= template.date_end:
-                    template.action_complete()
-                    _logger.info("Template %s marked as completed", template.name)
+        for batch in split_every(RECURRING_BATCH_SIZE, occurrences):
+            # Never generate past a failed occurrence: it would leave a gap
+            batch = [occ for occ in batch if occ[0].id not in failed_template_ids]
+            if not batch:
+                continue
 
+            try:
+                with self.env.cr.savepoint():
+                    created_count += len(self._generate_entries(batch))
             except Exception as e:
-                error_count += 1
-                _logger.error("Error generating entry for %s: %s", template.name, e)
-                template.message_post(body=_(
-                    'Error generating recurring entry: %s'
-                ) % str(e))
+                _logger.warning(
+                    "Batch generation failed for %d occurrences (%s), retrying one by one",
+                    len(batch), e
+                )
+
+                # Isolate the failing occurrences so the rest of the batch is generated
+                for template, entry_date in batch:
+                    if template.id in failed_template_ids:
+                        continue
+                    try:
+                        with self.env.cr.savepoint():
+                            created_count += len(self._generate_entries([(template, entry_date)]))
+                    except Exception as e:
+                        error_count += 1
+                        failed_template_ids.add(template.id)
+                        _logger.error("Error generating entry for %s on %s: %s",
+                                      template.name, entry_date, e)
+                        template.message_post(body=_(
+                            'Error generating recurring entry for %(date)s: %(error)s'
+                        ) % {'date': entry_date, 'error': str(e)})
+
+            # Commit progress so a later failure or restart resumes from here
+            self.env.cr.commit()
+
+        # Templates past their end date are complete
+        finished = templates.filtered(
+            lambda t: t.id not in failed_template_ids and t.date_end and not t.next_execution_date
+        )
+        if finished:
+            finished.action_complete()
+            _logger.info("Templates marked as completed: %s", ', '.join(finished.mapped('name')))
 
         _logger.info("=" * 60)
         _logger.info("Recurring Cron Completed: Created %d, Errors %d", created_count, error_count)
@@ -476,6 +594,12 @@ class OpsRecurringEntry(models.Model):
         string='Approval Required'
     )
 
+    # One entry per template occurrence: keeps generation idempotent
+    _template_date_unique = models.Constraint(
+        'UNIQUE(template_id, entry_date)',
+        'A recurring entry already exists for this template and date!'
+    )
+
     @api.model_create_multi
     def create(self, vals_list):
         for vals in vals_list:
@@ -513,7 +637,12 @@ class OpsRecurringEntry(models.Model):
         self.activity_ids.action_done()
 
     def action_create_move(self):
-        """Create the journal entry from recurring entry."""
+        """Create the journal entries of the recurring entries in one batch."""
+        Move = self.env['account.move']
+        has_branch = 'ops_branch_id' in Move._fields
+        has_bu = 'ops_business_unit_id' in Move._fields
+
+        move_vals_list = []
         for entry in self:
             if entry.move_id:
                 raise UserError(_('Journal entry already created.'))
@@ -540,30 +669,33 @@ class OpsRecurringEntry(models.Model):
             }
 
             # Add OPS Matrix fields if they exist on account.move
-            if hasattr(self.env['account.move'], 'ops_branch_id'):
+            if has_branch:
                 move_vals['ops_branch_id'] = entry.ops_branch_id.id if entry.ops_branch_id else False
-            if hasattr(self.env['account.move'], 'ops_business_unit_id'):
+            if has_bu:
                 move_vals['ops_business_unit_id'] = entry.ops_business_unit_id.id if entry.ops_business_unit_id else False
 
-            move = self.env['account.move'].create(move_vals)
-            entry.write({'move_id': move.id})
+            move_vals_list.append(move_vals)
 
-            _logger.info("Created journal entry %s from recurring entry %s", move.name, entry.name)
+        moves = Move.create(move_vals_list)
+        for entry, move in zip(self, moves):
+            entry.move_id = move
+
+        _logger.info("Created %d journal entries from recurring entries", len(moves))
 
     def action_post_move(self):
-        """Post the journal entry."""
+        """Post the journal entries in one batch."""
         for entry in self:
             if not entry.move_id:
                 raise UserError(_('Please create journal entry first.'))
 
-            entry.move_id.action_post()
-            entry.write({'state': 'posted'})
+        self.move_id.action_post()
+        self.write({'state': 'posted'})
 
-            # Schedule reversal if configured
-            if entry.auto_reverse and entry.reversal_date:
-                entry.message_post(body=_(
-                    'Auto-reversal scheduled for %s'
-                ) % entry.reversal_date)
+        # Schedule reversal if configured
+        for entry in self.filtered(lambda e: e.auto_reverse and e.reversal_date):
+            entry.message_post(body=_(
+                'Auto-reversal scheduled for %s'
+            ) % entry.reversal_date)
 
     def action_reverse(self):
         """Create reversal entry."""
@@ -12,15 +12,20 @@ Provides shared utility functions for all OPS corporate reports:
 - Value classification (positive/negative/zero)
 - Aging bucket classification
 - Report context preparation
+- Server-side cursor streaming of large queries
 """
 
 from odoo import models, api
+from odoo.tools import SQL
 from datetime import datetime
 import colorsys
 import logging
 
 _logger = logging.getLogger(__name__)
 
+# Rows fetched per round-trip from a server-side cursor
+CURSOR_BATCH_SIZE = 2000
+
 
 class OpsReportHelpers(models.AbstractModel):
     """Abstract model providing helper functions for OPS corporate reports"""
@@ -663,3 +668,34 @@ class OpsReportHelpers(models.AbstractModel):
         }
 
         return status_map.get(status, 'ops-asset-status--active')
+
+    # =========================================================================
+    # STREAMING
+    # =========================================================================
+
+    @api.model
+    def iter_cursor_rows(self, query, batch_size=CURSOR_BATCH_SIZE):
+        """Iterate over the rows of a query through a server-side cursor.
+
+        Only one batch of rows is held in memory at a time. The caller must
+        flush the models involved before iterating.
+
+        Args:
+            query: SQL object of the SELECT to run
+            batch_size: Rows fetched per round-trip
+
+        Yields:
+            dict: One row per result
+        """
+        cr = self.env.cr
+        cursor_name = SQL.identifier(f"ops_stream_{self.env.uid}_{id(query)}")
+        cr.execute(SQL("DECLARE %s NO SCROLL CURSOR FOR %s", cursor_name, query))
+        try:
+            while True:
+                cr.execute(SQL("FETCH FORWARD %s FROM %s", batch_size, cursor_name))
+                rows = cr.dictfetchall()
+                if not rows:
+                    break
+                yield from rows
+        finally:
+            cr.execute(SQL("CLOSE %s", cursor_name))
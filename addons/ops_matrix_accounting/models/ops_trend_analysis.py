@@ -11,6 +11,7 @@ Author: OPS Matrix Framework
 
 from odoo import models, fields, api, _
 from odoo.exceptions import UserError, ValidationError
+from odoo.tools import SQL
 from datetime import date, timedelta
 from dateutil.relativedelta import relativedelta
 import logging
@@ -250,19 +251,21 @@ class OpsTrendAnalysis(models.TransientModel):
         """
         Fallback: Get trend data from real-time aggregation.
 
+        Both periods are summed by a single grouped query, then shaped into
+        the requested grouping before variances are derived.
+
         Returns: (data_dict, source_string)
         """
         self.ensure_one()
         _logger.info("⟳ Computing trend analysis from real-time data (snapshots unavailable)")
 
-        # Get current period data
-        current_data = self._aggregate_realtime(
-            self.current_period_start,
-            self.current_period_end
-        )
+        type_totals = self._get_realtime_type_totals({
+            'current': (self.current_period_start, self.current_period_end),
+            'comparison': (comp_start, comp_end),
+        })
 
-        # Get comparison period data
-        comparison_data = self._aggregate_realtime(comp_start, comp_end)
+        current_data = self._aggregate_realtime(type_totals, 'current')
+        comparison_data = self._aggregate_realtime(type_totals, 'comparison')
 
         # Calculate variances
         trend_data = self._calculate_variances(current_data, comparison_data)
@@ -380,31 +383,117 @@ class OpsTrendAnalysis(models.TransientModel):
             'transaction_count': sum(snapshots.mapped('transaction_count')),
         }
 
-    def _aggregate_realtime(self, date_from, date_to):
+    def _get_realtime_type_totals(self, periods):
         """
-        Aggregate financial data from real-time journal entries.
+        Sum posted move lines per period, branch, BU and account type.
 
-        This is a fallback when snapshots are not available.
+        Every period is a filtered aggregate of the same scan, so a single
+        query serves the whole comparison, and overlapping periods are each
+        counted in full. The domain goes through _search so record rules
+        apply.
+
+        Args:
+            periods: dict {period_key: (date_from, date_to)}
+
+        Returns:
+            dict: {(period_key, branch_id, bu_id, account_type): (debit, credit, count)}
         """
         self.ensure_one()
         MoveLine = self.env['account.move.line']
 
-        # Build domain
         domain = [
-            ('date', '>=', date_from),
-            ('date', '<=', date_to),
+            ('date', '>=', min(date_from for date_from, _date_to in periods.values())),
+            ('date', '<=', max(date_to for _date_from, date_to in periods.values())),
             ('company_id', '=', self.company_id.id),
             ('move_id.state', '=', 'posted'),
         ]
-
         if self.branch_ids:
             domain.append(('ops_branch_id', 'in', self.branch_ids.ids))
         if self.business_unit_ids:
             domain.append(('ops_business_unit_id', 'in', self.business_unit_ids.ids))
 
-        # Query based on grouping
+        MoveLine.flush_model([
+            'date', 'debit', 'credit', 'account_id', 'ops_branch_id', 'ops_business_unit_id',
+        ])
+        query = MoveLine._search(domain)
+        line_columns = query.select(*(
+            SQL.identifier(query.table, fname)
+            for fname in ('date', 'debit', 'credit', 'account_id', 'ops_branch_id', 'ops_business_unit_id')
+        ))
+
+        period_keys = list(periods)
+        aggregates = []
+        for period_key in period_keys:
+            date_from, date_to = periods[period_key]
+            in_period = SQL("aml.date BETWEEN %s AND %s", date_from, date_to)
+            aggregates += [
+                SQL("COALESCE(SUM(aml.debit) FILTER (WHERE %s), 0)", in_period),
+                SQL("COALESCE(SUM(aml.credit) FILTER (WHERE %s), 0)", in_period),
+                SQL("COUNT(*) FILTER (WHERE %s)", in_period),
+            ]
+
+        self.env.cr.execute(SQL(
+            """SELECT aml.ops_branch_id, aml.ops_business_unit_id, aml.account_id, %s
+                 FROM (%s) AS aml
+             GROUP BY aml.ops_branch_id, aml.ops_business_unit_id, aml.account_id""",
+            SQL(", ").join(aggregates), line_columns,
+        ))
+        rows = self.env.cr.fetchall()
+
+        account_types = {
+            account['id']: account['account_type']
+            for account in self.env['account.account'].browse(
+                list({row[2] for row in rows})
+            ).read(['account_type'])
+        }
+
+        type_totals = {}
+        for branch_id, bu_id, account_id, *sums in rows:
+            account_type = account_types.get(account_id)
+            for index, period_key in enumerate(period_keys):
+                debit, credit, count = sums[index * 3:index * 3 + 3]
+                if not count:
+                    continue
+                key = (period_key, branch_id, bu_id, account_type)
+                prev_debit, prev_credit, prev_count = type_totals.get(key, (0.0, 0.0, 0))
+                type_totals[key] = (prev_debit + debit, prev_credit + credit, prev_count + count)
+        return type_totals
+
+    def _aggregate_realtime(self, type_totals, period_key):
+        """
+        Shape one period of real-time totals into the requested grouping.
+
+        This is a fallback when snapshots are not available.
+
+        Args:
+            type_totals: result of _get_realtime_type_totals
+            period_key: period to extract
+
+        Returns:
+            dict with aggregated financial data, keyed like _aggregate_snapshots
+        """
+        self.ensure_one()
+
+        # {dimension_key: {account_type: [debit, credit, count]}}
+        grouped = {}
+        for (key_period, branch_id, bu_id, account_type), totals in type_totals.items():
+            if key_period != period_key:
+                continue
+            if self.group_by == 'total':
+                dimension_key = 'total'
+            elif self.group_by == 'branch':
+                dimension_key = branch_id
+            elif self.group_by == 'bu':
+                dimension_key = bu_id
+            else:
+                dimension_key = (branch_id, bu_id)
+            by_type = grouped.setdefault(dimension_key, {})
+            type_sum = by_type.setdefault(account_type, [0.0, 0.0, 0])
+            for index, value in enumerate(totals):
+                type_sum[index] += value
+
         if self.group_by == 'total':
-            return {'total': self._compute_metrics_from_lines(domain)}
+            return {'total': self._compute_metrics_from_totals(grouped.get('total', {}))}
 
         elif self.group_by == 'branch':
             result = {}
@@ -413,13 +502,12 @@ class OpsTrendAnalysis(models.TransientModel):
             ])
 
             for branch in branches:
-                branch_domain = domain + [('ops_branch_id', '=', branch.id)]
                 result[f'branch_{branch.id}'] = {
                     'dimension': 'branch',
                     'dimension_id': branch.id,
                     'dimension_code': branch.code,
                     'dimension_name': branch.name,
-                    **self._compute_metrics_from_lines(branch_domain)
+                    **self._compute_metrics_from_totals(grouped.get(branch.id, {}))
                 }
             return result
 
@@ -430,40 +518,45 @@ class OpsTrendAnalysis(models.TransientModel):
             ])
 
             for bu in bus:
-                bu_domain = domain + [('ops_business_unit_id', '=', bu.id)]
                 result[f'bu_{bu.id}'] = {
                     'dimension': 'bu',
                     'dimension_id': bu.id,
                     'dimension_code': bu.code,
                     'dimension_name': bu.name,
-                    **self._compute_metrics_from_lines(bu_domain)
+                    **self._compute_metrics_from_totals(grouped.get(bu.id, {}))
                 }
             return result
 
-        # branch_bu not implemented for realtime (too expensive)
-        return {}
+        elif self.group_by == 'branch_bu':
+            result = {}
+            pairs = [pair for pair in grouped if pair[0] and pair[1]]
+            branches = self.env['ops.branch'].browse([branch_id for branch_id, _bu_id in pairs])
+            bus = self.env['ops.business.unit'].browse([bu_id for _branch_id, bu_id in pairs])
+            for branch, bu in zip(branches, bus):
+                result[f'branch_{branch.id}_bu_{bu.id}'] = {
+                    'dimension': 'branch_bu',
+                    'branch_id': branch.id,
+                    'branch_code': branch.code,
+                    'branch_name': branch.name,
+                    'bu_id': bu.id,
+                    'bu_code': bu.code,
+                    'bu_name': bu.name,
+                    **self._compute_metrics_from_totals(grouped[(branch.id, bu.id)])
+                }
+            return result
 
-    def _compute_metrics_from_lines(self, domain):
-        """Compute financial metrics from account move lines."""
-        MoveLine = self.env['account.move.line']
+        return {}
 
-        # Aggregate by account type
-        # Odoo 19 _read_group returns list of tuples: (group_value, agg1, agg2, ...)
-        results = MoveLine._read_group(
-            domain=domain,
-            groupby=['account_id.account_type'],
-            aggregates=['credit:sum', 'debit:sum', '__count']
-        )
+    def _compute_metrics_from_totals(self, type_totals):
+        """
+        Compute financial metrics from debit/credit totals per account type.
 
+        Args:
+            type_totals: dict {account_type: (debit, credit, count)}
+        """
         metrics = self._empty_metrics()
 
-        for result in results:
-            # Odoo 19: result is tuple (account_type, credit_sum, debit_sum, count)
-            account_type = result[0]
-            credit = result[1] or 0
-            debit = result[2] or 0
-            count = result[3] or 0
-
+        for account_type, (debit, credit, count) in type_totals.items():
             if account_type in ['income', 'income_other']:
                 metrics['revenue'] += credit - debit
             elif account_type == 'expense_direct_cost':
@@ -10,6 +10,6 @@ from . import ops_xlsx_abstract
 
 # XLSX Report Generators (Phase 5 - Corporate Design System)
 from . import ops_asset_register_xlsx
-# from . import ops_general_ledger_xlsx  # TODO: Update to use ops.xlsx.abstract
-# from . import ops_financial_matrix_xlsx  # TODO: Update to use ops.xlsx.abstract
-# from . import ops_treasury_report_xlsx  # TODO: Update to use ops.xlsx.abstract
+from . import ops_general_ledger_xlsx
+from . import ops_financial_matrix_xlsx
+from . import ops_treasury_report_xlsx
@@ -25,7 +25,8 @@ class OpsFinancialMatrixXlsx(models.AbstractModel):
     """
     _name = 'report.ops_matrix_accounting.report_financial_matrix_xlsx'
     _description = 'Financial Matrix XLSX Report'
-    _inherit = 'report.report_xlsx.abstract'
+    _inherit = 'ops.xlsx.abstract'
+    _report_model = 'ops.general.ledger.wizard.enhanced'
 
     def generate_xlsx_report(self, workbook, data, wizards):
         """
@@ -97,6 +98,7 @@ class OpsFinancialMatrixXlsx(models.AbstractModel):
                 self.meta_label = wb.add_format({'bold': True})
                 self.meta_value = wb.add_format({})
                 self.text = wb.add_format({'border': 1})
+                self.text_bold = wb.add_format({'bold': True, 'border': 1})
                 self.currency = wb.add_format({'num_format': '#,##0.00', 'border': 1})
                 self.currency_positive = wb.add_format({'num_format': '#,##0.00', 'border': 1, 'font_color': 'green'})
                 self.currency_negative = wb.add_format({'num_format': '#,##0.00', 'border': 1, 'font_color': 'red'})
@@ -234,6 +236,61 @@ class OpsFinancialMatrixXlsx(models.AbstractModel):
         worksheet.write(row, 6, totals.get('ending_debit', 0), styles.grand_total_currency)
         worksheet.write(row, 7, totals.get('ending_credit', 0), styles.grand_total_currency)
 
+    def _get_statement_rows(self, data, section):
+        """
+        Get the rows of one statement section ('income', 'expense', 'asset',
+        'liability' or 'equity').
+
+        Uses the account tree already flattened by ops.account.tree when the
+        data carries it, otherwise the flat per-account-type sections.
+        """
+        hierarchy = data.get('hierarchy') or {}
+        key = f'{section}_hierarchy'
+        if data.get('use_hierarchy') and key in hierarchy:
+            return hierarchy[key]
+
+        AccountTree = self.env['ops.account.tree']
+        return [
+            {
+                'type': 'account',
+                'indent': 0,
+                'code': acc.get('account_code', ''),
+                'name': acc.get('account_name', ''),
+                'balance': acc.get('balance', 0),
+            }
+            for sec in data.get('sections', [])
+            if AccountTree.classify_account_type(sec.get('type', '')) == section
+            for acc in sec.get('accounts', [])
+        ]
+
+    def _write_statement_section(self, worksheet, styles, row, rows, amount_style, signed=False):
+        """
+        Write group, account and subtotal rows of one statement section.
+
+        Returns:
+            tuple (next row, sum of the account amounts written)
+        """
+        total = 0
+        for line in rows:
+            amount = line.get('balance', 0)
+            if not signed:
+                amount = abs(amount)
+            name = '    ' * line.get('indent', 0) + (line.get('name') or '')
+            line_type = line.get('type')
+            if line_type == 'group':
+                worksheet.write(row, 0, line.get('code', ''), styles.text_bold)
+                worksheet.write(row, 1, name, styles.text_bold)
+            elif line_type == 'subtotal':
+                worksheet.write(row, 1, name, styles.total)
+                worksheet.write(row, 2, amount, styles.total_currency)
+            else:
+                worksheet.write(row, 0, line.get('code', ''), styles.text)
+                worksheet.write(row, 1, name, styles.text)
+                worksheet.write(row, 2, amount, amount_style)
+                total += amount
+            row += 1
+        return row, total
+
     def _generate_pl_sheet(self, workbook, worksheet, styles, data):
         """Generate Profit & Loss sheet."""
         row = self._write_header(worksheet, styles, data)
@@ -242,60 +299,30 @@ class OpsFinancialMatrixXlsx(models.AbstractModel):
         worksheet.set_column(1, 1, 40)  # Name
         worksheet.set_column(2, 2, 15)  # Amount
 
-        # Income Section
-        worksheet.merge_range(row, 0, row, 2, 'INCOME', styles.subheader)
-        row += 1
-
         headers = ['Code', 'Account Name', 'Amount']
-        for col, header in enumerate(headers):
-            worksheet.write(row, col, header, styles.header)
-        row += 1
-
-        sections = data.get('sections', [])
-        income_total = 0
-        expense_total = 0
-
-        for section in sections:
-            section_type = section.get('type', '')
-            if 'income' in section_type:
-                for acc in section.get('accounts', []):
-                    worksheet.write(row, 0, acc.get('account_code', ''), styles.text)
-                    worksheet.write(row, 1, acc.get('account_name', ''), styles.text)
-                    amount = abs(acc.get('balance', 0))
-                    worksheet.write(row, 2, amount, styles.currency_positive)
-                    income_total += amount
-                    row += 1
-
-        worksheet.write(row, 1, 'Total Income', styles.total)
-        worksheet.write(row, 2, income_total, styles.total_currency)
-        row += 2
+        totals = {}
 
-        # Expense Section
-        worksheet.merge_range(row, 0, row, 2, 'EXPENSES', styles.subheader)
-        row += 1
+        for section, title, amount_style in (
+            ('income', 'INCOME', styles.currency_positive),
+            ('expense', 'EXPENSES', styles.currency_negative),
+        ):
+            worksheet.merge_range(row, 0, row, 2, title, styles.subheader)
+            row += 1
+            for col, header in enumerate(headers):
+                worksheet.write(row, col, header, styles.header)
+            row += 1
 
-        for col, header in enumerate(headers):
-            worksheet.write(row, col, header, styles.header)
-        row += 1
+            row, totals[section] = self._write_statement_section(
+                worksheet, styles, row, self._get_statement_rows(data, section), amount_style,
+            )
 
-        for section in sections:
-            section_type = section.get('type', '')
-            if 'expense' in section_type:
-                for acc in section.get('accounts', []):
-                    worksheet.write(row, 0, acc.get('account_code', ''), styles.text)
-                    worksheet.write(row, 1, acc.get('account_name', ''), styles.text)
-                    amount = abs(acc.get('balance', 0))
-                    worksheet.write(row, 2, amount, styles.currency_negative)
-                    expense_total += amount
-                    row += 1
-
-        worksheet.write(row, 1, 'Total Expenses', styles.total)
-        worksheet.write(row, 2, expense_total, styles.total_currency)
-        row += 2
+            worksheet.write(row, 1, f'Total {title.title()}', styles.total)
+            worksheet.write(row, 2, totals[section], styles.total_currency)
+            row += 2
 
         # Net Profit
         summary = data.get('summary', {})
-        net_income = summary.get('net_income', income_total - expense_total)
+        net_income = summary.get('net_income', totals['income'] - totals['expense'])
         worksheet.write(row, 1, 'NET PROFIT / (LOSS)', styles.grand_total)
         net_style = styles.grand_total_currency
         worksheet.write(row, 2, net_income, net_style)
@@ -308,68 +335,28 @@ class OpsFinancialMatrixXlsx(models.AbstractModel):
         worksheet.set_column(1, 1, 40)
         worksheet.set_column(2, 2, 15)
 
-        sections = data.get('sections', [])
         summary = data.get('summary', {})
-
-        # Assets
-        worksheet.merge_range(row, 0, row, 2, 'ASSETS', styles.subheader)
-        row += 1
-
         headers = ['Code', 'Account Name', 'Amount']
-        for col, header in enumerate(headers):
-            worksheet.write(row, col, header, styles.header)
-        row += 1
-
-        asset_total = 0
-        for section in sections:
-            if section.get('type', '').startswith('asset'):
-                for acc in section.get('accounts', []):
-                    worksheet.write(row, 0, acc.get('account_code', ''), styles.text)
-                    worksheet.write(row, 1, acc.get('account_name', ''), styles.text)
-                    worksheet.write(row, 2, acc.get('balance', 0), styles.currency)
-                    asset_total += acc.get('balance', 0)
-                    row += 1
-
-        worksheet.write(row, 1, 'Total Assets', styles.total)
-        worksheet.write(row, 2, summary.get('total_assets', asset_total), styles.total_currency)
-        row += 2
-
-        # Liabilities
-        worksheet.merge_range(row, 0, row, 2, 'LIABILITIES', styles.subheader)
-        row += 1
-        for col, header in enumerate(headers):
-            worksheet.write(row, col, header, styles.header)
-        row += 1
-
-        for section in sections:
-            if section.get('type', '').startswith('liability'):
-                for acc in section.get('accounts', []):
-                    worksheet.write(row, 0, acc.get('account_code', ''), styles.text)
-                    worksheet.write(row, 1, acc.get('account_name', ''), styles.text)
-                    worksheet.write(row, 2, abs(acc.get('balance', 0)), styles.currency)
-                    row += 1
-
-        worksheet.write(row, 1, 'Total Liabilities', styles.total)
-        worksheet.write(row, 2, summary.get('total_liabilities', 0), styles.total_currency)
-        row += 2
 
-        # Equity
-        worksheet.merge_range(row, 0, row, 2, 'EQUITY', styles.subheader)
-        row += 1
-        for col, header in enumerate(headers):
-            worksheet.write(row, col, header, styles.header)
-        row += 1
+        for section, title, summary_key in (
+            ('asset', 'ASSETS', 'total_assets'),
+            ('liability', 'LIABILITIES', 'total_liabilities'),
+            ('equity', 'EQUITY', 'total_equity'),
+        ):
+            worksheet.merge_range(row, 0, row, 2, title, styles.subheader)
+            row += 1
+            for col, header in enumerate(headers):
+                worksheet.write(row, col, header, styles.header)
+            row += 1
 
-        for section in sections:
-            if section.get('type', '').startswith('equity'):
-                for acc in section.get('accounts', []):
-                    worksheet.write(row, 0, acc.get('account_code', ''), styles.text)
-                    worksheet.write(row, 1, acc.get('account_name', ''), styles.text)
-                    worksheet.write(row, 2, abs(acc.get('balance', 0)), styles.currency)
-                    row += 1
+            row, section_total = self._write_statement_section(
+                worksheet, styles, row, self._get_statement_rows(data, section),
+                styles.currency, signed=section == 'asset',
+            )
 
-        worksheet.write(row, 1, 'Total Equity', styles.total)
-        worksheet.write(row, 2, summary.get('total_equity', 0), styles.total_currency)
+            worksheet.write(row, 1, f'Total {title.title()}', styles.total)
+            worksheet.write(row, 2, summary.get(summary_key, section_total), styles.total_currency)
+            row += 2
 
     def _generate_cf_sheet(self, workbook, worksheet, styles, data):
         """Generate Cash Flow sheet."""
@@ -477,47 +477,7 @@ class OpsFinancialReportParser(models.AbstractModel):
         Used for Chart of Accounts display with proper indentation.
         Returns list of dicts with 'level' field indicating depth.
         """
-        if not lines:
-            return []
-
-        # Group by parent
-        by_parent = {}
-        root_items = []
-
-        for line in lines:
-            parent_id = line.get(parent_field)
-            if parent_id:
-                if parent_id not in by_parent:
-                    by_parent[parent_id] = []
-                by_parent[parent_id].append(line)
-            else:
-                root_items.append(line)
-
-        # Sort root items
-        if sort_by:
-            root_items.sort(key=lambda x: x.get(sort_by, ''))
-
-        # Build flattened hierarchy
-        result = []
-
-        def add_with_children(item, level=0):
-            item['level'] = level
-            item['row_class'] = f"level-{level}"
-            result.append(item)
-
-            # Add children
-            item_id = item.get('id') or item.get('account_id')
-            if item_id and item_id in by_parent:
-                children = by_parent[item_id]
-                if sort_by:
-                    children.sort(key=lambda x: x.get(sort_by, ''))
-                for child in children:
-                    add_with_children(child, level + 1)
-
-        for root in root_items:
-            add_with_children(root)
-
-        return result
+        return self.env['ops.account.tree'].flatten_by_parent(lines, parent_field, sort_by)
 
     @api.model
     def _get_report_values(self, docids, data=None):
@@ -1151,35 +1111,25 @@ class OpsFinancialReportParser(models.AbstractModel):
         }
 
     def _process_pl_data(self, wizard, domain):
-        MoveLine = self.env['account.move.line']
-        grouped_data = MoveLine._read_group(
-            domain=domain,
-            groupby=['account_id'],
-            aggregates=['debit:sum', 'credit:sum', 'balance:sum']
-        )
+        leaves = self.env['ops.account.tree'].get_leaf_balances(domain)
         income_lines = []
         expense_lines = []
         income_total = 0.0
         expense_total = 0.0
         cogs_total = 0.0
-        for result in grouped_data:
-            account = result[0] if result else None
-            debit_sum = result[1] if len(result) > 1 else 0.0
-            credit_sum = result[2] if len(result) > 2 else 0.0
-            if not account:
-                continue
-            account_key = f"{account.code} - {account.name}"
-            account_type = account.account_type
+        for leaf in leaves.values():
+            account_key = f"{leaf['account_code']} - {leaf['account_name']}"
+            account_type = leaf['account_type']
             if account_type in ['income', 'income_other']:
-                amount = (credit_sum or 0.0) - (debit_sum or 0.0)
+                amount = leaf['credit'] - leaf['debit']
                 income_total += amount
-                income_lines.append({'account': account_key, 'account_id': account.id, 'amount': amount})
+                income_lines.append({'account': account_key, 'account_id': leaf['account_id'], 'amount': amount})
             elif account_type in ['expense', 'expense_depreciation', 'expense_direct_cost']:
-                amount = (debit_sum or 0.0) - (credit_sum or 0.0)
+                amount = leaf['debit'] - leaf['credit']
                 expense_total += amount
                 if account_type == 'expense_direct_cost':
                     cogs_total += amount
-                expense_lines.append({'account': account_key, 'account_id': account.id, 'amount': amount})
+                expense_lines.append({'account': account_key, 'account_id': leaf['account_id'], 'amount': amount})
         gross_profit = income_total - cogs_total
         net_profit = income_total - expense_total
         return {
@@ -1202,22 +1152,13 @@ class OpsFinancialReportParser(models.AbstractModel):
         }
 
     def _process_bs_data(self, wizard, domain):
-        MoveLine = self.env['account.move.line']
-        grouped_data = MoveLine._read_group(
-            domain=domain,
-            groupby=['account_id'],
-            aggregates=['debit:sum', 'credit:sum', 'balance:sum']
-        )
+        leaves = self.env['ops.account.tree'].get_leaf_balances(domain)
         asset_lines, liability_lines, equity_lines = [], [], []
         asset_total, liability_total, equity_total = 0.0, 0.0, 0.0
-        for result in grouped_data:
-            account = result[0] if result else None
-            balance_sum = result[3] if len(result) > 3 else 0.0
-            if not account:
-                continue
-            account_key = f"{account.code} - {account.name}"
-            account_type = account.account_type
-            balance = balance_sum or 0.0
+        for leaf in leaves.values():
+            account_key = f"{leaf['account_code']} - {leaf['account_name']}"
+            account_type = leaf['account_type']
+            balance = leaf['balance']
             if account_type in ['asset_receivable', 'asset_cash', 'asset_current',
                                'asset_prepayments', 'asset_fixed', 'asset_non_current']:
                 asset_total += balance
@@ -1280,30 +1221,19 @@ class OpsFinancialReportParser(models.AbstractModel):
         }
 
     def _process_tb_data(self, wizard, domain):
-        MoveLine = self.env['account.move.line']
-        grouped_data = MoveLine._read_group(
-            domain=domain,
-            groupby=['account_id'],
-            aggregates=['debit:sum', 'credit:sum', 'balance:sum']
-        )
+        leaves = self.env['ops.account.tree'].get_leaf_balances(domain)
         lines = []
         total_debit = 0.0
         total_credit = 0.0
-        for result in grouped_data:
-            account = result[0] if result else None
-            debit_sum = result[1] if len(result) > 1 else 0.0
-            credit_sum = result[2] if len(result) > 2 else 0.0
-            balance_sum = result[3] if len(result) > 3 else 0.0
-            if not account:
-                continue
+        for leaf in leaves.values():
             lines.append({
-                'account': f"{account.code} - {account.name}",
-                'debit': debit_sum or 0.0,
-                'credit': credit_sum or 0.0,
-                'balance': balance_sum or 0.0,
+                'account': f"{leaf['account_code']} - {leaf['account_name']}",
+                'debit': leaf['debit'],
+                'credit': leaf['credit'],
+                'balance': leaf['balance'],
             })
-            total_debit += debit_sum or 0.0
-            total_credit += credit_sum or 0.0
+            total_debit += leaf['debit']
+            total_credit += leaf['credit']
         return {
             'title': 'Trial Balance',
             'date_from': wizard.date_from,
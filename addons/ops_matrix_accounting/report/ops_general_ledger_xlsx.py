@@ -15,11 +15,12 @@ from .excel_styles import OPSExcelStyles, COLUMN_WIDTHS, apply_standard_widths
 class OpsGeneralLedgerXlsx(models.AbstractModel):
     """
     General Ledger XLSX Export.
-    Uses in-memory generation to maintain "Zero DB Bloat" design.
+    Written top to bottom in constant memory (see ops.xlsx.abstract).
     """
     _name = 'report.ops_matrix_accounting.report_general_ledger_xlsx'
     _description = 'General Ledger XLSX Report'
-    _inherit = 'report.report_xlsx.abstract'
+    _inherit = 'ops.xlsx.abstract'
+    _report_model = 'ops.general.ledger.wizard.enhanced'
 
     def generate_xlsx_report(self, workbook, data, partners):
         """
@@ -154,5 +155,5 @@ class OpsGeneralLedgerXlsx(models.AbstractModel):
         This method is called by the abstract XLSX report class.
         """
         if data:
-            return self.env['ops.general.ledger.wizard'].browse(docids)
-        return self.env['ops.general.ledger.wizard']
+            return self.env[self._report_model].browse(docids)
+        return self.env[self._report_model]
@@ -23,7 +23,8 @@ class OpsTreasuryReportXlsx(models.AbstractModel):
     """
     _name = 'report.ops_matrix_accounting.report_treasury_xlsx'
     _description = 'Treasury Intelligence XLSX Report'
-    _inherit = 'report.report_xlsx.abstract'
+    _inherit = 'ops.xlsx.abstract'
+    _report_model = 'ops.treasury.report.wizard'
 
     def generate_xlsx_report(self, workbook, data, wizards):
         """
@@ -40,8 +41,9 @@ class OpsTreasuryReportXlsx(models.AbstractModel):
             if not wizard or not wizard.exists():
                 raise UserError("Invalid wizard context for Treasury report export.")
 
-            # Get report data with security checks
-            report_data = wizard._get_report_data()
+            # Reuse the data the wizard already built (with its security
+            # checks) instead of computing it twice
+            report_data = data if data and data.get('report_type') else wizard._get_report_data()
             if not report_data:
                 raise UserError("No data available for export.")
 
@@ -383,11 +385,36 @@ class OpsTreasuryReportXlsx(models.AbstractModel):
             worksheet.write(row, 3, '', formats['total_label'])
             worksheet.write(row, 4, '', formats['total_label'])
 
+        # Open PDCs per bank and per branch
+        row += 2
+        row = self._write_summary_table(worksheet, formats, row, 'Bank', data.get('bank_summary', []))
+        row += 1
+        self._write_summary_table(worksheet, formats, row, 'Branch', data.get('branch_summary', []))
+
         # Set page layout
         worksheet.set_landscape()
         worksheet.set_paper(9)  # A4
         worksheet.fit_to_pages(1, 0)
 
+    def _write_summary_table(self, worksheet, formats, row, label, summary):
+        """Write a count/amount summary table, return the next free row."""
+        worksheet.merge_range(row, 0, row, 4, f"Open PDCs by {label}", formats['filter_bar'])
+        row += 1
+        for col, header in enumerate([label, 'Type', 'Count', 'Amount']):
+            worksheet.write(row, col, header, formats['table_header_num' if col == 3 else 'table_header'])
+        row += 1
+
+        type_labels = {'inbound': 'Receivable', 'outbound': 'Payable'}
+        for index, line in enumerate(summary):
+            alt_row = index % 2 == 1
+            text_fmt = formats['text_alt'] if alt_row else formats['text']
+            worksheet.write(row, 0, line['name'], text_fmt)
+            worksheet.write(row, 1, type_labels.get(line['pdc_type'], ''), text_fmt)
+            worksheet.write(row, 2, line['count'], text_fmt)
+            worksheet.write(row, 3, line['total'], formats['number_alt'] if alt_row else formats['number'])
+            row += 1
+        return row
+
     # ============================================
     # PDCs IN HAND REPORT
     # ============================================
@@ -8,6 +8,15 @@ Uses xlsxwriter directly for Excel generation.
 
 This replaces the dependency on OCA's report_xlsx module which is not available.
 
+Workbooks are written in xlsxwriter constant_memory mode to a temporary
+file, so memory stays bounded regardless of row count: each row is flushed
+to disk as soon as the next one starts. Writers must therefore fill each
+worksheet top to bottom (set _xlsx_constant_memory = False otherwise).
+Large datasets are fed from a server-side cursor
+(ops.report.helpers.iter_cursor_rows) and the finished file is streamed to
+the HTTP response or stored as raw attachment bytes, never base64-encoded
+in between.
+
 Phase 5: Corporate Excel Design System
 v19.0.5.0
 
@@ -16,8 +25,13 @@ Author: OPS Matrix Framework
 
 from odoo import models
 from odoo.exceptions import UserError
-from odoo.http import request
-import io
+from odoo.http import request, content_disposition
+from odoo.tools import SQL
+from werkzeug.wsgi import wrap_file
+import hashlib
+import os
+import shutil
+import tempfile
 import logging
 
 _logger = logging.getLogger(__name__)
@@ -28,6 +42,11 @@ except ImportError:
     _logger.warning("xlsxwriter not installed. XLSX reports will not work.")
     xlsxwriter = None
 
+XLSX_MIMETYPE = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+
+# Bytes read at a time when a workbook file is copied into the filestore
+ATTACHMENT_CHUNK_SIZE = 1024 * 1024
+
 
 class OPSXlsxAbstract(models.AbstractModel):
     """
@@ -49,6 +68,9 @@ class OPSXlsxAbstract(models.AbstractModel):
     _name = 'ops.xlsx.abstract'
     _description = 'Abstract XLSX Report Base'
 
+    # Writers that go back to earlier rows must disable constant_memory
+    _xlsx_constant_memory = True
+
     def _get_objs_for_report(self, docids, data):
         """
         Get objects for report generation.
@@ -98,28 +120,136 @@ class OPSXlsxAbstract(models.AbstractModel):
         # Get objects for report
         objects = self._get_objs_for_report(docids, data)
 
-        # Create in-memory file
-        output = io.BytesIO()
+        output, size = self._write_xlsx_file(
+            lambda workbook: self.generate_xlsx_report(workbook, data, objects)
+        )
+        # The report engine expects bytes: read the finished file once
+        with output:
+            file_content = output.read()
 
-        # Create workbook
-        workbook = xlsxwriter.Workbook(output, {'in_memory': True})
+        return file_content, 'xlsx'
+
+    # =========================================================================
+    # STREAMING EXPORT
+    # =========================================================================
+
+    def _write_xlsx_file(self, writer):
+        """
+        Write a workbook to a temporary file.
+
+        Args:
+            writer: Callable receiving the xlsxwriter.Workbook to fill
+
+        Returns:
+            tuple: (file object positioned at start, file size in bytes).
+            The caller owns the file and must close it.
+        """
+        if xlsxwriter is None:
+            raise UserError("xlsxwriter Python library is not installed. Cannot generate Excel reports.")
 
+        output = tempfile.TemporaryFile(suffix='.xlsx')
+        workbook = xlsxwriter.Workbook(output, {
+            'constant_memory': self._xlsx_constant_memory,
+            'tmpdir': tempfile.gettempdir(),
+        })
         try:
-            # Call subclass implementation
-            self.generate_xlsx_report(workbook, data, objects)
+            try:
+                writer(workbook)
+            finally:
+                workbook.close()
+        except UserError:
+            output.close()
+            raise
         except Exception as e:
+            output.close()
             _logger.error(f"Error generating XLSX report {self._name}: {str(e)}", exc_info=True)
             raise UserError(f"Error generating Excel report: {str(e)}")
-        finally:
-            # Close workbook
-            workbook.close()
 
-        # Get file content
+        size = output.tell()
         output.seek(0)
-        file_content = output.read()
-        output.close()
+        return output, size
 
-        return file_content, 'xlsx'
+    def _xlsx_stream_response(self, output, size, filename):
+        """
+        Stream a finished workbook file as an HTTP download.
+
+        The file is sent in chunks and closed once the response is consumed.
+
+        Args:
+            output: File object returned by _write_xlsx_file()
+            size: File size in bytes
+            filename: Download file name
+
+        Returns:
+            Response: Streaming file download
+        """
+        response = request.make_response(
+            wrap_file(request.httprequest.environ, output),
+            headers=[
+                ('Content-Type', XLSX_MIMETYPE),
+                ('Content-Length', str(size)),
+                ('Content-Disposition', content_disposition(filename)),
+            ],
+        )
+        response.direct_passthrough = True
+        return response
+
+    def _xlsx_attachment(self, output, filename, record=None):
+        """
+        Store a finished workbook file as an attachment.
+
+        With file storage (the default) the workbook is hashed and copied
+        into the filestore in chunks, so it is never held in memory as a
+        whole. Database storage needs the bytes in the row and falls back
+        to a single read.
+
+        Args:
+            output: File object returned by _write_xlsx_file() (closed here)
+            filename: Attachment name
+            record: Optional record to link the attachment to
+
+        Returns:
+            ir.attachment record
+        """
+        Attachment = self.env['ir.attachment']
+        values = {
+            'name': filename,
+            'type': 'binary',
+            'mimetype': XLSX_MIMETYPE,
+        }
+        if record:
+            values.update({'res_model': record._name, 'res_id': record.id})
+
+        with output:
+            if Attachment._storage() != 'file':
+                return Attachment.create(dict(values, raw=output.read()))
+
+            sha = hashlib.sha1()
+            for chunk in iter(lambda: output.read(ATTACHMENT_CHUNK_SIZE), b''):
+                sha.update(chunk)
+            size = output.tell()
+            checksum = sha.hexdigest()
+
+            # Same layout as ir.attachment._file_write(); identical content
+            # is already stored under its checksum
+            store_fname = f'{checksum[:2]}/{checksum}'
+            full_path = Attachment._full_path(store_fname)
+            if not os.path.exists(full_path):
+                os.makedirs(os.path.dirname(full_path), exist_ok=True)
+                output.seek(0)
+                with open(full_path, 'wb') as target:
+                    shutil.copyfileobj(output, target, ATTACHMENT_CHUNK_SIZE)
+                Attachment._mark_for_gc(store_fname)
+
+        attachment = Attachment.create(values)
+        # store_fname, checksum and file_size cannot be written through the ORM
+        attachment.flush_recordset()
+        self.env.cr.execute(SQL(
+            "UPDATE ir_attachment SET store_fname = %s, checksum = %s, file_size = %s WHERE id = %s",
+            store_fname, checksum, size, attachment.id,
+        ))
+        attachment.invalidate_recordset(['store_fname', 'checksum', 'file_size', 'raw', 'datas'])
+        return attachment
 
     def _render_xlsx(self, docids, data=None):
         """
@@ -4,3 +4,7 @@ from . import test_consolidated_reporting
 from . import test_analytic_integration
 from . import test_matrix_snapshot
 from . import test_trend_analysis
+from . import test_asset_depreciation
+from . import test_recurring_entries
+from . import test_journal_daily_balance
+from . import test_pdc_batch
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""
+Asset Depreciation Tests
+Tests batched schedule generation and cumulative depreciation
+"""
+
+from odoo.tests import tagged, TransactionCase
+from datetime import date
+import logging
+
+_logger = logging.getLogger(__name__)
+
+
+@tagged('post_install', '-at_install', 'ops_assets')
+class TestAssetDepreciation(TransactionCase):
+    """Test depreciation schedule generation on asset batches."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        cls.company = cls.env['res.company'].create({'name': 'Asset Test Co'})
+
+        cls.branch = cls.env['ops.branch'].create({
+            'name': 'Asset Branch',
+            'code': 'AST-BR',
+            'company_id': cls.company.id,
+        })
+
+        cls.category = cls.env['ops.asset.category'].create({
+            'name': 'Test Equipment',
+            'company_id': cls.company.id,
+            'depreciation_method': 'straight_line',
+            'method_number': 12,
+            'method_period': 1,
+            'prorata': False,
+        })
+
+        cls.assets = cls.env['ops.asset'].create([
+            {
+                'name': f'Test Asset {i}',
+                'company_id': cls.company.id,
+                'category_id': cls.category.id,
+                'purchase_date': date(2024, 1, 1),
+                'purchase_value': 1200.0 * i,
+                'ops_branch_id': cls.branch.id,
+            }
+            for i in range(1, 4)
+        ])
+
+    def test_schedule_generated_for_whole_recordset(self):
+        """Every asset of the recordset gets its schedule in one call."""
+        self.assets.generate_depreciation_schedule()
+
+        for asset in self.assets:
+            self.assertEqual(len(asset.depreciation_ids), 12)
+            self.assertAlmostEqual(
+                sum(asset.depreciation_ids.mapped('amount')), asset.depreciable_value, places=2
+            )
+
+    def test_cumulative_is_running_total(self):
+        """Cumulative depreciation is the prefix sum over the sequence."""
+        self.assets.generate_depreciation_schedule()
+
+        for asset in self.assets:
+            running_total = 0.0
+            for line in asset.depreciation_ids.sorted('sequence'):
+                running_total += line.amount
+                self.assertAlmostEqual(line.cumulative_depreciation, running_total, places=2)
+
+    def test_cumulative_recomputed_on_amount_change(self):
+        """Changing one line's amount shifts the cumulative of later lines only."""
+        asset = self.assets[0]
+        asset.generate_depreciation_schedule()
+        lines = asset.depreciation_ids.sorted('sequence')
+        before = lines.mapped('cumulative_depreciation')
+
+        lines[5].write({'amount': lines[5].amount + 10.0})
+
+        after = lines.mapped('cumulative_depreciation')
+        self.assertEqual(after[:5], before[:5])
+        for old, new in zip(before[5:], after[5:]):
+            self.assertAlmostEqual(new, old + 10.0, places=2)
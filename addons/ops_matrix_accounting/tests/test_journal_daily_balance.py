@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""
+Journal Daily Balance Tests
+Tests carry-forward maintenance on posting and the cash book opening balance
+"""
+
+from odoo.tests import tagged, TransactionCase
+from dateutil.relativedelta import relativedelta
+from odoo import fields
+from unittest import SkipTest
+import logging
+
+_logger = logging.getLogger(__name__)
+
+
+@tagged('post_install', '-at_install', 'ops_daily_reports')
+class TestJournalDailyBalance(TransactionCase):
+    """Test the per-(journal, account, branch, day) closing balance table."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        company = cls.env.company
+        cls.journal = cls.env['account.journal'].search([
+            ('type', '=', 'cash'),
+            ('company_id', '=', company.id),
+        ], limit=1)
+        counterpart = cls.env['account.account'].search([
+            ('company_ids', 'in', [company.id]),
+            ('account_type', 'in', ('asset_current', 'liability_current')),
+            ('id', '!=', cls.journal.default_account_id.id),
+        ], limit=1)
+        if not cls.journal.default_account_id or not counterpart:
+            raise SkipTest("No cash journal / accounts in the test company")
+
+        cls.today = fields.Date.today()
+        cls.cash_account = cls.journal.default_account_id
+        cls.counterpart = counterpart
+        cls.DailyBalance = cls.env['ops.journal.daily.balance']
+
+    def _create_move(self, date, amount):
+        return self.env['account.move'].create({
+            'journal_id': self.journal.id,
+            'date': date,
+            'line_ids': [
+                (0, 0, {'account_id': self.cash_account.id, 'debit': amount}),
+                (0, 0, {'account_id': self.counterpart.id, 'credit': amount}),
+            ],
+        })
+
+    def _day_totals(self, date):
+        rows = self.DailyBalance.search([
+            ('journal_id', '=', self.journal.id),
+            ('account_id', '=', self.cash_account.id),
+            ('date', '=', date),
+        ])
+        return sum(rows.mapped('debit')), sum(rows.mapped('credit'))
+
+    def test_posting_and_reset_maintain_day_totals(self):
+        """Posting adds a move to its day; resetting to draft takes it out."""
+        date = self.today - relativedelta(days=40)
+        debit_before, credit_before = self._day_totals(date)
+
+        move = self._create_move(date, 250.0)
+        self.assertEqual(self._day_totals(date), (debit_before, credit_before))
+
+        move.action_post()
+        debit, credit = self._day_totals(date)
+        self.assertAlmostEqual(debit - debit_before, 250.0, places=2)
+        self.assertAlmostEqual(credit, credit_before, places=2)
+
+        move.button_draft()
+        debit, credit = self._day_totals(date)
+        self.assertAlmostEqual(debit, debit_before, places=2)
+        self.assertAlmostEqual(credit, credit_before, places=2)
+
+    def test_table_matches_full_rebuild(self):
+        """Incremental maintenance agrees with a rebuild from the ledger."""
+        before = self.DailyBalance.get_opening_balances(self.journal, self.today).get(self.journal.id, 0.0)
+        self._create_move(self.today - relativedelta(days=3), 80.0).action_post()
+        self._create_move(self.today - relativedelta(days=2), 20.0).action_post()
+
+        incremental = self.DailyBalance.get_opening_balances(self.journal, self.today)
+        self.assertAlmostEqual(incremental[self.journal.id] - before, 100.0, places=2)
+
+        self.DailyBalance.rebuild_daily_balances(self.env.company)
+        rebuilt = self.DailyBalance.get_opening_balances(self.journal, self.today)
+
+        self.assertAlmostEqual(incremental[self.journal.id], rebuilt[self.journal.id], places=2)
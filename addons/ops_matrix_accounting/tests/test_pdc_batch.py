@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+"""
+PDC Batch Processing Tests
+Tests batch deposit, clearance, bounce and the consolidated deposit slip
+"""
+
+from odoo.tests import tagged, TransactionCase
+from unittest import SkipTest
+import logging
+
+_logger = logging.getLogger(__name__)
+
+
+@tagged('post_install', '-at_install', 'ops_pdc')
+class TestPDCBatch(TransactionCase):
+    """Test the batched journal entries of ops.pdc.receivable."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        company = cls.env.company
+        pdc_journal = cls.env['account.journal'].search([
+            ('type', '=', 'general'),
+            ('company_id', '=', company.id),
+        ], limit=1)
+        cls.bank_journal = cls.env['account.journal'].search([
+            ('type', '=', 'bank'),
+            ('company_id', '=', company.id),
+            ('default_account_id', '!=', False),
+        ], limit=1)
+        cls.partner = cls.env['res.partner'].create({'name': 'PDC Test Customer'})
+        cls.receivable_account = cls.partner.with_company(company).property_account_receivable_id
+        pdc_account = cls.env['account.account'].search([
+            ('company_ids', 'in', [company.id]),
+            ('account_type', '=', 'asset_current'),
+            ('id', 'not in', (cls.bank_journal.default_account_id | cls.receivable_account).ids),
+        ], limit=1)
+        if not pdc_journal or not cls.bank_journal or not cls.receivable_account or not pdc_account:
+            raise SkipTest("No journals / accounts for PDCs in the test company")
+
+        company.write({
+            'pdc_journal_id': pdc_journal.id,
+            'pdc_receivable_account_id': pdc_account.id,
+        })
+        cls.pdc_account = pdc_account
+        cls.PDC = cls.env['ops.pdc.receivable']
+
+    def _create_pdcs(self, amounts):
+        return self.PDC.create([{
+            'partner_id': self.partner.id,
+            'amount': amount,
+            'check_number': f'CHK-{index:03d}',
+            'maturity_date': '2099-12-31',
+            'deposit_bank_journal_id': self.bank_journal.id,
+        } for index, amount in enumerate(amounts, 1)])
+
+    def _assert_balanced(self, move, amount):
+        self.assertEqual(move.state, 'posted')
+        self.assertAlmostEqual(sum(move.line_ids.mapped('debit')), amount, places=2)
+        self.assertAlmostEqual(sum(move.line_ids.mapped('credit')), amount, places=2)
+
+    def test_batch_deposit_links_one_entry_per_cheque(self):
+        """Each deposited cheque gets its own balanced entry."""
+        pdcs = self._create_pdcs([100.0, 250.0, 75.5])
+        pdcs.action_deposit()
+
+        self.assertEqual(set(pdcs.mapped('state')), {'deposited'})
+        self.assertEqual(len(pdcs.deposit_move_id), 3)
+        for pdc in pdcs:
+            move = pdc.deposit_move_id
+            self._assert_balanced(move, pdc.amount)
+            debit_line = move.line_ids.filtered('debit')
+            credit_line = move.line_ids.filtered('credit')
+            self.assertEqual(debit_line.account_id, self.pdc_account)
+            self.assertEqual(credit_line.account_id, self.receivable_account)
+            self.assertEqual(move.line_ids.partner_id, self.partner)
+
+    def test_batch_clear_and_bounce(self):
+        """Clearing and bouncing post one balanced entry per cheque."""
+        pdcs = self._create_pdcs([100.0, 200.0, 300.0, 400.0])
+        pdcs.action_deposit()
+        to_clear, to_bounce = pdcs[:2], pdcs[2:]
+
+        to_clear.action_clear()
+        self.assertEqual(set(to_clear.mapped('state')), {'cleared'})
+        self.assertEqual(len(to_clear.clearance_move_id), 2)
+        for pdc in to_clear:
+            move = pdc.clearance_move_id
+            self._assert_balanced(move, pdc.amount)
+            self.assertEqual(move.line_ids.filtered('debit').account_id, self.bank_journal.default_account_id)
+            self.assertEqual(move.line_ids.filtered('credit').account_id, self.pdc_account)
+
+        to_bounce.action_bounce()
+        self.assertEqual(set(to_bounce.mapped('state')), {'bounced'})
+        self.assertEqual(len(to_bounce.bounce_move_id), 2)
+        for pdc in to_bounce:
+            move = pdc.bounce_move_id
+            self._assert_balanced(move, pdc.amount)
+            self.assertEqual(move.line_ids.filtered('debit').account_id, self.receivable_account)
+            self.assertEqual(move.line_ids.filtered('credit').account_id, self.pdc_account)
+
+    def test_consolidated_deposit_slip(self):
+        """A deposit slip books one bank line for the total and a line per cheque."""
+        pdcs = self._create_pdcs([120.0, 80.0, 50.0])
+        pdcs.action_deposit()
+        pdcs.action_clear_deposit_slip()
+
+        move = pdcs.clearance_move_id
+        self.assertEqual(len(move), 1, "All cheques of one bank journal share the slip entry")
+        self.assertEqual(set(pdcs.mapped('state')), {'cleared'})
+        self._assert_balanced(move, 250.0)
+
+        bank_line = move.line_ids.filtered(lambda l: l.account_id == self.bank_journal.default_account_id)
+        self.assertEqual(len(bank_line), 1)
+        self.assertAlmostEqual(bank_line.debit, 250.0, places=2)
+
+        cheque_lines = move.line_ids.filtered(lambda l: l.account_id == self.pdc_account)
+        self.assertEqual(len(cheque_lines), 3)
+        self.assertEqual(sorted(cheque_lines.mapped('credit')), [50.0, 80.0, 120.0])
@@ -238,10 +238,13 @@ class OpsAssetReportWizard(models.TransientModel):
         for wizard in self:
             try:
                 domain = wizard._build_asset_domain()
-                assets = self.env['ops.asset'].search(domain)
-                wizard.asset_count = len(assets)
-                wizard.total_gross_value = sum(assets.mapped('purchase_value'))
-                wizard.total_nbv = sum(assets.mapped('book_value'))
+                [(count, gross, nbv)] = self.env['ops.asset']._read_group(
+                    domain=domain,
+                    aggregates=['__count', 'purchase_value:sum', 'book_value:sum'],
+                )
+                wizard.asset_count = count
+                wizard.total_gross_value = gross or 0.0
+                wizard.total_nbv = nbv or 0.0
             except Exception as e:
                 _logger.error(f"Error calculating asset totals: {e}")
                 wizard.asset_count = 0
@@ -325,6 +328,95 @@ class OpsAssetReportWizard(models.TransientModel):
 
         return domain
 
+    # ============================================
+    # BULK DATA ACCESS
+    # ============================================
+
+    def _read_asset_rows(self, assets):
+        """
+        Read assets and their related names in bulk.
+
+        Categories, branches and business units are fetched once for the
+        whole recordset instead of being dereferenced per asset.
+
+        Returns:
+            list: one dict per asset (in recordset order) with raw column
+                  values plus 'category', 'branch' and 'bu' dicts
+        """
+        rows = assets.read([
+            'code', 'name', 'category_id', 'purchase_date', 'purchase_value',
+            'salvage_value', 'depreciable_value', 'accumulated_depreciation',
+            'book_value', 'disposal_date', 'state', 'ops_branch_id', 'ops_business_unit_id',
+        ], load=None)
+
+        categories = {
+            c['id']: c for c in assets.category_id.read(
+                ['name', 'depreciation_method', 'depreciation_duration'], load=None
+            )
+        }
+        branches = {b['id']: b for b in assets.ops_branch_id.read(['name', 'code'], load=None)}
+        bus = {b['id']: b for b in assets.ops_business_unit_id.read(['name'], load=None)}
+        state_labels = dict(self.env['ops.asset']._fields['state'].selection)
+
+        for row in rows:
+            row['category'] = categories.get(row['category_id'], {})
+            row['branch'] = branches.get(row['ops_branch_id'], {})
+            row['bu'] = bus.get(row['ops_business_unit_id'], {})
+            row['state_label'] = state_labels.get(row['state'])
+        return rows
+
+    def _get_accumulated_depreciation_map(self, asset_ids, as_of_date=None):
+        """
+        Sum posted depreciation per asset up to a date in one grouped query.
+
+        Returns:
+            dict: {asset_id: accumulated depreciation}
+        """
+        if not asset_ids:
+            return {}
+
+        domain = [
+            ('asset_id', 'in', asset_ids),
+            ('state', '=', 'posted'),
+        ]
+        if as_of_date:
+            domain.append(('depreciation_date', '<=', as_of_date))
+
+        return {
+            asset.id: amount or 0.0
+            for asset, amount in self.env['ops.asset.depreciation']._read_group(
+                domain=domain,
+                groupby=['asset_id'],
+                aggregates=['amount:sum'],
+            )
+        }
+
+    def _get_depreciation_details_map(self, asset_ids, as_of_date=None):
+        """
+        Fetch depreciation schedules of all assets in one ordered query.
+
+        Returns:
+            dict: {asset_id: [{'date', 'amount', 'state'}, ...]} sorted by date
+        """
+        if not asset_ids:
+            return {}
+
+        domain = [('asset_id', 'in', asset_ids)]
+        if as_of_date:
+            domain.append(('depreciation_date', '<=', as_of_date))
+
+        details = {}
+        for line in self.env['ops.asset.depreciation'].search_read(
+            domain, ['asset_id', 'depreciation_date', 'amount', 'state'],
+            order='asset_id, depreciation_date', load=None,
+        ):
+            details.setdefault(line['asset_id'], []).append({
+                'date': str(line['depreciation_date']),
+                'amount': line['amount'],
+                'state': line['state'],
+            })
+        return details
+
     # ============================================
     # REPORT GENERATION
     # ============================================
@@ -355,48 +447,43 @@ class OpsAssetReportWizard(models.TransientModel):
         domain = self._build_asset_domain()
         assets = self.env['ops.asset'].search(domain, order='category_id, code')
 
+        accumulated = self._get_accumulated_depreciation_map(assets.ids, self.as_of_date)
+        details = (
+            self._get_depreciation_details_map(assets.ids, self.as_of_date)
+            if self.show_depreciation_details else {}
+        )
+
         # Process assets
         asset_data = []
-        for asset in assets:
-            # Calculate accumulated depreciation as of date
-            accum_dep = self._get_accumulated_depreciation_as_of(asset, self.as_of_date)
-            nbv = asset.purchase_value - accum_dep
+        for row in self._read_asset_rows(assets):
+            accum_dep = accumulated.get(row['id'], 0.0)
+            nbv = row['purchase_value'] - accum_dep
 
             asset_record = {
-                'id': asset.id,
-                'code': asset.code,
-                'name': asset.name,
-                'category_name': asset.category_id.name,
-                'category_id': asset.category_id.id,
-                'purchase_date': str(asset.purchase_date),
-                'purchase_value': asset.purchase_value,
-                'salvage_value': asset.salvage_value,
-                'depreciable_value': asset.depreciable_value,
+                'id': row['id'],
+                'code': row['code'],
+                'name': row['name'],
+                'category_name': row['category'].get('name'),
+                'category_id': row['category_id'],
+                'purchase_date': str(row['purchase_date']),
+                'purchase_value': row['purchase_value'],
+                'salvage_value': row['salvage_value'],
+                'depreciable_value': row['depreciable_value'],
                 'accumulated_depreciation': accum_dep,
                 'book_value': nbv,
-                'fully_depreciated': nbv <= asset.salvage_value,
-                'branch_name': asset.ops_branch_id.name if asset.ops_branch_id else '',
-                'branch_code': asset.ops_branch_id.code if asset.ops_branch_id else '',
-                'bu_name': asset.ops_business_unit_id.name if asset.ops_business_unit_id else '',
-                'state': asset.state,
-                'state_label': dict(asset._fields['state'].selection).get(asset.state),
-                'depreciation_method': asset.category_id.depreciation_method,
-                'useful_life_years': asset.category_id.depreciation_duration,
+                'fully_depreciated': nbv <= row['salvage_value'],
+                'branch_name': row['branch'].get('name', ''),
+                'branch_code': row['branch'].get('code', ''),
+                'bu_name': row['bu'].get('name', ''),
+                'state': row['state'],
+                'state_label': row['state_label'],
+                'depreciation_method': row['category'].get('depreciation_method'),
+                'useful_life_years': row['category'].get('depreciation_duration'),
             }
 
             # Include depreciation schedule if requested
             if self.show_depreciation_details:
-                dep_lines = asset.depreciation_ids.filtered(
-                    lambda l: l.depreciation_date <= self.as_of_date if self.as_of_date else True
-                )
-                asset_record['depreciation_lines'] = [
-                    {
-                        'date': str(line.depreciation_date),
-                        'amount': line.amount,
-                        'state': line.state,
-                    }
-                    for line in dep_lines.sorted('depreciation_date')
-                ]
+                asset_record['depreciation_lines'] = details.get(row['id'], [])
 
             asset_data.append(asset_record)
 
@@ -429,16 +516,6 @@ class OpsAssetReportWizard(models.TransientModel):
             },
         }
 
-    def _get_accumulated_depreciation_as_of(self, asset, as_of_date):
-        """Calculate accumulated depreciation as of a specific date."""
-        if not as_of_date:
-            return asset.accumulated_depreciation
-
-        posted_lines = asset.depreciation_ids.filtered(
-            lambda l: l.state == 'posted' and l.depreciation_date <= as_of_date
-        )
-        return sum(posted_lines.mapped('amount'))
-
     def _group_assets(self, asset_data):
         """Group assets by selected field."""
         grouped = {}
@@ -484,29 +561,34 @@ class OpsAssetReportWizard(models.TransientModel):
 
         # Get depreciation lines for these assets in date range
         dep_domain = self._build_depreciation_domain(assets.ids)
-        dep_lines = self.env['ops.asset.depreciation'].search(dep_domain, order='depreciation_date, asset_id')
+        dep_lines = self.env['ops.asset.depreciation'].search_read(
+            dep_domain, ['asset_id', 'depreciation_date', 'amount', 'state'],
+            order='depreciation_date, asset_id', load=None,
+        )
+        asset_rows = {row['id']: row for row in self._read_asset_rows(assets)}
+        state_labels = dict(self.env['ops.asset.depreciation']._fields['state'].selection)
 
         # Process depreciation lines
         forecast_data = []
         monthly_totals = {}
 
         for line in dep_lines:
-            asset = line.asset_id
-            month_key = line.depreciation_date.strftime('%Y-%m')
+            asset = asset_rows.get(line['asset_id'], {})
+            month_key = line['depreciation_date'].strftime('%Y-%m')
 
             line_data = {
-                'id': line.id,
-                'asset_id': asset.id,
-                'asset_code': asset.code,
-                'asset_name': asset.name,
-                'category_name': asset.category_id.name,
-                'depreciation_date': str(line.depreciation_date),
+                'id': line['id'],
+                'asset_id': line['asset_id'],
+                'asset_code': asset.get('code'),
+                'asset_name': asset.get('name'),
+                'category_name': asset.get('category', {}).get('name'),
+                'depreciation_date': str(line['depreciation_date']),
                 'month_key': month_key,
-                'amount': line.amount,
-                'state': line.state,
-                'state_label': dict(line._fields['state'].selection).get(line.state),
-                'branch_name': line.branch_id.name if line.branch_id else '',
-                'bu_name': line.business_unit_id.name if line.business_unit_id else '',
+                'amount': line['amount'],
+                'state': line['state'],
+                'state_label': state_labels.get(line['state']),
+                'branch_name': asset.get('branch', {}).get('name', ''),
+                'bu_name': asset.get('bu', {}).get('name', ''),
             }
             forecast_data.append(line_data)
 
@@ -519,12 +601,12 @@ class OpsAssetReportWizard(models.TransientModel):
                     'total': 0,
                     'count': 0,
                 }
-            monthly_totals[month_key]['total'] += line.amount
+            monthly_totals[month_key]['total'] += line['amount']
             monthly_totals[month_key]['count'] += 1
-            if line.state == 'posted':
-                monthly_totals[month_key]['posted'] += line.amount
+            if line['state'] == 'posted':
+                monthly_totals[month_key]['posted'] += line['amount']
             else:
-                monthly_totals[month_key]['pending'] += line.amount
+                monthly_totals[month_key]['pending'] += line['amount']
 
         # Sort monthly totals
         sorted_months = sorted(monthly_totals.values(), key=lambda x: x['month'])
@@ -567,24 +649,24 @@ class OpsAssetReportWizard(models.TransientModel):
         assets = self.env['ops.asset'].search(domain, order='disposal_date desc, name')
 
         disposal_data = []
-        for asset in assets:
+        for row in self._read_asset_rows(assets):
             disposal_data.append({
-                'id': asset.id,
-                'code': asset.code,
-                'name': asset.name,
-                'category_name': asset.category_id.name,
-                'purchase_date': str(asset.purchase_date),
-                'disposal_date': str(asset.disposal_date) if asset.disposal_date else '',
-                'purchase_value': asset.purchase_value,
-                'accumulated_depreciation': asset.accumulated_depreciation,
-                'book_value_at_disposal': asset.book_value,
-                'state': asset.state,
-                'state_label': dict(asset._fields['state'].selection).get(asset.state),
-                'branch_name': asset.ops_branch_id.name if asset.ops_branch_id else '',
-                'bu_name': asset.ops_business_unit_id.name if asset.ops_business_unit_id else '',
+                'id': row['id'],
+                'code': row['code'],
+                'name': row['name'],
+                'category_name': row['category'].get('name'),
+                'purchase_date': str(row['purchase_date']),
+                'disposal_date': str(row['disposal_date']) if row['disposal_date'] else '',
+                'purchase_value': row['purchase_value'],
+                'accumulated_depreciation': row['accumulated_depreciation'],
+                'book_value_at_disposal': row['book_value'],
+                'state': row['state'],
+                'state_label': row['state_label'],
+                'branch_name': row['branch'].get('name', ''),
+                'bu_name': row['bu'].get('name', ''),
                 'holding_period_days': (
-                    (asset.disposal_date - asset.purchase_date).days
-                    if asset.disposal_date and asset.purchase_date else 0
+                    (row['disposal_date'] - row['purchase_date']).days
+                    if row['disposal_date'] and row['purchase_date'] else 0
                 ),
             })
 
@@ -634,21 +716,21 @@ class OpsAssetReportWizard(models.TransientModel):
         assets = self.env['ops.asset'].search(domain, order='purchase_date, name')
 
         movement_data = []
-        for asset in assets:
+        for row in self._read_asset_rows(assets):
             movement_data.append({
-                'id': asset.id,
-                'code': asset.code,
-                'name': asset.name,
-                'category_name': asset.category_id.name,
-                'purchase_date': str(asset.purchase_date),
-                'purchase_value': asset.purchase_value,
-                'salvage_value': asset.salvage_value,
-                'depreciable_value': asset.depreciable_value,
-                'state': asset.state,
-                'state_label': dict(asset._fields['state'].selection).get(asset.state),
-                'branch_name': asset.ops_branch_id.name if asset.ops_branch_id else '',
-                'bu_name': asset.ops_business_unit_id.name if asset.ops_business_unit_id else '',
-                'useful_life_years': asset.category_id.depreciation_duration,
+                'id': row['id'],
+                'code': row['code'],
+                'name': row['name'],
+                'category_name': row['category'].get('name'),
+                'purchase_date': str(row['purchase_date']),
+                'purchase_value': row['purchase_value'],
+                'salvage_value': row['salvage_value'],
+                'depreciable_value': row['depreciable_value'],
+                'state': row['state'],
+                'state_label': row['state_label'],
+                'branch_name': row['branch'].get('name', ''),
+                'bu_name': row['bu'].get('name', ''),
+                'useful_life_years': row['category'].get('depreciation_duration'),
             })
 
         # Group by category for summary
@@ -762,35 +844,15 @@ class OpsAssetReportWizard(models.TransientModel):
         """
         self.ensure_one()
 
-        try:
-            import xlsxwriter
-        except ImportError:
-            raise UserError(_("xlsxwriter Python library is not installed. Cannot generate Excel reports."))
-
-        import io
-        import base64
-
         # Get report data
         report_data = self._get_report_data()
 
-        # Create in-memory Excel file
-        output = io.BytesIO()
-        workbook = xlsxwriter.Workbook(output, {'in_memory': True})
-
-        try:
-            # Generate Excel report using the XLSX report generator
-            xlsx_report = self.env['report.ops_matrix_accounting.report_asset_xlsx']
-            xlsx_report.generate_xlsx_report(workbook, report_data, self)
-        finally:
-            workbook.close()
-
-        # Get file content
-        output.seek(0)
-        file_content = output.read()
-        output.close()
-
-        # Encode to base64
-        file_content_b64 = base64.b64encode(file_content)
+        # Write the workbook to a temporary file in constant memory
+        Xlsx = self.env['ops.xlsx.abstract']
+        xlsx_report = self.env['report.ops_matrix_accounting.report_asset_xlsx']
+        output, _size = Xlsx._write_xlsx_file(
+            lambda workbook: xlsx_report.generate_xlsx_report(workbook, report_data, self)
+        )
 
         # Generate filename
         report_type_labels = {
@@ -802,15 +864,8 @@ class OpsAssetReportWizard(models.TransientModel):
         report_label = report_type_labels.get(self.report_type, 'Asset_Report')
         filename = f"OPS_{report_label}_{fields.Date.today().strftime('%Y%m%d')}.xlsx"
 
-        # Create attachment and return download action
-        attachment = self.env['ir.attachment'].create({
-            'name': filename,
-            'type': 'binary',
-            'datas': file_content_b64,
-            'res_model': self._name,
-            'res_id': self.id,
-            'mimetype': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
-        })
+        # Store raw bytes (no base64 round-trip) and return download action
+        attachment = Xlsx._xlsx_attachment(output, filename, self)
 
         return {
             'type': 'ir.actions.act_url',
@@ -99,8 +99,10 @@ class OpsCashBookWizard(models.TransientModel):
         """Get cash book report data."""
         self.ensure_one()
 
+        # Only the cash side of the entries moves the book's balance
         domain = [
             ('journal_id', 'in', self.journal_ids.ids),
+            ('account_id', 'in', self.journal_ids.default_account_id.ids),
             ('date', '>=', self.date_from),
             ('date', '<=', self.date_to),
             ('company_id', '=', self.company_id.id),
@@ -112,41 +114,17 @@ class OpsCashBookWizard(models.TransientModel):
         if self.ops_branch_ids:
             domain.append(('ops_branch_id', 'in', self.ops_branch_ids.ids))
 
-        # Get opening balance
-        opening_domain = [
-            ('journal_id', 'in', self.journal_ids.ids),
-            ('date', '<', self.date_from),
-            ('company_id', '=', self.company_id.id),
-            ('parent_state', '=', 'posted'),
-        ]
-        if self.ops_branch_ids:
-            opening_domain.append(('ops_branch_id', 'in', self.ops_branch_ids.ids))
-
-        opening_result = self.env['account.move.line'].read_group(
-            opening_domain, ['balance:sum'], []
+        # Opening balance: carried-forward daily balances before the period
+        DailyBalance = self.env['ops.journal.daily.balance']
+        opening_balances = DailyBalance.get_opening_balances(
+            self.journal_ids, self.date_from, self.ops_branch_ids
         )
-        opening_balance = opening_result[0]['balance'] if opening_result else 0.0
+        opening_balance = sum(opening_balances.values())
 
-        # Get transactions
+        # Transactions with their running balance, computed in SQL
         order = 'date asc, id asc' if self.sort_by == 'date' else 'move_name asc, id asc'
-        move_lines = self.env['account.move.line'].search(domain, order=order)
-
-        lines = []
-        running_balance = opening_balance
-
-        for ml in move_lines:
-            running_balance += ml.balance
-            lines.append({
-                'date': ml.date,
-                'ref': ml.move_id.name,
-                'partner': ml.partner_id.name or '',
-                'account': ml.account_id.display_name,
-                'label': ml.name or '',
-                'debit': ml.debit,
-                'credit': ml.credit,
-                'balance': running_balance,
-                'branch': ml.ops_branch_id.name if hasattr(ml, 'ops_branch_id') and ml.ops_branch_id else '',
-            })
+        lines = list(DailyBalance.get_running_lines(domain, order, opening_balances))
+        running_balance = lines[-1]['balance'] if lines else opening_balance
 
         return {
             'company': self.company_id.name,
@@ -717,54 +695,34 @@ class OpsBankBookWizard(models.TransientModel):
         grand_debit = 0
         grand_credit = 0
 
+        # Only the bank side of the entries moves the book's balance
+        domain = [
+            ('journal_id', 'in', self.journal_ids.ids),
+            ('account_id', 'in', self.journal_ids.default_account_id.ids),
+            ('date', '>=', self.date_from),
+            ('date', '<=', self.date_to),
+            ('company_id', '=', self.company_id.id),
+        ]
+
+        if self.target_move == 'posted':
+            domain.append(('parent_state', '=', 'posted'))
+
+        if self.ops_branch_ids:
+            domain.append(('ops_branch_id', 'in', self.ops_branch_ids.ids))
+
+        # One opening lookup and one windowed listing for all bank journals
+        DailyBalance = self.env['ops.journal.daily.balance']
+        opening_balances = DailyBalance.get_opening_balances(
+            self.journal_ids, self.date_from, self.ops_branch_ids
+        )
+        lines_by_journal = {}
+        for line in DailyBalance.get_running_lines(domain, 'date asc, id asc', opening_balances, per_journal=True):
+            lines_by_journal.setdefault(line['journal_id'], []).append(line)
+
         for journal in self.journal_ids:
-            domain = [
-                ('journal_id', '=', journal.id),
-                ('date', '>=', self.date_from),
-                ('date', '<=', self.date_to),
-                ('company_id', '=', self.company_id.id),
-            ]
-
-            if self.target_move == 'posted':
-                domain.append(('parent_state', '=', 'posted'))
-
-            if self.ops_branch_ids:
-                domain.append(('ops_branch_id', 'in', self.ops_branch_ids.ids))
-
-            # Get opening balance for this journal
-            opening_domain = [
-                ('journal_id', '=', journal.id),
-                ('date', '<', self.date_from),
-                ('company_id', '=', self.company_id.id),
-                ('parent_state', '=', 'posted'),
-            ]
-            if self.ops_branch_ids:
-                opening_domain.append(('ops_branch_id', 'in', self.ops_branch_ids.ids))
-
-            opening_result = self.env['account.move.line'].read_group(
-                opening_domain, ['balance:sum'], []
-            )
-            journal_opening = opening_result[0]['balance'] if opening_result else 0.0
-
-            # Get transactions
-            move_lines = self.env['account.move.line'].search(domain, order='date asc, id asc')
-
-            lines = []
-            running_balance = journal_opening
-
-            for ml in move_lines:
-                running_balance += ml.balance
-                lines.append({
-                    'date': ml.date,
-                    'ref': ml.move_id.name,
-                    'partner': ml.partner_id.name or '',
-                    'account': ml.account_id.display_name,
-                    'label': ml.name or '',
-                    'debit': ml.debit,
-                    'credit': ml.credit,
-                    'balance': running_balance,
-                    'branch': ml.ops_branch_id.name if hasattr(ml, 'ops_branch_id') and ml.ops_branch_id else '',
-                })
+            journal_opening = opening_balances.get(journal.id, 0.0)
+            lines = lines_by_journal.get(journal.id, [])
+            running_balance = lines[-1]['balance'] if lines else journal_opening
 
             total_debit = sum(l['debit'] for l in lines)
             total_credit = sum(l['credit'] for l in lines)
@@ -22,13 +22,10 @@ Version: 2.0 (Phase 2 - Big 8 Consolidation)
 
 from odoo import models, fields, api, _
 from odoo.exceptions import UserError, ValidationError
-from odoo.tools import date_utils, float_round
+from odoo.tools import date_utils, float_round, SQL
 from datetime import datetime, timedelta
 from dateutil.relativedelta import relativedelta
 import logging
-import xlsxwriter
-from io import BytesIO
-import base64
 from ..report.excel_styles import get_corporate_excel_formats
 
 _logger = logging.getLogger(__name__)
@@ -742,53 +739,13 @@ class OpsGeneralLedgerWizardEnhanced(models.TransientModel):
         """
         self.ensure_one()
 
-        MoveLine = self.env['account.move.line']
-        domain = self._build_domain()
-
-        # Phase 14: Build hierarchical data
-        hierarchy = self._get_hierarchical_financial_data()
-        hierarchical_data = self._flatten_hierarchy_for_template(hierarchy, self.report_type)
-
-        # Also get flat data for backward compatibility
-        data = MoveLine._read_group(
-            domain=domain,
-            groupby=['account_id', 'account_id.account_type'],
-            aggregates=['debit:sum', 'credit:sum', 'balance:sum']
+        # Phase 14: Leaf balances, flat sections and the CoA hierarchy all
+        # come from one pass of the shared account tree service
+        tree_data = self.env['ops.account.tree'].get_statement_data(
+            self._build_domain(), self.company_id, self.report_type,
         )
-
-        # Organize by account type (flat structure for backward compatibility)
-        sections = {}
-        for item in data:
-            account = item[0]
-            account_type = item[1]
-            if not account:
-                continue
-
-            if account_type not in sections:
-                sections[account_type] = {
-                    'type': account_type,
-                    'label': self._get_account_type_label(account_type),
-                    'accounts': [],
-                    'total_debit': 0,
-                    'total_credit': 0,
-                    'total_balance': 0,
-                }
-
-            debit = item[2] or 0
-            credit = item[3] or 0
-            balance = item[4] or 0
-
-            sections[account_type]['accounts'].append({
-                'account_id': account.id,
-                'account_code': account.code,
-                'account_name': account.name,
-                'debit': debit,
-                'credit': credit,
-                'balance': balance,
-            })
-            sections[account_type]['total_debit'] += debit
-            sections[account_type]['total_credit'] += credit
-            sections[account_type]['total_balance'] += balance
+        hierarchical_data = tree_data['hierarchy']
+        sections = {s['type']: s for s in tree_data['sections']}
 
         # Calculate totals based on report type
         if self.report_type == 'pl':
@@ -854,357 +811,6 @@ class OpsGeneralLedgerWizardEnhanced(models.TransientModel):
             'use_hierarchy': True,  # Flag to enable hierarchical rendering
         }
 
-    def _get_account_type_label(self, account_type):
-        """Get human-readable label for account type."""
-        labels = {
-            'asset_receivable': 'Accounts Receivable',
-            'asset_cash': 'Bank and Cash',
-            'asset_current': 'Current Assets',
-            'asset_non_current': 'Non-current Assets',
-            'asset_prepayments': 'Prepayments',
-            'asset_fixed': 'Fixed Assets',
-            'liability_payable': 'Accounts Payable',
-            'liability_credit_card': 'Credit Card',
-            'liability_current': 'Current Liabilities',
-            'liability_non_current': 'Non-current Liabilities',
-            'equity': 'Equity',
-            'equity_unaffected': 'Current Year Earnings',
-            'income': 'Operating Income',
-            'income_other': 'Other Income',
-            'expense': 'Operating Expenses',
-            'expense_depreciation': 'Depreciation',
-            'expense_direct_cost': 'Cost of Revenue',
-            'off_balance': 'Off-Balance Sheet',
-        }
-        return labels.get(account_type, account_type)
-
-    # ============================================
-    # PHASE 14: HIERARCHICAL COA LOGIC
-    # "The Boardroom Standard" - Audit-Grade Reports
-    # ============================================
-
-    def _get_hierarchical_financial_data(self):
-        """
-        Build hierarchical Chart of Accounts structure for audit-grade reports.
-        Returns data organized by: Group -> Sub-groups -> Accounts
-        Shows 0.00 balances for relevant accounts.
-        """
-        self.ensure_one()
-
-        MoveLine = self.env['account.move.line']
-        Account = self.env['account.account']
-        AccountGroup = self.env['account.group']
-
-        domain = self._build_domain()
-
-        # Get balances grouped by account
-        balance_data = MoveLine._read_group(
-            domain=domain,
-            groupby=['account_id'],
-            aggregates=['debit:sum', 'credit:sum', 'balance:sum']
-        )
-
-        # Build balance map: account_id -> {debit, credit, balance}
-        balance_map = {}
-        for item in balance_data:
-            account = item[0]
-            if account:
-                balance_map[account.id] = {
-                    'debit': item[1] or 0,
-                    'credit': item[2] or 0,
-                    'balance': item[3] or 0,
-                }
-
-        # Get all relevant accounts for this report type
-        account_type_filter = self._get_account_types_for_report()
-        all_accounts = Account.search([
-            ('account_type', 'in', account_type_filter),
-            ('company_ids', 'in', [self.company_id.id]),
-        ], order='code')
-
-        # Get all account groups
-        all_groups = AccountGroup.search([
-            ('company_id', '=', self.company_id.id),
-        ], order='code_prefix_start')
-
-        # Build hierarchical structure
-        hierarchy = self._build_account_hierarchy(all_accounts, all_groups, balance_map)
-
-        return hierarchy
-
-    def _get_account_types_for_report(self):
-        """Get account types relevant for the current report type."""
-        if self.report_type == 'pl':
-            return [
-                'income', 'income_other',
-                'expense', 'expense_depreciation', 'expense_direct_cost'
-            ]
-        elif self.report_type == 'bs':
-            return [
-                'asset_receivable', 'asset_cash', 'asset_current',
-                'asset_non_current', 'asset_prepayments', 'asset_fixed',
-                'liability_payable', 'liability_credit_card',
-                'liability_current', 'liability_non_current',
-                'equity', 'equity_unaffected'
-            ]
-        return []
-
-    def _build_account_hierarchy(self, accounts, groups, balance_map):
-        """
-        Build a nested hierarchy of groups and accounts.
-        Returns list of top-level groups with children.
-        """
-        # Build group tree structure
-        group_map = {g.id: {
-            'id': g.id,
-            'name': g.name,
-            'code_prefix': g.code_prefix_start or '',
-            'parent_id': g.parent_id.id if g.parent_id else None,
-            'children': [],
-            'accounts': [],
-            'total_debit': 0,
-            'total_credit': 0,
-            'total_balance': 0,
-            'level': 0,
-            'is_group': True,
-        } for g in groups}
-
-        # Build parent-child relationships for groups
-        root_groups = []
-        for group_id, group_data in group_map.items():
-            parent_id = group_data['parent_id']
-            if parent_id and parent_id in group_map:
-                group_map[parent_id]['children'].append(group_data)
-            else:
-                root_groups.append(group_data)
-
-        # Assign accounts to their groups
-        ungrouped_accounts = []
-        for account in accounts:
-            account_data = {
-                'id': account.id,
-                'code': account.code,
-                'name': account.name,
-                'account_type': account.account_type,
-                'debit': balance_map.get(account.id, {}).get('debit', 0),
-                'credit': balance_map.get(account.id, {}).get('credit', 0),
-                'balance': balance_map.get(account.id, {}).get('balance', 0),
-                'is_group': False,
-            }
-
-            # Find the most specific group for this account based on code prefix
-            assigned = False
-            best_match = None
-            best_match_len = 0
-
-            for group in groups:
-                prefix_start = group.code_prefix_start or ''
-                prefix_end = group.code_prefix_end or prefix_start
-                if prefix_start and account.code:
-                    if account.code >= prefix_start and account.code <= prefix_end + 'z':
-                        if len(prefix_start) > best_match_len:
-                            best_match = group
-                            best_match_len = len(prefix_start)
-
-            if best_match and best_match.id in group_map:
-                group_map[best_match.id]['accounts'].append(account_data)
-                assigned = True
-
-            if not assigned:
-                ungrouped_accounts.append(account_data)
-
-        # Calculate totals recursively
-        def calculate_totals(node):
-            total_debit = 0
-            total_credit = 0
-            total_balance = 0
-
-            for account in node.get('accounts', []):
-                total_debit += account['debit']
-                total_credit += account['credit']
-                total_balance += account['balance']
-
-            for child in node.get('children', []):
-                calculate_totals(child)
-                total_debit += child['total_debit']
-                total_credit += child['total_credit']
-                total_balance += child['total_balance']
-
-            node['total_debit'] = total_debit
-            node['total_credit'] = total_credit
-            node['total_balance'] = total_balance
-
-        for group in root_groups:
-            calculate_totals(group)
-
-        # Assign levels for indentation
-        def assign_levels(node, level=0):
-            node['level'] = level
-            for child in node.get('children', []):
-                assign_levels(child, level + 1)
-
-        for group in root_groups:
-            assign_levels(group)
-
-        # Sort groups by code prefix
-        root_groups.sort(key=lambda x: x['code_prefix'])
-
-        # Sort accounts within each group by code
-        def sort_accounts(node):
-            node['accounts'].sort(key=lambda x: x['code'])
-            for child in node['children']:
-                sort_accounts(child)
-            node['children'].sort(key=lambda x: x['code_prefix'])
-
-        for group in root_groups:
-            sort_accounts(group)
-
-        return {
-            'groups': root_groups,
-            'ungrouped': ungrouped_accounts,
-        }
-
-    def _flatten_hierarchy_for_template(self, hierarchy, report_type='pl'):
-        """
-        Flatten hierarchical data into a list suitable for template rendering.
-        Each item has: type (group/account), indent_level, data
-        """
-        lines = []
-
-        def process_node(node, indent=0):
-            if node.get('is_group'):
-                # Add group header line
-                lines.append({
-                    'type': 'group',
-                    'indent': indent,
-                    'code': node.get('code_prefix', ''),
-                    'name': node['name'],
-                    'debit': node['total_debit'],
-                    'credit': node['total_credit'],
-                    'balance': node['total_balance'],
-                    'is_subtotal': False,
-                })
-
-                # Process child groups
-                for child in node.get('children', []):
-                    process_node(child, indent + 1)
-
-                # Process accounts in this group
-                for account in node.get('accounts', []):
-                    lines.append({
-                        'type': 'account',
-                        'indent': indent + 1,
-                        'code': account['code'],
-                        'name': account['name'],
-                        'account_type': account['account_type'],
-                        'debit': account['debit'],
-                        'credit': account['credit'],
-                        'balance': account['balance'],
-                        'is_subtotal': False,
-                    })
-
-                # Add subtotal line for this group (if it has accounts or children)
-                if node.get('accounts') or node.get('children'):
-                    lines.append({
-                        'type': 'subtotal',
-                        'indent': indent,
-                        'code': '',
-                        'name': f"Total {node['name']}",
-                        'debit': node['total_debit'],
-                        'credit': node['total_credit'],
-                        'balance': node['total_balance'],
-                        'is_subtotal': True,
-                    })
-
-        # Process by category for P&L
-        if report_type == 'pl':
-            income_groups = []
-            expense_groups = []
-
-            for group in hierarchy.get('groups', []):
-                prefix = group.get('code_prefix', '')
-                # Typically income accounts start with 4, expenses with 5-6
-                if prefix.startswith('4'):
-                    income_groups.append(group)
-                elif prefix.startswith(('5', '6', '7')):
-                    expense_groups.append(group)
-
-            # Process income section
-            income_lines = []
-            income_total = 0
-            for group in income_groups:
-                process_node(group, 0)
-                income_total += abs(group['total_balance'])
-            income_lines = lines.copy()
-            lines.clear()
-
-            # Process expense section
-            expense_lines = []
-            expense_total = 0
-            for group in expense_groups:
-                process_node(group, 0)
-                expense_total += abs(group['total_balance'])
-            expense_lines = lines.copy()
-
-            return {
-                'income_hierarchy': income_lines,
-                'expense_hierarchy': expense_lines,
-                'income_total': income_total,
-                'expense_total': expense_total,
-                'net_profit': income_total - expense_total,
-            }
-
-        # Process for Balance Sheet
-        elif report_type == 'bs':
-            asset_groups = []
-            liability_groups = []
-            equity_groups = []
-
-            for group in hierarchy.get('groups', []):
-                prefix = group.get('code_prefix', '')
-                # Typically: 1=assets, 2=liabilities, 3=equity
-                if prefix.startswith('1'):
-                    asset_groups.append(group)
-                elif prefix.startswith('2'):
-                    liability_groups.append(group)
-                elif prefix.startswith('3'):
-                    equity_groups.append(group)
-
-            # Process each section
-            asset_lines = []
-            asset_total = 0
-            for group in asset_groups:
-                process_node(group, 0)
-                asset_total += group['total_balance']
-            asset_lines = lines.copy()
-            lines.clear()
-
-            liability_lines = []
-            liability_total = 0
-            for group in liability_groups:
-                process_node(group, 0)
-                liability_total += abs(group['total_balance'])
-            liability_lines = lines.copy()
-            lines.clear()
-
-            equity_lines = []
-            equity_total = 0
-            for group in equity_groups:
-                process_node(group, 0)
-                equity_total += abs(group['total_balance'])
-            equity_lines = lines.copy()
-
-            return {
-                'asset_hierarchy': asset_lines,
-                'liability_hierarchy': liability_lines,
-                'equity_hierarchy': equity_lines,
-                'asset_total': asset_total,
-                'liability_total': liability_total,
-                'equity_total': equity_total,
-            }
-
-        return {'lines': lines}
-
     # ============================================
     # CASH FLOW DATA
     # ============================================
@@ -1790,23 +1396,29 @@ class OpsGeneralLedgerWizardEnhanced(models.TransientModel):
     # ============================================
 
     def action_export_to_excel(self):
-        """Export report to Excel with corporate formatting."""
+        """Export report to Excel with corporate formatting.
+
+        The workbook is generated and streamed by the export controller so
+        that it never has to be held in memory or base64-encoded.
+        """
         self.ensure_one()
 
         # Security check
         self._check_intelligence_access(self._get_engine_name())
 
-        # Get report data
-        report_data = self._get_report_data()
+        return {
+            'type': 'ir.actions.act_url',
+            'url': f'/ops/report/xlsx/financial/{self.id}',
+            'target': 'self',
+        }
 
-        # Create Excel workbook
-        output = BytesIO()
-        workbook = xlsxwriter.Workbook(output, {'in_memory': True})
+    def _stream_excel_export(self):
+        """Build the Excel export in constant memory and stream it back."""
+        self.ensure_one()
 
-        # Get corporate formats
-        formats = get_corporate_excel_formats(workbook, self.company_id)
+        # Security check
+        self._check_intelligence_access(self._get_engine_name())
 
-        # Create worksheet
         report_titles = {
             'gl': 'General Ledger',
             'tb': 'Trial Balance',
@@ -1818,6 +1430,19 @@ class OpsGeneralLedgerWizardEnhanced(models.TransientModel):
             'soa': 'Statement of Account',
         }
         sheet_name = report_titles.get(self.report_type, 'Report')[:31]
+
+        Xlsx = self.env['ops.xlsx.abstract']
+        output, size = Xlsx._write_xlsx_file(
+            lambda workbook: self._write_excel_export(workbook, sheet_name)
+        )
+        filename = f"{sheet_name.replace(' ', '_')}_{fields.Date.today()}.xlsx"
+        return Xlsx._xlsx_stream_response(output, size, filename)
+
+    def _write_excel_export(self, workbook, sheet_name):
+        """Fill the export workbook top to bottom (constant_memory mode)."""
+        # Get corporate formats
+        formats = get_corporate_excel_formats(workbook, self.company_id)
+
         worksheet = workbook.add_worksheet(sheet_name)
 
         # Set column widths
@@ -1868,36 +1493,12 @@ class OpsGeneralLedgerWizardEnhanced(models.TransientModel):
         # Freeze panes
         worksheet.freeze_panes(row, 0)
 
-        # Data rows
-        lines = report_data.get('lines', []) or report_data.get('accounts', []) or []
-
-        # Handle different data structures based on report format
-        if not lines:
-            data = report_data.get('data', {})
-            if isinstance(data, dict):
-                if 'detailed' in data:
-                    lines = data['detailed']
-                elif 'summary' in data:
-                    lines = data['summary']
-            elif isinstance(data, list):
-                lines = data
-
         total_debit = 0
         total_credit = 0
 
-        for idx, line in enumerate(lines):
+        for idx, (date_val, journal, ref, partner, desc, debit, credit, balance) in enumerate(self._iter_excel_rows()):
             alt = idx % 2 == 1
 
-            # Get values based on data structure
-            date_val = line.get('date', '')
-            journal = line.get('journal', line.get('journal_code', line.get('code', '')))
-            ref = line.get('reference', line.get('ref', line.get('move_name', '')))
-            partner = line.get('partner', line.get('partner_name', ''))
-            desc = line.get('description', line.get('name', line.get('label', line.get('account_name', ''))))
-            debit = float(line.get('debit', 0) or 0)
-            credit = float(line.get('credit', 0) or 0)
-            balance = float(line.get('balance', debit - credit) or 0)
-
             total_debit += debit
             total_credit += credit
 
@@ -1933,23 +1534,95 @@ class OpsGeneralLedgerWizardEnhanced(models.TransientModel):
         worksheet.fit_to_pages(1, 0)
         worksheet.set_paper(9)  # A4
 
-        workbook.close()
-        output.seek(0)
+    def _iter_excel_rows(self):
+        """
+        Yield export rows as (date, journal, reference, partner, description,
+        debit, credit, balance) tuples.
 
-        # Create attachment
-        filename = f"{sheet_name.replace(' ', '_')}_{fields.Date.today()}.xlsx"
-        attachment = self.env['ir.attachment'].create({
-            'name': filename,
-            'datas': base64.b64encode(output.read()),
-            'type': 'binary',
-            'mimetype': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
-        })
+        Detailed General Ledger rows are read straight from a server-side
+        cursor; every other report is small enough to come from its
+        aggregated report data.
+        """
+        if self.report_type == 'gl' and self.report_format != 'summary':
+            exact_combinations = None
+            if self.matrix_filter_mode == 'exact' and self.branch_ids and self.business_unit_ids:
+                exact_combinations = self._get_exact_matrix_combinations()
+
+            rows = self.env['ops.report.helpers'].iter_cursor_rows(self._get_gl_export_query())
+            for row in rows:
+                if exact_combinations is not None and (
+                    (row['ops_branch_id'], row['ops_business_unit_id']) not in exact_combinations
+                ):
+                    continue
+                yield (
+                    row['date'] or '', row['journal_code'] or '', row['move_name'] or '',
+                    row['partner_name'] or '', row['name'] or '',
+                    row['debit'] or 0.0, row['credit'] or 0.0, row['balance'] or 0.0,
+                )
+            return
 
-        return {
-            'type': 'ir.actions.act_url',
-            'url': f'/web/content/{attachment.id}?download=true',
-            'target': 'self',
-        }
+        report_data = self._get_report_data()
+        lines = report_data.get('lines', []) or report_data.get('accounts', []) or []
+
+        # Handle different data structures based on report format
+        if not lines:
+            data = report_data.get('data', {})
+            if isinstance(data, dict):
+                if 'detailed' in data:
+                    lines = data['detailed']
+                elif 'summary' in data:
+                    lines = data['summary']
+            elif isinstance(data, list):
+                lines = data
+
+        for line in lines:
+            debit = float(line.get('debit', 0) or 0)
+            credit = float(line.get('credit', 0) or 0)
+            yield (
+                line.get('date', ''),
+                line.get('journal', line.get('journal_code', line.get('code', ''))),
+                line.get('reference', line.get('ref', line.get('move_name', ''))),
+                line.get('partner', line.get('partner_name', '')),
+                line.get('description', line.get('name', line.get('label', line.get('account_name', '')))),
+                debit,
+                credit,
+                float(line.get('balance', debit - credit) or 0),
+            )
+
+    def _get_gl_export_query(self):
+        """SELECT of the General Ledger export rows, in report sort order."""
+        MoveLine = self.env['account.move.line']
+        MoveLine.flush_model()
+        self.env['account.move'].flush_model(['name'])
+        self.env['account.journal'].flush_model(['code'])
+        self.env['res.partner'].flush_model(['name'])
+
+        query = MoveLine._search(self._build_domain(), order=self._get_sort_order())
+        line = query.table
+        joins = (
+            ('JOIN', 'export_move', 'account_move', 'move_id'),
+            ('JOIN', 'export_journal', 'account_journal', 'journal_id'),
+            ('LEFT JOIN', 'export_partner', 'res_partner', 'partner_id'),
+        )
+        aliases = {}
+        for kind, link, table, column in joins:
+            alias = aliases[table] = query.make_alias(line, link)
+            query.add_join(kind, alias, table, SQL(
+                "%s = %s", SQL.identifier(alias, 'id'), SQL.identifier(line, column),
+            ))
+
+        return query.select(
+            SQL.identifier(line, 'date'),
+            SQL("%s AS journal_code", SQL.identifier(aliases['account_journal'], 'code')),
+            SQL("%s AS move_name", SQL.identifier(aliases['account_move'], 'name')),
+            SQL("%s AS partner_name", SQL.identifier(aliases['res_partner'], 'name')),
+            SQL.identifier(line, 'name'),
+            SQL.identifier(line, 'debit'),
+            SQL.identifier(line, 'credit'),
+            SQL.identifier(line, 'balance'),
+            SQL.identifier(line, 'ops_branch_id'),
+            SQL.identifier(line, 'ops_business_unit_id'),
+        )
 
     def action_view_transactions(self):
         """Open filtered journal entries in list view."""
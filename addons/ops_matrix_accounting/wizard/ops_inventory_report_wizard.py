@@ -28,6 +28,10 @@ _logger = logging.getLogger(__name__)
 # Corporate Excel formatting (Phase 5)
 from ..report.excel_styles import get_corporate_excel_formats
 
+# Quant fields that decide how stock.quant.value prices a quant; aggregated
+# quants are always split on them before being valued
+VALUATION_GROUPBY = ('product_id', 'location_id', 'lot_id', 'owner_id')
+
 
 class OpsInventoryReportWizard(models.TransientModel):
     """Inventory Intelligence - Stock Analysis Engine"""
@@ -258,9 +262,9 @@ class OpsInventoryReportWizard(models.TransientModel):
         for wizard in self:
             try:
                 domain = wizard._build_quant_domain()
-                quants = self.env['stock.quant'].search(domain)
-                wizard.total_quantity = sum(quants.mapped('quantity'))
-                wizard.total_value = sum(quants.mapped('value'))
+                groups = wizard._read_valued_quant_groups(domain, ['product_id'])
+                wizard.total_quantity = sum(qty for _product, qty, _value in groups)
+                wizard.total_value = sum(value for _product, _qty, value in groups)
             except Exception as e:
                 _logger.error(f"Error calculating totals: {e}")
                 wizard.total_quantity = 0.0
@@ -326,6 +330,163 @@ class OpsInventoryReportWizard(models.TransientModel):
 
         return location_ids
 
+    def _get_location_branch_map(self, locations):
+        """Resolve the owning branch of each location in one pass.
+
+        Locations are mapped to their warehouse with a single batched read,
+        and warehouses to branches through the cached
+        ``ops.branch._get_warehouse_branch_map``.
+
+        Args:
+            locations: stock.location recordset
+
+        Returns:
+            dict: {location_id: (branch_id, branch_name)}
+        """
+        if not locations:
+            return {}
+
+        warehouse_branch_map = self.env['ops.branch']._get_warehouse_branch_map()
+        location_branch_ids = {}
+        for location in locations.read(['warehouse_id'], load=None):
+            branch_id = warehouse_branch_map.get(location['warehouse_id'])
+            if branch_id:
+                location_branch_ids[location['id']] = branch_id
+
+        branch_names = {
+            branch['id']: branch['name']
+            for branch in self.env['ops.branch'].search_read(
+                [('id', 'in', list(set(location_branch_ids.values())))], ['name'],
+            )
+        }
+        return {
+            location_id: (branch_id, branch_names[branch_id])
+            for location_id, branch_id in location_branch_ids.items()
+            if branch_id in branch_names
+        }
+
+    def _get_unit_cost_map(self, domain):
+        """Valuation unit cost of each (product, lot) among the quants of domain.
+
+        Quant value is not stored. For a product (and lot) in a company it is
+        proportional to the quantity, so the value of one quant gives the
+        unit cost that stock.quant.value applies to all of them. The domain
+        must only match valued quants.
+
+        Returns:
+            dict: {(product_id, lot_id): unit_cost}
+        """
+        Quant = self.env['stock.quant']
+        samples = Quant._read_group(
+            domain + [('quantity', '!=', 0)], groupby=['product_id', 'lot_id'], aggregates=['id:min'],
+        )
+        quants = Quant.browse([quant_id for _product, _lot, quant_id in samples])
+        return {
+            (quant.product_id.id, quant.lot_id.id): quant.value / quant.quantity
+            for quant in quants
+        }
+
+    def _read_valued_quant_groups(self, domain, groupby, aggregates=()):
+        """_read_group on stock.quant with the stock value of each group.
+
+        Groups are split on VALUATION_GROUPBY so that they are valued like
+        stock.quant.value: consigned stock (owned by another partner) and
+        quants in locations that are not valued count for 0, others at the
+        unit cost of their product and lot. The split groups are merged
+        back into the requested groupby.
+
+        Args:
+            domain: stock.quant search domain
+            groupby: groupby specs of the result
+            aggregates: aggregate specs (``sum``, ``min`` or ``max``) after
+                the summed quantity
+
+        Returns:
+            list: tuples (*groupby values, quantity, *aggregates, value)
+        """
+        Quant = self.env['stock.quant']
+        full_groupby = [*groupby, *(field for field in VALUATION_GROUPBY if field not in groupby)]
+        aggregates = ['quantity:sum', *aggregates]
+        groups = Quant._read_group(domain, groupby=full_groupby, aggregates=aggregates)
+        if not groups:
+            return []
+
+        position = {spec: index for index, spec in enumerate(full_groupby)}
+        locations = self.env['stock.location'].union(*(group[position['location_id']] for group in groups))
+        valued_locations = locations.filtered(lambda location: location._should_be_valued())
+        # stock.quant._should_exclude_for_valuation(): stock owned by anyone
+        # but the company itself is not valued
+        company_partner = self.company_id.partner_id
+        unit_costs = self._get_unit_cost_map(domain + [
+            ('location_id', 'in', valued_locations.ids),
+            ('owner_id', 'in', [False, company_partner.id]),
+        ])
+
+        merged = {}
+        for group in groups:
+            product, location, lot, owner = (group[position[field]] for field in VALUATION_GROUPBY)
+            values = group[len(full_groupby):]
+            value = 0.0
+            if location in valued_locations and owner in (company_partner, owner.browse()):
+                value = values[0] * unit_costs.get((product.id, lot.id), 0.0)
+
+            key = group[:len(groupby)]
+            if key not in merged:
+                merged[key] = [*values, value]
+                continue
+            row = merged[key]
+            for index, spec in enumerate(aggregates):
+                if values[index] is None or row[index] is None:
+                    row[index] = row[index] if values[index] is None else values[index]
+                elif spec.endswith(':min'):
+                    row[index] = min(row[index], values[index])
+                elif spec.endswith(':max'):
+                    row[index] = max(row[index], values[index])
+                else:
+                    row[index] += values[index]
+            row[-1] += value
+
+        return [(*key, *row) for key, row in merged.items()]
+
+    def _read_quant_groups(self, domain, extra_groupby=()):
+        """Aggregate matching quants per (product, location) in SQL.
+
+        Args:
+            domain: stock.quant search domain
+            extra_groupby: additional groupby specs appended after product
+                and location (e.g. ``'in_date:day'``)
+
+        Returns:
+            list: dicts with product, location, quantity, reserved_quantity,
+            value, in_date (oldest), branch_id and branch_name
+        """
+        groupby = ['product_id', 'location_id', *extra_groupby]
+        groups = self._read_valued_quant_groups(
+            domain, groupby, aggregates=['reserved_quantity:sum', 'in_date:min'],
+        )
+        if not groups:
+            return []
+
+        locations = self.env['stock.location'].union(*(group[1] for group in groups))
+        location_branch_map = self._get_location_branch_map(locations)
+
+        rows = []
+        for group in groups:
+            product, location = group[0], group[1]
+            quantity, reserved_quantity, in_date, value = group[len(groupby):]
+            branch_id, branch_name = location_branch_map.get(location.id, (0, ''))
+            rows.append({
+                'product': product,
+                'location': location,
+                'quantity': quantity,
+                'reserved_quantity': reserved_quantity,
+                'value': value,
+                'in_date': in_date,
+                'branch_id': branch_id,
+                'branch_name': branch_name,
+            })
+        return rows
+
     # ============================================
     # VALIDATION
     # ============================================
@@ -371,10 +532,8 @@ class OpsInventoryReportWizard(models.TransientModel):
             if branch_locations:
                 domain.append(('location_id', 'in', branch_locations))
 
-        quants = self.env['stock.quant'].search(domain)
-
         # Process and group data
-        data = self._process_quants(quants)
+        data = self._process_quants(self._read_quant_groups(domain))
         grouped_data = self._group_data(data, self.group_by)
 
         # Calculate totals
@@ -398,41 +557,30 @@ class OpsInventoryReportWizard(models.TransientModel):
             },
         }
 
-    def _process_quants(self, quants):
-        """Process quants into report format."""
+    def _process_quants(self, quant_groups):
+        """Process aggregated quant rows (see ``_read_quant_groups``) into report format."""
         data = []
-        for quant in quants:
-            # Get branch info - check warehouse relationship
-            branch_name = ''
-            branch_id = 0
-            if quant.location_id.warehouse_id:
-                # Check if branch is linked via ops.branch.warehouse_id (reverse lookup)
-                branch = self.env['ops.branch'].search([
-                    ('warehouse_id', '=', quant.location_id.warehouse_id.id)
-                ], limit=1)
-                if branch:
-                    branch_name = branch.name
-                    branch_id = branch.id
-
+        for row in quant_groups:
+            product = row['product']
+            location = row['location']
+            quantity = row['quantity']
             data.append({
-                'id': quant.id,
-                'product_id': quant.product_id.id,
-                'product_name': quant.product_id.display_name,
-                'product_code': quant.product_id.default_code or '',
-                'category_name': quant.product_id.categ_id.name,
-                'category_id': quant.product_id.categ_id.id,
-                'location_id': quant.location_id.id,
-                'location_name': quant.location_id.complete_name,
-                'branch_name': branch_name,
-                'branch_id': branch_id,
-                'quantity': quant.quantity,
-                'reserved_quantity': quant.reserved_quantity,
-                'available_quantity': quant.quantity - quant.reserved_quantity,
-                'uom': quant.product_uom_id.name,
-                'value': quant.value,
-                'unit_cost': quant.value / quant.quantity if quant.quantity else 0,
-                'in_date': str(quant.in_date) if quant.in_date else '',
-                'lot_name': quant.lot_id.name if quant.lot_id else '',
+                'product_id': product.id,
+                'product_name': product.display_name,
+                'product_code': product.default_code or '',
+                'category_name': product.categ_id.name,
+                'category_id': product.categ_id.id,
+                'location_id': location.id,
+                'location_name': location.complete_name,
+                'branch_name': row['branch_name'],
+                'branch_id': row['branch_id'],
+                'quantity': quantity,
+                'reserved_quantity': row['reserved_quantity'],
+                'available_quantity': quantity - row['reserved_quantity'],
+                'uom': product.uom_id.name,
+                'value': row['value'],
+                'unit_cost': row['value'] / quantity if quantity else 0,
+                'in_date': str(row['in_date']) if row['in_date'] else '',
             })
         return data
 
@@ -521,7 +669,8 @@ class OpsInventoryReportWizard(models.TransientModel):
             max_date = today - timedelta(days=self.min_age_days)
             domain.append(('in_date', '<=', max_date))
 
-        quants = self.env['stock.quant'].search(domain)
+        # Quants of a product/location received on the same day share an age
+        quant_groups = self._read_quant_groups(domain, extra_groupby=['in_date:day'])
 
         # Initialize aging buckets
         p1, p2, p3, p4 = self.aging_period_1, self.aging_period_2, self.aging_period_3, self.aging_period_4
@@ -533,38 +682,28 @@ class OpsInventoryReportWizard(models.TransientModel):
             f'>{p4}': {'label': f'Dead Stock (>{p4} days)', 'items': [], 'total_qty': 0, 'total_value': 0},
         }
 
-        # Classify each quant
+        # Classify each product/location/day group
         all_items = []
-        for quant in quants:
-            if not quant.in_date:
+        for row in quant_groups:
+            if not row['in_date']:
                 continue
 
             # Calculate age in days
-            in_date = quant.in_date.date() if hasattr(quant.in_date, 'date') else quant.in_date
+            in_date = row['in_date'].date() if hasattr(row['in_date'], 'date') else row['in_date']
             age_days = (today - in_date).days
 
-            # Get branch info
-            branch_name = ''
-            if quant.location_id.warehouse_id:
-                branch = self.env['ops.branch'].search([
-                    ('warehouse_id', '=', quant.location_id.warehouse_id.id)
-                ], limit=1)
-                if branch:
-                    branch_name = branch.name
-
+            product = row['product']
             item = {
-                'id': quant.id,
-                'product_id': quant.product_id.id,
-                'product_name': quant.product_id.display_name,
-                'product_code': quant.product_id.default_code or '',
-                'category_name': quant.product_id.categ_id.name,
-                'location_name': quant.location_id.complete_name,
-                'branch_name': branch_name,
-                'quantity': quant.quantity,
-                'value': quant.value,
-                'in_date': str(quant.in_date),
+                'product_id': product.id,
+                'product_name': product.display_name,
+                'product_code': product.default_code or '',
+                'category_name': product.categ_id.name,
+                'location_name': row['location'].complete_name,
+                'branch_name': row['branch_name'],
+                'quantity': row['quantity'],
+                'value': row['value'],
+                'in_date': str(row['in_date']),
                 'age_days': age_days,
-                'lot_name': quant.lot_id.name if quant.lot_id else '',
             }
 
             all_items.append(item)
@@ -582,8 +721,8 @@ class OpsInventoryReportWizard(models.TransientModel):
                 bucket_key = f'>{p4}'
 
             aging_buckets[bucket_key]['items'].append(item)
-            aging_buckets[bucket_key]['total_qty'] += quant.quantity
-            aging_buckets[bucket_key]['total_value'] += quant.value
+            aging_buckets[bucket_key]['total_qty'] += item['quantity']
+            aging_buckets[bucket_key]['total_value'] += item['value']
 
         return {
             'report_type': 'aging',
@@ -623,32 +762,21 @@ class OpsInventoryReportWizard(models.TransientModel):
             if branch_locations:
                 domain.append(('location_id', 'in', branch_locations))
 
-        quants = self.env['stock.quant'].search(domain)
-
         data = []
-        for quant in quants:
-            # Get branch info
-            branch_name = ''
-            if quant.location_id.warehouse_id:
-                branch = self.env['ops.branch'].search([
-                    ('warehouse_id', '=', quant.location_id.warehouse_id.id)
-                ], limit=1)
-                if branch:
-                    branch_name = branch.name
-
+        for row in self._read_quant_groups(domain):
+            product = row['product']
             data.append({
-                'id': quant.id,
-                'product_id': quant.product_id.id,
-                'product_name': quant.product_id.display_name,
-                'product_code': quant.product_id.default_code or '',
-                'category_name': quant.product_id.categ_id.name,
-                'location_id': quant.location_id.id,
-                'location_name': quant.location_id.complete_name,
-                'branch_name': branch_name,
-                'quantity': quant.quantity,
-                'reserved_quantity': quant.reserved_quantity,
-                'value': quant.value,
-                'severity': 'critical' if quant.quantity < -10 else 'warning',
+                'product_id': product.id,
+                'product_name': product.display_name,
+                'product_code': product.default_code or '',
+                'category_name': product.categ_id.name,
+                'location_id': row['location'].id,
+                'location_name': row['location'].complete_name,
+                'branch_name': row['branch_name'],
+                'quantity': row['quantity'],
+                'reserved_quantity': row['reserved_quantity'],
+                'value': row['value'],
+                'severity': 'critical' if row['quantity'] < -10 else 'warning',
             })
 
         # Sort by severity (most negative first)
@@ -697,10 +825,9 @@ class OpsInventoryReportWizard(models.TransientModel):
             if branch_locations:
                 domain.append(('location_id', 'in', branch_locations))
 
-        quants = self.env['stock.quant'].search(domain)
-
-        # Get unique products
-        products = quants.mapped('product_id')
+        # Current stock per product, aggregated in SQL
+        quant_groups = self._read_valued_quant_groups(domain, ['product_id'])
+        products = self.env['product.product'].union(*(product for product, _qty, _value in quant_groups))
         product_ids = products.ids
 
         if not product_ids:
@@ -730,16 +857,10 @@ class OpsInventoryReportWizard(models.TransientModel):
                     'qty': qty_sum or 0.0
                 }
 
-        # =================================================================
-        # OPTIMIZED: Single pass aggregation for quants by product
-        # =================================================================
-        quant_map = {}
-        for quant in quants:
-            pid = quant.product_id.id
-            if pid not in quant_map:
-                quant_map[pid] = {'qty': 0.0, 'value': 0.0}
-            quant_map[pid]['qty'] += quant.quantity
-            quant_map[pid]['value'] += quant.value
+        quant_map = {
+            product.id: {'qty': qty, 'value': value}
+            for product, qty, value in quant_groups
+        }
 
         # Build result data using lookup maps (no additional queries)
         data = []
@@ -887,55 +1008,43 @@ class OpsInventoryReportWizard(models.TransientModel):
         report_data = self._get_report_data()
 
         # Generate Excel file
-        try:
-            import xlsxwriter
-            from io import BytesIO
-            import base64
-
-            output = BytesIO()
-            workbook = xlsxwriter.Workbook(output, {'in_memory': True})
+        writers = {
+            'valuation': self._write_valuation_excel,
+            'aging': self._write_aging_excel,
+            'negative': self._write_negative_excel,
+            'movement': self._write_movement_excel,
+        }
 
+        def write_workbook(workbook):
             # Create formats - OPS Corporate Style (Phase 5)
             formats = get_corporate_excel_formats(workbook, self.company_id)
 
             # Dispatch to appropriate Excel writer
-            if self.report_type == 'valuation':
-                self._write_valuation_excel(workbook, formats, report_data)
-            elif self.report_type == 'aging':
-                self._write_aging_excel(workbook, formats, report_data)
-            elif self.report_type == 'negative':
-                self._write_negative_excel(workbook, formats, report_data)
-            elif self.report_type == 'movement':
-                self._write_movement_excel(workbook, formats, report_data)
-
-            workbook.close()
-            output.seek(0)
-
-            # Create attachment and return download action
-            date_str = self.date_to.strftime('%Y%m%d') if self.date_to else fields.Date.today().strftime('%Y%m%d')
-            filename = f"Inventory_{self.report_type}_{date_str}.xlsx"
-
-            attachment = self.env['ir.attachment'].create({
-                'name': filename,
-                'type': 'binary',
-                'datas': base64.b64encode(output.read()),
-                'mimetype': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
-            })
+            writer = writers.get(self.report_type)
+            if writer:
+                writer(workbook, formats, report_data)
 
-            # Log export
-            self._log_intelligence_report('Inventory', self.report_type, {
-                'record_count': len(report_data.get('data', [])),
-                'date_to': str(self.date_to),
-            }, 'excel')
+        # Constant-memory workbook in a temporary file
+        Xlsx = self.env['ops.xlsx.abstract']
+        output, _size = Xlsx._write_xlsx_file(write_workbook)
 
-            return {
-                'type': 'ir.actions.act_url',
-                'url': f'/web/content/{attachment.id}?download=true',
-                'target': 'self',
-            }
+        # Create attachment and return download action
+        date_str = self.date_to.strftime('%Y%m%d') if self.date_to else fields.Date.today().strftime('%Y%m%d')
+        filename = f"Inventory_{self.report_type}_{date_str}.xlsx"
+
+        attachment = Xlsx._xlsx_attachment(output, filename)
 
-        except ImportError:
-            raise UserError(_('xlsxwriter library is not installed. Please install it to export to Excel.'))
+        # Log export
+        self._log_intelligence_report('Inventory', self.report_type, {
+            'record_count': len(report_data.get('data', [])),
+            'date_to': str(self.date_to),
+        }, 'excel')
+
+        return {
+            'type': 'ir.actions.act_url',
+            'url': f'/web/content/{attachment.id}?download=true',
+            'target': 'self',
+        }
 
     def _write_valuation_excel(self, workbook, formats, data):
         """Write Stock Valuation report to Excel."""
@@ -18,13 +18,23 @@ Version: 1.0 (Phase 3 - Treasury Engine)
 
 from odoo import models, fields, api, _
 from odoo.exceptions import UserError, ValidationError
-from odoo.tools import date_utils
+from odoo.tools import date_utils, SQL
 from datetime import datetime, timedelta
 from dateutil.relativedelta import relativedelta
 import logging
 
 _logger = logging.getLogger(__name__)
 
+PDC_MODELS = {
+    'inbound': 'ops.pdc.receivable',
+    'outbound': 'ops.pdc.payable',
+}
+
+PDC_DETAIL_FIELDS = [
+    'name', 'partner_id', 'amount', 'currency_id', 'check_number', 'check_date',
+    'maturity_date', 'bank_id', 'ops_branch_id', 'state', 'notes',
+]
+
 
 class OpsTreasuryReportWizard(models.TransientModel):
     """Treasury Intelligence - PDC Analysis Engine"""
@@ -227,14 +237,11 @@ class OpsTreasuryReportWizard(models.TransientModel):
         for wizard in self:
             try:
                 total = 0.0
-                if wizard.pdc_type in ('inbound', 'both'):
-                    domain = wizard._build_domain('inbound')
-                    pdcs = self.env['ops.pdc.receivable'].search(domain)
-                    total += sum(pdcs.mapped('amount'))
-                if wizard.pdc_type in ('outbound', 'both'):
-                    domain = wizard._build_domain('outbound')
-                    pdcs = self.env['ops.pdc.payable'].search(domain)
-                    total += sum(pdcs.mapped('amount'))
+                for pdc_type in wizard._get_pdc_types():
+                    [(amount,)] = self.env[PDC_MODELS[pdc_type]]._read_group(
+                        wizard._build_domain(pdc_type), aggregates=['amount:sum'],
+                    )
+                    total += amount or 0.0
                 wizard.total_amount = total
             except Exception as e:
                 _logger.error(f"Error calculating totals: {e}")
@@ -257,7 +264,7 @@ class OpsTreasuryReportWizard(models.TransientModel):
 
         # Branch filter
         if self.branch_ids:
-            domain.append(('branch_id', 'in', self.branch_ids.ids))
+            domain.append(('ops_branch_id', 'in', self.branch_ids.ids))
 
         # Partner filter
         if self.partner_ids:
@@ -291,6 +298,13 @@ class OpsTreasuryReportWizard(models.TransientModel):
 
         return domain
 
+    def _get_pdc_types(self):
+        """PDC directions covered by the pdc_type filter."""
+        self.ensure_one()
+        if self.pdc_type == 'both':
+            return ['inbound', 'outbound']
+        return [self.pdc_type]
+
     # ============================================
     # REPORT GENERATION
     # ============================================
@@ -322,15 +336,11 @@ class OpsTreasuryReportWizard(models.TransientModel):
 
         # Fetch receivable PDCs
         if self.pdc_type in ('inbound', 'both'):
-            domain = self._build_domain('inbound')
-            pdcs = self.env['ops.pdc.receivable'].search(domain, order='maturity_date, id')
-            inbound_data = self._process_pdc_records(pdcs, 'inbound')
+            inbound_data = self._read_pdc_records('inbound', self._build_domain('inbound'))
 
         # Fetch payable PDCs
         if self.pdc_type in ('outbound', 'both'):
-            domain = self._build_domain('outbound')
-            pdcs = self.env['ops.pdc.payable'].search(domain, order='maturity_date, id')
-            outbound_data = self._process_pdc_records(pdcs, 'outbound')
+            outbound_data = self._read_pdc_records('outbound', self._build_domain('outbound'))
 
         # Calculate totals
         inbound_total = sum(p['amount'] for p in inbound_data)
@@ -364,27 +374,51 @@ class OpsTreasuryReportWizard(models.TransientModel):
             },
         }
 
-    def _process_pdc_records(self, pdcs, pdc_type):
-        """Process PDC records into report format."""
+    def _read_pdc_records(self, pdc_type, domain):
+        """Read PDC detail rows in report format.
+
+        Only the registry and in-hand reports list individual cheques; rows
+        are fetched with one ``search_read`` and the branch codes with one
+        more read, instead of walking the recordset field by field.
+
+        Args:
+            pdc_type: 'inbound' or 'outbound'
+            domain: PDC search domain
+
+        Returns:
+            list: One dict per PDC, ordered by maturity date
+        """
+        Pdc = self.env[PDC_MODELS[pdc_type]]
+        records = Pdc.search_read(domain, PDC_DETAIL_FIELDS, order='maturity_date, id')
+        state_labels = dict(Pdc._fields['state']._description_selection(self.env))
+
+        branch_ids = {pdc['ops_branch_id'][0] for pdc in records if pdc['ops_branch_id']}
+        branch_codes = {
+            branch['id']: branch['code']
+            for branch in self.env['ops.branch'].browse(list(branch_ids)).read(['code'])
+        }
+
         data = []
-        for pdc in pdcs:
+        for pdc in records:
+            partner = pdc['partner_id']
+            branch = pdc['ops_branch_id']
             data.append({
-                'id': pdc.id,
-                'name': pdc.name,
-                'partner_name': pdc.partner_id.name,
-                'partner_id': pdc.partner_id.id,
-                'amount': pdc.amount,
-                'currency': pdc.currency_id.name,
-                'check_number': pdc.check_number,
-                'check_date': str(pdc.check_date) if pdc.check_date else '',
-                'maturity_date': str(pdc.maturity_date),
-                'bank_name': pdc.bank_id.name if pdc.bank_id else '',
-                'branch_name': pdc.branch_id.name if pdc.branch_id else '',
-                'branch_code': pdc.branch_id.code if pdc.branch_id else '',
-                'state': pdc.state,
-                'state_label': dict(pdc._fields['state'].selection).get(pdc.state),
+                'id': pdc['id'],
+                'name': pdc['name'],
+                'partner_name': partner[1] if partner else '',
+                'partner_id': partner[0] if partner else False,
+                'amount': pdc['amount'],
+                'currency': pdc['currency_id'][1] if pdc['currency_id'] else '',
+                'check_number': pdc['check_number'],
+                'check_date': str(pdc['check_date']) if pdc['check_date'] else '',
+                'maturity_date': str(pdc['maturity_date']),
+                'bank_name': pdc['bank_id'][1] if pdc['bank_id'] else '',
+                'branch_name': branch[1] if branch else '',
+                'branch_code': branch_codes.get(branch[0], '') if branch else '',
+                'state': pdc['state'],
+                'state_label': state_labels.get(pdc['state']),
                 'pdc_type': pdc_type,
-                'notes': pdc.notes or '',
+                'notes': pdc['notes'] or '',
             })
         return data
 
@@ -410,20 +444,24 @@ class OpsTreasuryReportWizard(models.TransientModel):
             'older': {'label': f'>{period*4} days', 'inbound': 0, 'outbound': 0, 'inbound_count': 0, 'outbound_count': 0},
         }
 
-        # Process inbound PDCs
-        if self.pdc_type in ('inbound', 'both'):
-            domain = self._build_domain('inbound')
-            # Only analyze open PDCs for maturity
-            domain.append(('state', 'in', ['draft', 'deposited']))
-            pdcs = self.env['ops.pdc.receivable'].search(domain)
-            self._age_pdcs(pdcs, aging_buckets, today, period, 'inbound')
+        # Only analyze open PDCs for maturity
+        open_states = {
+            'inbound': ['draft', 'deposited'],
+            'outbound': ['draft', 'issued', 'presented'],
+        }
+        bank_summary = []
+        branch_summary = []
+        for pdc_type in self._get_pdc_types():
+            domain = self._build_domain(pdc_type)
+            domain.append(('state', 'in', open_states[pdc_type]))
 
-        # Process outbound PDCs
-        if self.pdc_type in ('outbound', 'both'):
-            domain = self._build_domain('outbound')
-            domain.append(('state', 'in', ['draft', 'issued', 'presented']))
-            pdcs = self.env['ops.pdc.payable'].search(domain)
-            self._age_pdcs(pdcs, aging_buckets, today, period, 'outbound')
+            bucket_totals = self._get_maturity_buckets(pdc_type, domain, today, period)
+            for bucket, (count, amount) in bucket_totals.items():
+                aging_buckets[bucket][pdc_type] += amount
+                aging_buckets[bucket][f'{pdc_type}_count'] += count
+
+            bank_summary += self._get_pdc_summary(pdc_type, domain, 'bank_id')
+            branch_summary += self._get_pdc_summary(pdc_type, domain, 'ops_branch_id')
 
         # Calculate totals
         total_inbound = sum(b['inbound'] for b in aging_buckets.values())
@@ -440,6 +478,8 @@ class OpsTreasuryReportWizard(models.TransientModel):
             'filters': self._get_filter_dict(),
             'pdc_type': self.pdc_type,
             'aging_buckets': list(aging_buckets.values()),
+            'bank_summary': bank_summary,
+            'branch_summary': branch_summary,
             'totals': {
                 'inbound_total': total_inbound,
                 'outbound_total': total_outbound,
@@ -447,28 +487,82 @@ class OpsTreasuryReportWizard(models.TransientModel):
             },
         }
 
-    def _age_pdcs(self, pdcs, buckets, today, period, pdc_type):
-        """Age PDCs into appropriate buckets."""
-        for pdc in pdcs:
-            days_to_maturity = (pdc.maturity_date - today).days
-
-            if days_to_maturity < 0:
-                bucket = 'overdue'
-            elif days_to_maturity == 0:
-                bucket = 'current'
-            elif days_to_maturity <= period:
-                bucket = 'period_1'
-            elif days_to_maturity <= period * 2:
-                bucket = 'period_2'
-            elif days_to_maturity <= period * 3:
-                bucket = 'period_3'
-            elif days_to_maturity <= period * 4:
-                bucket = 'period_4'
-            else:
-                bucket = 'older'
+    def _get_maturity_buckets(self, pdc_type, domain, today, period):
+        """Age PDCs into maturity buckets with one grouped query.
+
+        The bucket is a ``CASE`` on the days left to maturity, so only one
+        row per bucket leaves the database. The domain goes through
+        ``_search`` and keeps record rules.
 
-            buckets[bucket][pdc_type] += pdc.amount
-            buckets[bucket][f'{pdc_type}_count'] += 1
+        Args:
+            pdc_type: 'inbound' or 'outbound'
+            domain: PDC search domain
+            today: Reference date for days to maturity
+            period: Bucket width in days
+
+        Returns:
+            dict: {bucket_key: (count, amount)}
+        """
+        Pdc = self.env[PDC_MODELS[pdc_type]]
+        Pdc.flush_model(['maturity_date', 'amount'])
+        query = Pdc._search(domain)
+        days_to_maturity = SQL(
+            "(%s - %s::date)", SQL.identifier(query.table, 'maturity_date'), today,
+        )
+        bucket = SQL(
+            """CASE
+                WHEN %(days)s < 0 THEN 'overdue'
+                WHEN %(days)s = 0 THEN 'current'
+                WHEN %(days)s <= %(p1)s THEN 'period_1'
+                WHEN %(days)s <= %(p2)s THEN 'period_2'
+                WHEN %(days)s <= %(p3)s THEN 'period_3'
+                WHEN %(days)s <= %(p4)s THEN 'period_4'
+                ELSE 'older'
+            END""",
+            days=days_to_maturity, p1=period, p2=period * 2, p3=period * 3, p4=period * 4,
+        )
+        self.env.cr.execute(SQL(
+            """SELECT pdc.bucket, COUNT(*), COALESCE(SUM(pdc.amount), 0)
+                 FROM (%s) AS pdc
+             GROUP BY pdc.bucket""",
+            query.select(
+                SQL("%s AS bucket", bucket),
+                SQL("%s AS amount", SQL.identifier(query.table, 'amount')),
+            ),
+        ))
+        return {bucket_key: (count, amount) for bucket_key, count, amount in self.env.cr.fetchall()}
+
+    def _get_pdc_summary(self, pdc_type, domain, groupby):
+        """Total PDC count and amount per value of ``groupby`` (grouped SQL).
+
+        Args:
+            pdc_type: 'inbound' or 'outbound'
+            domain: PDC search domain
+            groupby: Field to group on (e.g. 'bank_id', 'ops_branch_id', 'state')
+
+        Returns:
+            list: Dicts with name, pdc_type, total and count per group
+        """
+        Pdc = self.env[PDC_MODELS[pdc_type]]
+        field = Pdc._fields[groupby]
+        labels = (
+            dict(field._description_selection(self.env)) if field.type == 'selection' else {}
+        )
+        summary = []
+        for key, count, amount in Pdc._read_group(
+            domain, groupby=[groupby], aggregates=['__count', 'amount:sum'],
+        ):
+            if field.type == 'many2one':
+                name = key.display_name if key else ''
+            else:
+                name = labels.get(key, key) or ''
+            summary.append({
+                'name': name or 'Unspecified',
+                'pdc_type': pdc_type,
+                'total': amount or 0.0,
+                'count': count,
+            })
+        return summary
 
     # ============================================
     # PDCs IN HAND DATA
@@ -481,34 +575,31 @@ class OpsTreasuryReportWizard(models.TransientModel):
         inbound_data = []
         outbound_data = []
 
+        # Group totals are aggregated in SQL
+        group_fields = {
+            'branch': 'ops_branch_id',
+            'partner': 'partner_id',
+            'bank': 'bank_id',
+            'state': 'state',
+        }
+        groupby = group_fields.get(self.group_by)
+        grouped_inbound = []
+        grouped_outbound = []
+
         # Fetch open receivable PDCs (in hand = draft or deposited)
         if self.pdc_type in ('inbound', 'both'):
-            domain = self._build_domain('inbound')
             # Already filtered for on_hand in _build_domain
-            pdcs = self.env['ops.pdc.receivable'].search(domain, order='maturity_date, id')
-            inbound_data = self._process_pdc_records(pdcs, 'inbound')
+            domain = self._build_domain('inbound')
+            inbound_data = self._read_pdc_records('inbound', domain)
+            if groupby:
+                grouped_inbound = self._get_pdc_summary('inbound', domain, groupby)
 
         # Fetch open payable PDCs (in hand = draft or issued)
         if self.pdc_type in ('outbound', 'both'):
             domain = self._build_domain('outbound')
-            pdcs = self.env['ops.pdc.payable'].search(domain, order='maturity_date, id')
-            outbound_data = self._process_pdc_records(pdcs, 'outbound')
-
-        # Group by branch if requested
-        grouped_inbound = {}
-        grouped_outbound = {}
-        if self.group_by == 'branch':
-            grouped_inbound = self._group_by_field(inbound_data, 'branch_name')
-            grouped_outbound = self._group_by_field(outbound_data, 'branch_name')
-        elif self.group_by == 'partner':
-            grouped_inbound = self._group_by_field(inbound_data, 'partner_name')
-            grouped_outbound = self._group_by_field(outbound_data, 'partner_name')
-        elif self.group_by == 'bank':
-            grouped_inbound = self._group_by_field(inbound_data, 'bank_name')
-            grouped_outbound = self._group_by_field(outbound_data, 'bank_name')
-        elif self.group_by == 'state':
-            grouped_inbound = self._group_by_field(inbound_data, 'state_label')
-            grouped_outbound = self._group_by_field(outbound_data, 'state_label')
+            outbound_data = self._read_pdc_records('outbound', domain)
+            if groupby:
+                grouped_outbound = self._get_pdc_summary('outbound', domain, groupby)
 
         inbound_total = sum(p['amount'] for p in inbound_data)
         outbound_total = sum(p['amount'] for p in outbound_data)
@@ -542,23 +633,6 @@ class OpsTreasuryReportWizard(models.TransientModel):
             },
         }
 
-    def _group_by_field(self, data, field_name):
-        """Group data by a specific field."""
-        grouped = {}
-        for item in data:
-            key = item.get(field_name, 'Unspecified') or 'Unspecified'
-            if key not in grouped:
-                grouped[key] = {
-                    'name': key,
-                    'items': [],
-                    'total': 0,
-                    'count': 0,
-                }
-            grouped[key]['items'].append(item)
-            grouped[key]['total'] += item['amount']
-            grouped[key]['count'] += 1
-        return list(grouped.values())
-
     # ============================================
     # HELPER METHODS
     # ============================================
@@ -630,35 +704,15 @@ class OpsTreasuryReportWizard(models.TransientModel):
         """
         self.ensure_one()
 
-        try:
-            import xlsxwriter
-        except ImportError:
-            raise UserError(_("xlsxwriter Python library is not installed. Cannot generate Excel reports."))
-
-        import io
-        import base64
-
         # Get report data with security checks
         report_data = self._get_report_data()
 
-        # Create in-memory Excel file
-        output = io.BytesIO()
-        workbook = xlsxwriter.Workbook(output, {'in_memory': True})
-
-        try:
-            # Generate Excel report using the XLSX report generator
-            xlsx_report = self.env['report.ops_matrix_accounting.report_treasury_xlsx']
-            xlsx_report.generate_xlsx_report(workbook, report_data, self)
-        finally:
-            workbook.close()
-
-        # Get file content
-        output.seek(0)
-        file_content = output.read()
-        output.close()
-
-        # Encode to base64
-        file_content_b64 = base64.b64encode(file_content)
+        # Write the workbook to a temporary file in constant memory
+        Xlsx = self.env['ops.xlsx.abstract']
+        xlsx_report = self.env['report.ops_matrix_accounting.report_treasury_xlsx']
+        output, _size = Xlsx._write_xlsx_file(
+            lambda workbook: xlsx_report.generate_xlsx_report(workbook, report_data, self)
+        )
 
         # Generate filename based on report type
         report_type_labels = {
@@ -675,15 +729,8 @@ class OpsTreasuryReportWizard(models.TransientModel):
         pdc_label = pdc_type_labels.get(self.pdc_type, '')
         filename = f"OPS_{report_label}_{pdc_label}_{fields.Date.today().strftime('%Y%m%d')}.xlsx"
 
-        # Create attachment and return download action
-        attachment = self.env['ir.attachment'].create({
-            'name': filename,
-            'type': 'binary',
-            'datas': file_content_b64,
-            'res_model': self._name,
-            'res_id': self.id,
-            'mimetype': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
-        })
+        # Store raw bytes (no base64 round-trip) and return download action
+        attachment = Xlsx._xlsx_attachment(output, filename, self)
 
         return {
             'type': 'ir.actions.act_url',
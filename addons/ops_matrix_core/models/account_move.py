@@ -74,8 +74,16 @@ class AccountMove(models.Model):
     
     @api.depends('invoice_line_ids', 'invoice_line_ids.purchase_line_id')
     def _compute_three_way_match_status(self):
+        # Resolve (or create) the match records of all bills in one pass
+        vendor_bills = self.filtered(
+            lambda m: m.move_type == 'in_invoice' and m.company_id.enable_three_way_match
+        )
+        matches = self.env['ops.three.way.match']._get_or_create_for_lines(
+            vendor_bills.invoice_line_ids.purchase_line_id
+        )
+
         for move in self:
-            if move.move_type != 'in_invoice' or not move.company_id.enable_three_way_match:
+            if move not in vendor_bills:
                 move.three_way_match_status = 'not_applicable'
                 move.three_way_match_issues = False
                 continue
@@ -90,18 +98,8 @@ class AccountMove(models.Model):
                 continue
 
             for line in po_lines:
-                match = self.env['ops.three.way.match'].search([
-                    ('purchase_line_id', '=', line.purchase_line_id.id)
-                ], limit=1)
-               
-                if not match:
-                    match = self.env['ops.three.way.match'].create({
-                        'purchase_order_id': line.purchase_line_id.order_id.id,
-                        'purchase_line_id': line.purchase_line_id.id,
-                        'ordered_qty': line.purchase_line_id.product_qty,
-                    })
-               
-                if match.is_blocked:
+                match = matches.get(line.purchase_line_id._origin.id)
+                if match and match.is_blocked:
                     has_blocked = True
                     issues.append(f"Line {line.name or 'N/A'}: {match.blocking_reason}")
            
@@ -277,10 +275,10 @@ class AccountMove(models.Model):
         2. Matrix dimensions are properly assigned
         3. Three-way match validations pass
         """
+        # Check Segregation of Duties (SoD) rules BEFORE posting
+        self._check_sod_violation('post')
+
         for move in self:
-            # Check Segregation of Duties (SoD) rules BEFORE posting
-            move._check_sod_violation('post')
-            
             if move.three_way_match_status == 'blocked' and not move.three_way_match_override_approved and move.company_id.three_way_match_block_validation:
                 raise UserError(
                     _("Cannot validate this invoice due to three-way match issues:\n\n%s\n\nPlease verify quantities with your Purchase Manager or request an override approval.")
@@ -14,16 +14,14 @@ class AccountPayment(models.Model):
         
         This ensures that SoD rules prevent same user from creating and posting payments.
         """
-        for payment in self:
-            _logger.info("SoD Check: Processing payment %s for posting", payment.name)
-            
-            # ADMIN BYPASS: Skip SoD checks for administrators
-            if self.env.su or self.env.user.has_group('base.group_system'):
-                _logger.info("SoD Check: Admin bypass for payment %s", payment.name)
-                continue
-            
+        _logger.info("SoD Check: Processing payments %s for posting", self.mapped('name'))
+
+        # ADMIN BYPASS: Skip SoD checks for administrators
+        if self.env.su or self.env.user.has_group('base.group_system'):
+            _logger.info("SoD Check: Admin bypass for payments %s", self.mapped('name'))
+        else:
             # Check Segregation of Duties (SoD) rules BEFORE posting
-            payment._check_sod_violation('post')
+            self._check_sod_violation('post')
         
         # If all checks pass, proceed with posting
         return super().action_post()
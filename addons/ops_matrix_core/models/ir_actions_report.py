@@ -15,6 +15,9 @@ class IrActionsReport(models.Model):
         
         This prevents users from printing/downloading PDFs of documents
         that violate active governance rules or require pending approvals.
+        The whole batch is checked in one pass; blocked documents are left
+        out of a multi-document print, which only fails when every document
+        is blocked.
         
         Blocks print for: sale.order, purchase.order, account.move
         """
@@ -33,50 +36,30 @@ class IrActionsReport(models.Model):
             # Get the records being printed
             records = self.env[target_model].browse(res_ids)
             
-            for record in records:
-                # Check if model has governance mixin
-                if hasattr(record, '_enforce_governance_rules'):
-                    try:
-                        # Check for pending approvals
-                        if hasattr(record, 'approval_request_ids'):
-                            pending_approvals = record.approval_request_ids.filtered(
-                                lambda a: a.state == 'pending'
-                            )
-                            
-                            if pending_approvals:
-                                rule_names = ', '.join(pending_approvals.mapped('rule_id.name'))
-                                raise UserError(_(
-                                    "🚫 COMMITMENT BLOCKED: You cannot Print or Download PDF for "
-                                    "document '%s' until it satisfies company Governance Rules.\n\n"
-                                    "⏳ Pending Approval: %s\n\n"
-                                    "This document is locked for external commitment (email or print) "
-                                    "until the required approvals are granted."
-                                ) % (record.display_name, rule_names))
-                        
-                        # Enforce governance rules (will raise UserError if blocked)
-                        # Use 'on_write' trigger as it's the most comprehensive
-                        record._enforce_governance_rules(record, trigger_type='on_write')
-                        
-                        _logger.info(
-                            "OPS Governance: PDF generation allowed for %s %s after rules check",
-                            target_model, record.id
-                        )
-                        
-                    except UserError as e:
-                        # Re-raise with enhanced message for print context
-                        error_message = str(e)
-                        if 'requires approval' in error_message.lower():
-                            # This is an approval requirement - enhance the message
-                            raise UserError(_(
-                                "🚫 COMMITMENT BLOCKED: You cannot Print or Email document '%s'.\n\n"
-                                "%s\n\n"
-                                "External commitment (print/email) is blocked until approval is granted."
-                            ) % (record.display_name, error_message))
-                        else:
-                            # Re-raise the original error with print context
-                            raise UserError(_(
-                                "🚫 COMMITMENT BLOCKED: You cannot Print document '%s'.\n\n%s"
-                            ) % (record.display_name, error_message))
+            # Check if model has governance mixin
+            if hasattr(records, '_get_commitment_blocks'):
+                # Use 'on_write' trigger as it's the most comprehensive
+                blocked = records._get_commitment_blocks(trigger_type='on_write')
+                blocked_records = records.filtered(lambda r: r.id in blocked)
+                
+                if blocked_records == records:
+                    raise UserError('\n\n'.join(
+                        _("🚫 COMMITMENT BLOCKED: You cannot Print document '%s'.\n\n%s")
+                        % (record.display_name, blocked[record.id])
+                        for record in blocked_records
+                    ))
+                
+                if blocked_records:
+                    _logger.warning(
+                        "OPS Governance: PDF generation skipped for blocked %s %s",
+                        target_model, blocked_records.ids
+                    )
+                    res_ids = (records - blocked_records).ids
+                
+                _logger.info(
+                    "OPS Governance: PDF generation allowed for %s %s after rules check",
+                    target_model, res_ids
+                )
         
         # If all checks pass, proceed with PDF generation
         return super()._render_qweb_pdf(report_ref, res_ids, data)
@@ -1,6 +1,8 @@
 from odoo import models, fields, api, Command, _
+from odoo.tools import SQL
 from typing import List, Dict, Any
 from datetime import timedelta
+import operator as py_operator
 import logging
 
 _logger = logging.getLogger(__name__)
@@ -186,30 +188,36 @@ class OpsApprovalRequest(models.Model):
     escalation_level = fields.Integer('Current Escalation Level', default=0, tracking=True)
     escalation_date = fields.Datetime('Last Escalation Date', readonly=True, tracking=True)
     escalation_history = fields.Text('Escalation History', readonly=True)
-    is_overdue = fields.Boolean('Overdue', compute='_compute_is_overdue', store=True)
-    hours_pending = fields.Float('Hours Pending', compute='_compute_hours_pending', store=True)
-    next_escalation_date = fields.Datetime('Next Escalation Date', compute='_compute_next_escalation_date', store=True)
+    # Aging is evaluated against the current time on every read/search,
+    # so it is never stored; only the escalation deadline is.
+    is_overdue = fields.Boolean('Overdue', compute='_compute_is_overdue', search='_search_is_overdue')
+    hours_pending = fields.Float('Hours Pending', compute='_compute_hours_pending', search='_search_hours_pending')
+    next_escalation_date = fields.Datetime('Next Escalation Date', compute='_compute_next_escalation_date', store=True, index=True)
 
     # --- COMPUTED METHODS ---
 
     @api.depends('requested_date', 'escalation_date', 'state')
     def _compute_hours_pending(self):
+        now = fields.Datetime.now()
         for request in self:
             if request.state == 'pending':
                 last_event_date = request.escalation_date or request.requested_date
-                request.hours_pending = (fields.Datetime.now() - last_event_date).total_seconds() / 3600
+                request.hours_pending = (now - last_event_date).total_seconds() / 3600
             else:
                 request.hours_pending = 0
 
-    @api.depends('hours_pending', 'rule_id.escalation_timeout_hours')
+    @api.depends('state', 'next_escalation_date')
     def _compute_is_overdue(self):
+        now = fields.Datetime.now()
         for request in self:
-            if request.state == 'pending' and request.rule_id and request.rule_id.enable_escalation:
-                request.is_overdue = request.hours_pending > request.rule_id.escalation_timeout_hours
-            else:
-                request.is_overdue = False
-
-    @api.depends('escalation_date', 'rule_id.escalation_timeout_hours')
+            request.is_overdue = bool(
+                request.state == 'pending'
+                and request.next_escalation_date
+                and request.next_escalation_date < now
+            )
+
+    @api.depends('state', 'requested_date', 'escalation_date',
+                 'rule_id.enable_escalation', 'rule_id.escalation_timeout_hours')
     def _compute_next_escalation_date(self):
         for request in self:
             if request.state == 'pending' and request.rule_id and request.rule_id.enable_escalation:
@@ -218,6 +226,70 @@ class OpsApprovalRequest(models.Model):
             else:
                 request.next_escalation_date = False
 
+    def _search_is_overdue(self, operator, value):
+        """Overdue means a pending request's (indexed) escalation deadline has passed."""
+        if operator not in ('=', '!=', 'in', 'not in'):
+            return NotImplemented
+        values = {bool(v) for v in value} if operator in ('in', 'not in') else {bool(value)}
+        if operator in ('!=', 'not in'):
+            values = {True, False} - values
+
+        now = fields.Datetime.now()
+        overdue_domain = [('state', '=', 'pending'), ('next_escalation_date', '<', now)]
+        if values == {True, False}:
+            return []
+        if values == {True}:
+            return overdue_domain
+        if values == {False}:
+            return [
+                '|', '|',
+                    ('state', '!=', 'pending'),
+                    ('next_escalation_date', '=', False),
+                    ('next_escalation_date', '>=', now),
+            ]
+        return [('id', '=', False)]
+
+    def _search_hours_pending(self, operator, value):
+        """
+        Translate a condition on the pending age into one on the dates.
+
+        ``hours_pending > X`` is ``COALESCE(escalation_date, requested_date)
+        < now() - X hours`` on pending requests; other requests are 0 hours old.
+        """
+        date_operators = {'>': '<', '>=': '<=', '<': '>', '<=': '>='}
+        if operator not in date_operators:
+            return NotImplemented
+        cutoff = fields.Datetime.now() - timedelta(hours=value)
+        date_operator = date_operators[operator]
+        pending_domain = [
+            ('state', '=', 'pending'),
+            '|',
+                '&', ('escalation_date', '!=', False), ('escalation_date', date_operator, cutoff),
+                '&', ('escalation_date', '=', False), ('requested_date', date_operator, cutoff),
+        ]
+        compare = {'>': py_operator.gt, '>=': py_operator.ge, '<': py_operator.lt, '<=': py_operator.le}
+        if compare[operator](0.0, value):
+            return ['|', ('state', '!=', 'pending'), '&', *pending_domain]
+        return pending_domain
+
+    def _order_field_to_sql(self, alias, field_name, direction, nulls, query):
+        """Sort on the real pending age, computed by PostgreSQL."""
+        if field_name == 'hours_pending':
+            return SQL("%s %s %s", self._hours_pending_sql(alias), direction, nulls)
+        return super()._order_field_to_sql(alias, field_name, direction, nulls, query)
+
+    @api.model
+    def _hours_pending_sql(self, alias):
+        """SQL expression of hours_pending for the table alias."""
+        return SQL(
+            """CASE WHEN %(state)s = 'pending'
+                    THEN EXTRACT(EPOCH FROM (NOW() AT TIME ZONE 'UTC' - COALESCE(%(escalation)s, %(requested)s))) / 3600
+                    ELSE 0 END""",
+            state=SQL.identifier(alias, 'state'),
+            escalation=SQL.identifier(alias, 'escalation_date'),
+            requested=SQL.identifier(alias, 'requested_date'),
+        )
+
     @api.depends('record_ref')
     def _compute_matrix_dimensions(self):
         """Extract matrix dimensions from referenced record."""
@@ -615,10 +687,11 @@ class OpsApprovalRequest(models.Model):
 
     @api.model
     def _cron_escalate_overdue_approvals(self):
+        # Single range scan on the indexed escalation deadline
         overdue_requests = self.search([
             ('state', '=', 'pending'),
-            ('is_overdue', '=', True),
-        ])
+            ('next_escalation_date', '<', fields.Datetime.now()),
+        ], order='next_escalation_date')
         _logger.info(f"Found {len(overdue_requests)} overdue approval requests to escalate.")
         for request in overdue_requests:
             try:
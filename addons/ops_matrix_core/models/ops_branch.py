@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-from odoo import models, fields, api, _
+from odoo import models, fields, api, tools, _
 from odoo.exceptions import ValidationError, UserError
 from typing import List, Dict, Any
 
@@ -247,7 +247,9 @@ class OpsBranch(models.Model):
                         "Please deactivate it instead."
                     ) % branch.name)
         
-        return super().unlink()
+        result = super().unlink()
+        self.env.registry.clear_cache()
+        return result
 
     # ---------------------------------------------------------
     # CRUD & Analytic Sync
@@ -261,6 +263,8 @@ class OpsBranch(models.Model):
         
         records = super().create(vals_list)
         records._create_analytic_accounts()
+        if any(vals.get('warehouse_id') for vals in vals_list):
+            self.env.registry.clear_cache()
         return records
 
     def write(self, vals: Dict[str, Any]) -> bool:
@@ -268,8 +272,34 @@ class OpsBranch(models.Model):
         result = super().write(vals)
         if 'name' in vals or 'code' in vals:
             self._sync_analytic_account_name()
+        if 'warehouse_id' in vals or 'active' in vals:
+            self.env.registry.clear_cache()
         return result
 
+    # ---------------------------------------------------------
+    # Warehouse Resolution
+    # ---------------------------------------------------------
+    @api.model
+    @tools.ormcache()
+    def _get_warehouse_branch_map(self) -> Dict[int, int]:
+        """Map each warehouse to the branch that owns it.
+
+        Built once and kept in the registry cache; it is cleared whenever a
+        branch's warehouse or active flag changes, or a warehouse is removed.
+        When several branches share a warehouse the first one in ``_order``
+        wins, matching a ``search(..., limit=1)`` lookup.
+
+        Returns:
+            dict: {warehouse_id: branch_id}
+        """
+        branches = self.sudo().search_read(
+            [('warehouse_id', '!=', False)], ['warehouse_id'], load=None,
+        )
+        warehouse_branch_map = {}
+        for branch in branches:
+            warehouse_branch_map.setdefault(branch['warehouse_id'], branch['id'])
+        return warehouse_branch_map
+
     # ---------------------------------------------------------
     # Analytic Account Management
     # ---------------------------------------------------------
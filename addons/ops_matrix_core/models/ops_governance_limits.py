@@ -1,15 +1,235 @@
 # -*- coding: utf-8 -*-
 
-from odoo import models, fields, api, _
+from odoo import models, fields, api, tools, _
 from odoo.exceptions import ValidationError
 import logging
 
 _logger = logging.getLogger(__name__)
 
 
+class OpsGovernanceLimitIndex(models.AbstractModel):
+    """
+    In-memory resolution index of governance limits.
+
+    Discount limits, margin rules and price authorities of a company's
+    governance rules are loaded once into plain Python structures kept in
+    the registry cache. Resolving the most specific applicable limit for a
+    (branch, BU, product category, persona) context is then a dictionary
+    lookup with no database round-trip. The cache is cleared whenever a
+    limit or a governance rule is created, written or deleted.
+    """
+    _name = 'ops.governance.limit.index'
+    _description = 'Governance Limit Resolution Index'
+
+    @api.model
+    @tools.ormcache('company_id')
+    def _get_company_index(self, company_id):
+        """
+        Build the limit index of one company.
+
+        Args:
+            company_id: res.company id
+
+        Returns:
+            dict: {rule_id: {'discount': tuple, 'margin': dict, 'authority': tuple}}
+                where discount/authority entries are (limit_id, persona_id,
+                group_id, values..., branch_ids, bu_ids, category_ids) tuples
+                and margin maps (category_id, bu_id, branch_id) to the
+                minimum margin
+        """
+        rules = self.env['ops.governance.rule'].sudo().with_context(active_test=False).search([
+            ('company_id', '=', company_id),
+        ])
+
+        def scope(limit):
+            return (
+                frozenset(limit.branch_ids.ids),
+                frozenset(limit.business_unit_ids.ids),
+                frozenset(limit.product_category_ids.ids),
+            )
+
+        index = {}
+        for rule in rules:
+            margin = {}
+            # One2many follows the comodel _order, so the first rule of a
+            # scope is the one a search(limit=1) would have returned
+            for margin_rule in rule.margin_rule_ids:
+                margin.setdefault((
+                    margin_rule.product_category_id.id,
+                    margin_rule.business_unit_id.id,
+                    margin_rule.branch_id.id,
+                ), margin_rule.minimum_margin_percent)
+
+            index[rule.id] = {
+                'discount': tuple(
+                    (limit.id, limit.persona_id.id, limit.user_group_id.id,
+                     limit.max_discount_percent) + scope(limit)
+                    for limit in rule.discount_limit_ids
+                ),
+                'margin': margin,
+                'authority': tuple(
+                    (auth.id, auth.persona_id.id, auth.user_group_id.id,
+                     auth.max_price_variance_percent, auth.can_override_without_approval,
+                     auth.approval_required_above) + scope(auth)
+                    for auth in rule.price_authority_ids
+                ),
+            }
+        _logger.debug("Governance limit index built for company %s (%d rules)", company_id, len(index))
+        return index
+
+    @api.model
+    def _get_rule_index(self, rule):
+        empty = {'discount': (), 'margin': {}, 'authority': ()}
+        return self._get_company_index(rule.company_id.id).get(rule.id, empty)
+
+    @api.model
+    def _in_scope(self, branch_ids, bu_ids, category_ids, branch_id, bu_id, category_id):
+        """Empty scope sets apply to everything."""
+        return (
+            (not branch_ids or branch_id in branch_ids)
+            and (not bu_ids or bu_id in bu_ids)
+            and (not category_ids or category_id in category_ids)
+        )
+
+    @api.model
+    def _user_matches(self, persona_ids, group_ids, persona_id, group_id):
+        """Match on persona, or on group membership (implied groups included)."""
+        if persona_id:
+            return persona_id in persona_ids
+        return bool(group_id) and group_id in group_ids
+
+    @api.model
+    def resolve_discount_limit(self, rule, user, persona_ids, branch_id=False, bu_id=False, category_id=False,
+                               limit_ids=None):
+        """
+        Highest discount limit granted to the user in the given scope.
+
+        Args:
+            rule: ops.governance.rule record
+            user: res.users record
+            persona_ids: Set of the user's persona ids
+            branch_id, bu_id, category_id: Scope of the document/line
+            limit_ids: Optional set of discount limit ids to consider
+
+        Returns:
+            float: Highest applicable limit, 0.0 when none applies
+        """
+        group_ids = set(user.all_group_ids.ids)
+        limits = [
+            max_discount
+            for limit_id, persona_id, group_id, max_discount, *limit_scope in self._get_rule_index(rule)['discount']
+            if (limit_ids is None or limit_id in limit_ids)
+            and self._user_matches(persona_ids, group_ids, persona_id, group_id)
+            and self._in_scope(*limit_scope, branch_id, bu_id, category_id)
+        ]
+        return max(limits, default=0.0)
+
+    @api.model
+    def resolve_minimum_margin(self, rule, category_id, bu_id=False, branch_id=False):
+        """
+        Most specific minimum margin for a category.
+
+        Falls back from category+BU+branch to category+BU, category+branch
+        and finally category only.
+
+        Returns:
+            float or None: None when no margin rule covers the category
+        """
+        margins = self._get_rule_index(rule)['margin']
+        candidates = []
+        if bu_id and branch_id:
+            candidates.append((category_id, bu_id, branch_id))
+        if bu_id:
+            candidates.append((category_id, bu_id, False))
+        if branch_id:
+            candidates.append((category_id, False, branch_id))
+        candidates.append((category_id, False, False))
+        for key in candidates:
+            if key in margins:
+                return margins[key]
+        return None
+
+    @api.model
+    def resolve_minimum_margins(self, rule, lines):
+        """
+        Most specific minimum margin of every line of a batch.
+
+        Args:
+            rule: ops.governance.rule record
+            lines: Lines with product_id and optional ops_business_unit_id / ops_branch_id
+
+        Returns:
+            dict: {line_id: minimum margin or None}
+        """
+        has_bu = 'ops_business_unit_id' in lines._fields
+        has_branch = 'ops_branch_id' in lines._fields
+        return {
+            line.id: self.resolve_minimum_margin(
+                rule,
+                line.product_id.categ_id.id,
+                line.ops_business_unit_id.id if has_bu else False,
+                line.ops_branch_id.id if has_branch else False,
+            )
+            for line in lines
+        }
+
+    @api.model
+    def resolve_price_authority(self, rule, user, persona_ids, branch_id=False, bu_id=False, category_id=False,
+                                authority_ids=None):
+        """
+        Most permissive price authority of the user in the given scope.
+
+        Args:
+            authority_ids: Optional set of price authority ids to consider
+
+        Returns:
+            dict: max_variance, can_override and requires_approval_above
+        """
+        group_ids = set(user.all_group_ids.ids)
+        best = None
+        for auth_id, persona_id, group_id, max_variance, can_override, approval_above, *auth_scope in \
+                self._get_rule_index(rule)['authority']:
+            if authority_ids is not None and auth_id not in authority_ids:
+                continue
+            if not self._user_matches(persona_ids, group_ids, persona_id, group_id):
+                continue
+            if not self._in_scope(*auth_scope, branch_id, bu_id, category_id):
+                continue
+            if best is None or max_variance > best['max_variance']:
+                best = {
+                    'max_variance': max_variance,
+                    'can_override': can_override,
+                    'requires_approval_above': approval_above,
+                }
+        return best or {'max_variance': 0.0, 'can_override': False, 'requires_approval_above': 0.0}
+
+
+class OpsGovernanceLimitCacheMixin(models.AbstractModel):
+    """Clear the limit resolution index when limits change."""
+    _name = 'ops.governance.limit.cache.mixin'
+    _description = 'Governance Limit Index Invalidation'
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        self.env.registry.clear_cache()
+        return records
+
+    def write(self, vals):
+        result = super().write(vals)
+        self.env.registry.clear_cache()
+        return result
+
+    def unlink(self):
+        result = super().unlink()
+        self.env.registry.clear_cache()
+        return result
+
+
 class OpsGovernanceDiscountLimit(models.Model):
     """Role-Based Discount Limits integrated with Persona Model"""
     _name = 'ops.governance.discount.limit'
+    _inherit = ['ops.governance.limit.cache.mixin']
     _description = 'Role-Based Discount Limits'
     _order = 'max_discount_percent desc'
     
@@ -105,22 +325,11 @@ class OpsGovernanceDiscountLimit(models.Model):
     def get_applicable_limit(self, user, branch_id=False, bu_id=False, category_id=False):
         """Get applicable discount limit for user in context."""
         self.ensure_one()
-        
-        # Check persona match
         user_personas = user.persona_ids if hasattr(user, 'persona_ids') else self.env['ops.persona']
-        
-        for persona in user_personas:
-            if self.persona_id == persona:
-                # Check scope restrictions
-                if self._check_scope(branch_id, bu_id, category_id):
-                    return self.max_discount_percent
-        
-        # Check group match
-        if self.user_group_id and user.has_group(self.user_group_id.xml_id or 'base.group_user'):
-            if self._check_scope(branch_id, bu_id, category_id):
-                return self.max_discount_percent
-        
-        return 0.0
+        return self.env['ops.governance.limit.index'].resolve_discount_limit(
+            self.rule_id, user, set(user_personas.ids), branch_id, bu_id, category_id,
+            limit_ids={self.id},
+        )
     
     def _check_scope(self, branch_id, bu_id, category_id):
         """Check if limit applies to given scope."""
@@ -142,6 +351,7 @@ class OpsGovernanceDiscountLimit(models.Model):
 class OpsGovernanceMarginRule(models.Model):
     """Category-Specific Margin Rules with BU/Branch dimensions"""
     _name = 'ops.governance.margin.rule'
+    _inherit = ['ops.governance.limit.cache.mixin']
     _description = 'Category-Specific Margin Rules'
     _order = 'minimum_margin_percent desc'
     
@@ -228,55 +438,16 @@ class OpsGovernanceMarginRule(models.Model):
     
     def get_applicable_margin(self, category_id, bu_id=False, branch_id=False):
         """Get applicable minimum margin for given context."""
-        # Try exact match (category + BU + branch)
-        if bu_id and branch_id:
-            rule = self.search([
-                ('product_category_id', '=', category_id),
-                ('business_unit_id', '=', bu_id),
-                ('branch_id', '=', branch_id),
-                ('rule_id', '=', self.rule_id.id),
-            ], limit=1)
-            if rule:
-                return rule.minimum_margin_percent
-        
-        # Try category + BU
-        if bu_id:
-            rule = self.search([
-                ('product_category_id', '=', category_id),
-                ('business_unit_id', '=', bu_id),
-                ('branch_id', '=', False),
-                ('rule_id', '=', self.rule_id.id),
-            ], limit=1)
-            if rule:
-                return rule.minimum_margin_percent
-        
-        # Try category + branch
-        if branch_id:
-            rule = self.search([
-                ('product_category_id', '=', category_id),
-                ('business_unit_id', '=', False),
-                ('branch_id', '=', branch_id),
-                ('rule_id', '=', self.rule_id.id),
-            ], limit=1)
-            if rule:
-                return rule.minimum_margin_percent
-        
-        # Try category only
-        rule = self.search([
-            ('product_category_id', '=', category_id),
-            ('business_unit_id', '=', False),
-            ('branch_id', '=', False),
-            ('rule_id', '=', self.rule_id.id),
-        ], limit=1)
-        if rule:
-            return rule.minimum_margin_percent
-        
-        return 0.0
+        margin = self.env['ops.governance.limit.index'].resolve_minimum_margin(
+            self.rule_id, category_id, bu_id, branch_id
+        )
+        return margin if margin is not None else 0.0
 
 
 class OpsGovernancePriceAuthority(models.Model):
     """Role-Based Pricing Authority for price override control"""
     _name = 'ops.governance.price.authority'
+    _inherit = ['ops.governance.limit.cache.mixin']
     _description = 'Role-Based Pricing Authority'
     _order = 'max_price_variance_percent desc'
     
@@ -390,31 +561,11 @@ class OpsGovernancePriceAuthority(models.Model):
     def get_applicable_authority(self, user, branch_id=False, bu_id=False, category_id=False):
         """Get applicable price authority for user in context."""
         self.ensure_one()
-        
-        # Check persona match
         user_personas = user.persona_ids if hasattr(user, 'persona_ids') else self.env['ops.persona']
-        
-        for persona in user_personas:
-            if self.persona_id == persona:
-                # Check scope restrictions
-                if self._check_scope(branch_id, bu_id, category_id):
-                    return {
-                        'max_variance': self.max_price_variance_percent,
-                        'can_override': self.can_override_without_approval,
-                        'requires_approval_above': self.approval_required_above,
-                    }
-        
-        # Check group match
-        if self.user_group_id and user.has_group(self.user_group_id.xml_id or 'base.group_user'):
-            if self._check_scope(branch_id, bu_id, category_id):
-                return {
-                    'max_variance': self.max_price_variance_percent,
-                    'can_override': self.can_override_without_approval,
-                    'requires_approval_above': self.approval_required_above,
-                }
-        
-        # Default: no authority
-        return {'max_variance': 0.0, 'can_override': False, 'requires_approval_above': 0.0}
+        return self.env['ops.governance.limit.index'].resolve_price_authority(
+            self.rule_id, user, set(user_personas.ids), branch_id, bu_id, category_id,
+            authority_ids={self.id},
+        )
     
     def _check_scope(self, branch_id, bu_id, category_id):
         """Check if authority applies to given scope."""
@@ -330,6 +330,130 @@ class OpsGovernanceMixin(models.AbstractModel):
                 f'Please review the above warnings before proceeding.'
             )
 
+    def _get_commitment_blocks(self, trigger_type: str = 'on_write') -> Dict[int, str]:
+        """
+        Print/email gate: evaluate governance for the whole recordset at once.
+
+        Pending approvals are read with a single search and every rule is
+        evaluated once across the records it can still block (one
+        filtered_domain for domain rules). Unlike _enforce_governance_rules
+        this never raises nor creates approval requests, so a batch can go
+        on with the records that are allowed. Administrators are only held
+        by pending approvals; their rule bypass is audited once per batch.
+
+        :param trigger_type: Trigger of the rules to evaluate ('on_write')
+        :return: {record_id: reason} for each blocked record; records that
+                 are not in the dict are allowed
+        """
+        blocked = {}
+        records = self.filtered('id')
+        if not records:
+            return blocked
+
+        ApprovalRequest = self.env['ops.approval.request']
+        pending_rules = {}
+        for approval in ApprovalRequest.search([
+            ('model_name', '=', self._name),
+            ('res_id', 'in', records.ids),
+            ('state', '=', 'pending'),
+        ]):
+            pending_rules.setdefault(approval.res_id, []).append(approval.rule_id.name or '')
+        for res_id, rule_names in pending_rules.items():
+            blocked[res_id] = _(
+                "⏳ Pending Approval: %s\n\n"
+                "This document is locked for external commitment (email or print) "
+                "until the required approvals are granted."
+            ) % ', '.join(rule_names)
+
+        # ADMIN BYPASS: Pending approvals still block, rules are skipped
+        if self.env.su or self.env.user.has_group('base.group_system'):
+            try:
+                self.env['ops.security.audit'].sudo().log_security_override_batch(
+                    model_name=self._name,
+                    record_ids=records.ids,
+                    reason=f'Admin bypass used to skip governance rule enforcement on {trigger_type}'
+                )
+            except Exception as e:
+                _logger.warning("Failed to log admin override: %s", str(e))
+            return blocked
+
+        try:
+            rules = self.env['ops.governance.rule'].search([
+                ('active', '=', True),
+                ('enabled', '=', True),
+                ('model_id.model', '=', self._name),
+                ('trigger_type', '=', trigger_type),
+            ])
+        except Exception as e:
+            _logger.debug(f"Governance rule enforcement skipped (ACL/access issue): {str(e)}")
+            return blocked
+
+        approved = set()
+        approval_rules = rules.filtered(lambda r: r.action_type == 'require_approval')
+        if approval_rules:
+            approved = {
+                (approval.res_id, approval.rule_id.id)
+                for approval in ApprovalRequest.search([
+                    ('model_name', '=', self._name),
+                    ('res_id', 'in', records.ids),
+                    ('rule_id', 'in', approval_rules.ids),
+                    ('state', '=', 'approved'),
+                ])
+            }
+
+        from odoo.tools.safe_eval import safe_eval
+        for rule in rules:
+            candidates = records.filtered(lambda r: r.id not in blocked)
+            if not candidates:
+                break
+
+            if rule.condition_code:
+                code = rule.condition_code.strip()
+                if not code:
+                    continue
+                triggered = self.browse()
+                for record in candidates:
+                    safe_locals = {
+                        'self': record,
+                        'record': record,
+                        'user': record.env.user,
+                        'env': record.env,
+                    }
+                    try:
+                        if safe_eval(code, safe_locals):
+                            triggered |= record
+                    except SyntaxError as e:
+                        # Broken rule: same outcome for every record, skip it
+                        _logger.error(f"Syntax error in rule {rule.name}: {str(e)}")
+                        triggered = self.browse()
+                        break
+                    except Exception as e:
+                        blocked[record.id] = f"Error evaluating rule '{rule.name}': {str(e)}"
+            elif rule.condition_domain:
+                domain = rule._parse_domain_string(rule.condition_domain)
+                triggered = candidates.filtered_domain(domain)
+            else:
+                triggered = candidates
+
+            if rule.action_type == 'require_approval':
+                triggered = triggered.filtered(lambda r: (r.id, rule.id) not in approved)
+                message = rule.error_message or (
+                    f"This operation requires approval.\n\nRule: {rule.name}"
+                )
+            elif rule.action_type == 'block':
+                message = rule.error_message or f"Operation blocked by rule: {rule.name}"
+            elif rule.action_type == 'warning':
+                message = (
+                    f'Governance Warnings:\n{rule.error_message or f"Warning from rule: {rule.name}"}'
+                )
+            else:
+                continue
+
+            for record in triggered:
+                blocked[record.id] = message
+
+        return blocked
+
     def _apply_governance_rule(self, rule, trigger_type: str, record=None) -> Optional[Dict[str, Any]]:
         """Apply a governance rule and handle different action types."""
         if record is None:
@@ -582,14 +582,8 @@ class OpsGovernanceRule(models.Model):
             # Calculate order-level margin
             order_margin = self._calculate_order_margin(record)
             # Use lowest margin requirement from order lines
-            min_margins = [
-                self._get_minimum_margin(
-                    line.product_id.categ_id,
-                    getattr(line, 'ops_business_unit_id', False),
-                    getattr(line, 'ops_branch_id', False)
-                )
-                for line in record.order_line if line.product_id
-            ]
+            lines = record.order_line.filtered('product_id')
+            min_margins = list(self._get_minimum_margins(lines).values())
             min_margin = min(min_margins) if min_margins else self.global_minimum_margin
             
             if order_margin < min_margin:
@@ -673,44 +667,21 @@ class OpsGovernanceRule(models.Model):
     
     def _get_user_discount_limit(self, user, personas, record=None):
         """Get maximum discount percentage for user based on role/persona."""
-        max_discount = self.global_discount_limit
-        
         # Get context for scope restrictions
         branch_id = getattr(record, 'ops_branch_id', False)
         bu_id = getattr(record, 'ops_business_unit_id', False)
         category_id = False
         if record._name == 'sale.order.line' and hasattr(record, 'product_id'):
             category_id = record.product_id.categ_id.id
-        
-        # Check persona-based limits
-        for persona in personas:
-            limit_rules = self.discount_limit_ids.filtered(lambda r: r.persona_id == persona)
-            for limit_rule in limit_rules:
-                applicable_limit = limit_rule.get_applicable_limit(
-                    user,
-                    branch_id.id if branch_id else False,
-                    bu_id.id if bu_id else False,
-                    category_id
-                )
-                if applicable_limit > 0:
-                    max_discount = max(max_discount, applicable_limit)
-        
-        # Check group-based limits
-        for limit_rule in self.discount_limit_ids.filtered(lambda r: r.user_group_id):
-            try:
-                if user.has_group(limit_rule.user_group_id.xml_id or 'base.group_user'):
-                    applicable_limit = limit_rule.get_applicable_limit(
-                        user,
-                        branch_id.id if branch_id else False,
-                        bu_id.id if bu_id else False,
-                        category_id
-                    )
-                    if applicable_limit > 0:
-                        max_discount = max(max_discount, applicable_limit)
-            except Exception:
-                pass
-        
-        return max_discount
+
+        # Persona- and group-based limits, resolved from the in-memory index
+        applicable_limit = self.env['ops.governance.limit.index'].resolve_discount_limit(
+            self, user, set(personas.ids),
+            branch_id.id if branch_id else False,
+            bu_id.id if bu_id else False,
+            category_id,
+        )
+        return max(self.global_discount_limit, applicable_limit)
     
     def _calculate_line_margin(self, order_line):
         """Calculate margin percentage for a sale order line."""
@@ -744,52 +715,32 @@ class OpsGovernanceRule(models.Model):
         """Get minimum margin for product category, BU, and branch."""
         if not category:
             return self.global_minimum_margin
-        
-        # First try specific rule (category + BU + branch)
-        if business_unit and branch:
-            margin_rule = self.margin_rule_ids.filtered(
-                lambda r: r.product_category_id == category and
-                         r.business_unit_id == business_unit and
-                         r.branch_id == branch
-            )
-            if margin_rule:
-                return margin_rule[0].minimum_margin_percent
-        
-        # Try category + BU
-        if business_unit:
-            margin_rule = self.margin_rule_ids.filtered(
-                lambda r: r.product_category_id == category and
-                         r.business_unit_id == business_unit and
-                         not r.branch_id
-            )
-            if margin_rule:
-                return margin_rule[0].minimum_margin_percent
-        
-        # Try category + branch
-        if branch:
-            margin_rule = self.margin_rule_ids.filtered(
-                lambda r: r.product_category_id == category and
-                         not r.business_unit_id and
-                         r.branch_id == branch
-            )
-            if margin_rule:
-                return margin_rule[0].minimum_margin_percent
-        
-        # Try category only
-        margin_rule = self.margin_rule_ids.filtered(
-            lambda r: r.product_category_id == category and
-                     not r.business_unit_id and
-                     not r.branch_id
+
+        # Most specific rule first: category + BU + branch, then category + BU,
+        # category + branch and category only
+        margin = self.env['ops.governance.limit.index'].resolve_minimum_margin(
+            self,
+            category.id,
+            business_unit.id if business_unit else False,
+            branch.id if branch else False,
         )
-        if margin_rule:
-            return margin_rule[0].minimum_margin_percent
-        
         # Fallback to global minimum
-        return self.global_minimum_margin
+        return margin if margin is not None else self.global_minimum_margin
+
+    def _get_minimum_margins(self, lines):
+        """Get minimum margin of every order line of a batch.
+
+        Returns:
+            dict: {line_id: minimum margin}
+        """
+        margins = self.env['ops.governance.limit.index'].resolve_minimum_margins(self, lines)
+        return {
+            line_id: margin if margin is not None else self.global_minimum_margin
+            for line_id, margin in margins.items()
+        }
     
     def _get_user_price_variance_limit(self, user, record=None):
         """Get user's price variance authority."""
-        max_variance = self.global_max_price_variance
         personas = user.persona_ids if hasattr(user, 'persona_ids') else self.env['ops.persona']
         
         # Get context for scope restrictions
@@ -799,20 +750,14 @@ class OpsGovernanceRule(models.Model):
         if record and record._name == 'sale.order.line' and hasattr(record, 'product_id'):
             category_id = record.product_id.categ_id.id
         
-        # Check persona-based limits
-        for persona in personas:
-            auth_rules = self.price_authority_ids.filtered(lambda r: r.persona_id == persona)
-            for auth_rule in auth_rules:
-                authority = auth_rule.get_applicable_authority(
-                    user,
-                    branch_id.id if branch_id else False,
-                    bu_id.id if bu_id else False,
-                    category_id
-                )
-                if authority['max_variance'] > 0:
-                    max_variance = max(max_variance, authority['max_variance'])
-        
-        return max_variance
+        # Persona-based authorities, resolved from the in-memory index
+        authority = self.env['ops.governance.limit.index'].resolve_price_authority(
+            self, user, set(personas.ids),
+            branch_id.id if branch_id else False,
+            bu_id.id if bu_id else False,
+            category_id,
+        )
+        return max(self.global_max_price_variance, authority['max_variance'])
     
     def action_create_approval_request(self, record, violation_type, violation_details):
         """Create approval request for governance violation."""
@@ -1064,4 +1009,18 @@ class OpsGovernanceRule(models.Model):
         for vals in vals_list:
             if vals.get('code', 'New') == 'New':
                 vals['code'] = self.env['ir.sequence'].next_by_code('ops.governance.rule') or 'GR0001'
-        return super().create(vals_list)
+        rules = super().create(vals_list)
+        # Limits created inline belong to the company's resolution index
+        self.env.registry.clear_cache()
+        return rules
+
+    def write(self, vals):
+        result = super().write(vals)
+        if {'company_id', 'discount_limit_ids', 'margin_rule_ids', 'price_authority_ids'} & vals.keys():
+            self.env.registry.clear_cache()
+        return result
+
+    def unlink(self):
+        result = super().unlink()
+        self.env.registry.clear_cache()
+        return result
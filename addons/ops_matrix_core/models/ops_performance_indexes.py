@@ -70,6 +70,8 @@ class OpsPerformanceIndexes(models.AbstractModel):
             ('stock_quant', 'location_id', 'idx_stock_quant_location'),
             ('stock_quant', 'product_id', 'idx_stock_quant_product'),
             ('stock_quant', 'ops_business_unit_id', 'idx_stock_quant_ops_bu'),
+            # BU-scoped availability/reservation sums (stock.quant overrides)
+            ('stock_quant', 'product_id, location_id, ops_business_unit_id', 'idx_stock_quant_product_location_bu'),
             
             # Product Template indexes
             ('product_template', 'business_unit_id', 'idx_product_template_bu'),
@@ -329,7 +329,32 @@ class OpsSecurityAudit(models.Model):
             )
         except Exception as e:
             _logger.error(f"Failed to log security override: {str(e)}")
-    
+
+    @api.model
+    def log_security_override_batch(self, model_name, record_ids, reason):
+        """Log one override entry covering a whole batch of records."""
+        if len(record_ids) == 1:
+            return self.log_security_override(model_name, record_ids[0], reason)
+        try:
+            self.sudo().create({
+                'user_id': self.env.user.id,
+                'event_type': 'override_used',
+                'model_name': model_name,
+                'record_name': f"{len(record_ids)} records",
+                'details': f"Security override used: {reason}\nRecord IDs: {', '.join(map(str, record_ids))}",
+                'ip_address': self._get_client_ip(),
+                'session_id': self._get_session_id(),
+                'company_id': self.env.company.id,
+                'severity': 'critical',
+            })
+
+            _logger.warning(
+                f"Security override: User {self.env.user.name} used override on "
+                f"{len(record_ids)} {model_name} record(s)"
+            )
+        except Exception as e:
+            _logger.error(f"Failed to log security override: {str(e)}")
+
     @api.model
     def log_rule_violation(self, rule_name, details):
         """Log when a security rule is violated."""
@@ -4,7 +4,7 @@ Segregation of Duties (SoD) Security Implementation
 Prevents same user from creating AND confirming/posting critical transactions
 """
 
-from odoo import models, fields, api, _
+from odoo import models, fields, api, tools, _
 from odoo.exceptions import ValidationError, UserError
 import logging
 
@@ -171,35 +171,99 @@ class OpsSoDRule(models.Model):
         Returns: res.users or None
         """
         self.ensure_one()
-        
+        return self._get_action_1_users(record).get(record.id)
+
+    def _get_action_1_users(self, records):
+        """
+        Get the user who performed action_1 on each record of a batch.
+
+        The relational fields involved are read once for the whole recordset.
+
+        Args:
+            records: Recordset of the rule's document type
+
+        Returns:
+            dict: {record_id: res.users}, records without a known user are omitted
+        """
+        self.ensure_one()
+
         action_1 = self.action_1
-        
+
         if action_1 == 'create':
             # Get the user who created the record
-            return record.create_uid if hasattr(record, 'create_uid') else None
-        
-        elif action_1 == 'confirm':
-            # Check for state change fields or workflows
-            # For sale.order and purchase.order
-            if hasattr(record, 'state') and record.state == 'sale':
-                # Get from create_uid as fallback (cannot reliably determine who confirmed)
-                return record.create_uid
-        
-        elif action_1 == 'post':
-            # For account.move
-            if hasattr(record, 'state') and record.state == 'posted':
-                return record.create_uid
-        
-        elif action_1 == 'approve':
+            if 'create_uid' not in records._fields:
+                return {}
+            records.mapped('create_uid')
+            return {record.id: record.create_uid for record in records if record.create_uid}
+
+        if action_1 in ('confirm', 'post'):
+            # No reliable trace of who confirmed/posted: fall back to the
+            # creator once the document reached that state
+            done_state = 'sale' if action_1 == 'confirm' else 'posted'
+            if 'state' not in records._fields:
+                return {}
+            done = records.filtered(lambda r: r.state == done_state)
+            done.mapped('create_uid')
+            return {record.id: record.create_uid for record in done if record.create_uid}
+
+        if action_1 == 'approve':
             # Get from approval workflow if available
-            if hasattr(record, 'approval_request_ids'):
+            if 'approval_request_ids' not in records._fields:
+                return {}
+            records.mapped('approval_request_ids.approver_id')
+            users = {}
+            for record in records:
                 approved_requests = record.approval_request_ids.filtered(
                     lambda r: r.state == 'approved'
                 )
                 if approved_requests:
-                    return approved_requests[0].approver_id
-        
-        return None
+                    users[record.id] = approved_requests[0].approver_id
+            return users
+
+        return {}
+
+    @api.model
+    @tools.ormcache('model_name', 'action', 'company_id')
+    def _get_enforced_rule_ids(self, model_name, action, company_id):
+        """
+        Ids of the enforced rules blocking an action on a document type.
+
+        Kept in the registry cache per (model, action, company) and cleared
+        whenever a rule is created, written or deleted.
+
+        Args:
+            model_name: Technical name of the document model
+            action: The blocked action (action_2)
+            company_id: Company of the documents being checked
+
+        Returns:
+            tuple: Rule ids, in rule order
+        """
+        return tuple(self.sudo().search([
+            ('model_name', '=', model_name),
+            ('action_2', '=', action),
+            ('active', '=', True),
+            ('enabled', '=', True),
+            '|',
+                ('company_id', '=', False),
+                ('company_id', '=', company_id),
+        ]).ids)
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        rules = super().create(vals_list)
+        self.env.registry.clear_cache()
+        return rules
+
+    def write(self, vals):
+        result = super().write(vals)
+        self.env.registry.clear_cache()
+        return result
+
+    def unlink(self):
+        result = super().unlink()
+        self.env.registry.clear_cache()
+        return result
     
     def action_enable_rule(self):
             """Enable SoD rule - called from list view button"""
@@ -293,20 +357,21 @@ class OpsSoDLog(models.Model):
         help='Additional context about the violation'
     )
     
-    @api.model
-    def create(self, vals):
+    @api.model_create_multi
+    def create(self, vals_list):
         """Log when violations are created."""
-        result = super().create(vals)
+        result = super().create(vals_list)
         
         # Log to system logger for compliance audit
-        _logger.warning(
-            'SoD Violation Detected [Rule: %s] [User: %s] [Document: %s/%s] [Blocked: %s]',
-            vals.get('rule_id'),
-            vals.get('user_id'),
-            vals.get('model_name'),
-            vals.get('res_id'),
-            vals.get('blocked', True)
-        )
+        for vals in vals_list:
+            _logger.warning(
+                'SoD Violation Detected [Rule: %s] [User: %s] [Document: %s/%s] [Blocked: %s]',
+                vals.get('rule_id'),
+                vals.get('user_id'),
+                vals.get('model_name'),
+                vals.get('res_id'),
+                vals.get('blocked', True)
+            )
         
         return result
     
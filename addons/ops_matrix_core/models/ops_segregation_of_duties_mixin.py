@@ -30,6 +30,10 @@ class OpsSoDMixin(models.AbstractModel):
         """
         Check if current action violates SoD rules.
 
+        Works on the whole recordset: the applicable rules come from the
+        registry cache once per company, the action_1 users are resolved per
+        rule for the batch, and an admin bypass is audited once per call.
+
         Args:
             action (str): The action being performed (confirm, post, validate, etc.)
 
@@ -39,19 +43,20 @@ class OpsSoDMixin(models.AbstractModel):
         Returns:
             None
         """
-        self.ensure_one()
+        if not self:
+            return
 
         # Skip checks for superuser/admin but log the bypass
         if self.env.su or self.env.user.has_group('base.group_system'):
             try:
-                self.env['ops.security.audit'].sudo().log_security_override(
+                self.env['ops.security.audit'].sudo().log_security_override_batch(
                     model_name=self._name,
-                    record_id=self.id,
+                    record_ids=self.ids,
                     reason=f'Admin bypass used to skip SoD check for action: {action}'
                 )
                 _logger.warning(
-                    "Admin SoD bypass: %s skipped SoD check on %s (ID: %s) for action '%s'",
-                    self.env.user.name, self._name, self.id, action
+                    "Admin SoD bypass: %s skipped SoD check on %s (IDs: %s) for action '%s'",
+                    self.env.user.name, self._name, self.ids, action
                 )
             except Exception as e:
                 _logger.debug("Failed to log admin SoD bypass: %s", str(e))
@@ -59,63 +64,49 @@ class OpsSoDMixin(models.AbstractModel):
         
         _logger.info(
             'SoD Check: %s [%s] action=%s user=%s',
-            self._name, self.id, action, self.env.user.name
+            self._name, self.ids, action, self.env.user.name
         )
         
-        # Get applicable SoD rules
+        # Get applicable SoD rules, once per company of the batch
         SoDRule = self.env['ops.segregation.of.duties']
-        
-        rules = SoDRule.search([
-            ('model_name', '=', self._name),
-            ('action_2', '=', action),
-            ('active', '=', True),
-            '|',
-                ('company_id', '=', False),
-                ('company_id', '=', self.company_id.id)
-        ])
-        
-        if not rules:
-            return
-        
-        _logger.debug('Found %d applicable SoD rules for %s', len(rules), self._name)
-        
-        for rule in rules:
-            # CATALOG MODE: Skip rules that are not enabled
-            # This allows rules to be visible (active=True) but not enforced (enabled=False)
-            if not rule.enabled:
-                _logger.debug(
-                    'Rule %s: Not enabled (Catalog Mode), skipping enforcement',
-                    rule.name
-                )
-                continue
+        has_company = 'company_id' in self._fields
+        batches = self.grouped('company_id') if has_company else {self.env['res.company']: self}
 
-            # Check if threshold applies
-            if rule.threshold_amount > 0:
-                if hasattr(self, 'amount_total'):
-                    if self.amount_total < rule.threshold_amount:
-                        _logger.debug(
-                            'Rule %s: Amount %.2f below threshold %.2f, skipping',
-                            rule.name, self.amount_total, rule.threshold_amount
-                        )
-                        continue
-            
-            # Get user who performed action_1
-            action_1_user = rule._get_action_1_user(self)
-            
-            if not action_1_user:
-                _logger.debug('Rule %s: Could not determine action_1 user, skipping', rule.name)
+        for company, records in batches.items():
+            rule_ids = SoDRule._get_enforced_rule_ids(self._name, action, company.id)
+            if not rule_ids:
                 continue
-            
-            # Check if same user is trying to perform action_2
-            if action_1_user.id == self.env.user.id:
+
+            _logger.debug('Found %d applicable SoD rules for %s', len(rule_ids), self._name)
+
+            for rule in SoDRule.browse(rule_ids):
+                candidates = records
+                # Check if threshold applies
+                if rule.threshold_amount > 0 and 'amount_total' in self._fields:
+                    candidates = records.filtered(
+                        lambda r: r.amount_total >= rule.threshold_amount
+                    )
+                if not candidates:
+                    continue
+
+                # Get users who performed action_1, for the whole batch
+                action_1_users = rule._get_action_1_users(candidates)
+
+                # Check if same user is trying to perform action_2
+                violations = candidates.filtered(
+                    lambda r: action_1_users.get(r.id) == self.env.user
+                )
+                if not violations:
+                    continue
+
                 # SoD violation detected!
                 _logger.warning(
                     'SoD Violation: User %s attempted to perform %s after %s on %s/%s',
-                    self.env.user.name, action, rule.action_1, self._name, self.id
+                    self.env.user.name, action, rule.action_1, self._name, violations.ids
                 )
-                
-                self._log_sod_violation(rule, action, action_1_user)
-                
+
+                violations._log_sod_violation(rule, action, self.env.user)
+
                 if rule.block_violation:
                     raise UserError(_(
                         "🚫 SEGREGATION OF DUTIES VIOLATION!\n\n"
@@ -132,33 +123,35 @@ class OpsSoDMixin(models.AbstractModel):
     
     def _log_sod_violation(self, rule, action, action_1_user):
         """
-        Log SoD violation for audit trail.
+        Log SoD violations of the recordset for audit trail.
         
         Args:
             rule: ops.segregation.of.duties record
             action: The action that was blocked
             action_1_user: res.users who performed first action
         """
-        self.ensure_one()
-        
-        log_vals = {
-            'rule_id': rule.id,
-            'model_name': self._name,
-            'res_id': self.id,
-            'user_id': self.env.user.id,
-            'action_1_user_id': action_1_user.id,
-            'action_attempted': action,
-            'blocked': rule.block_violation,
-            'document_reference': self.name if hasattr(self, 'name') else str(self.id),
-            'company_id': self.company_id.id if hasattr(self, 'company_id') else self.env.company.id,
-            'notes': f"Violation of rule '{rule.name}': {self.env.user.name} attempted to {action} "
-                     f"document {self.name} after {action_1_user.name} performed {rule.action_1}",
-        }
+        vals_list = []
+        for record in self:
+            name = record.name if 'name' in record._fields else str(record.id)
+            vals_list.append({
+                'rule_id': rule.id,
+                'model_name': record._name,
+                'res_id': record.id,
+                'user_id': self.env.user.id,
+                'action_1_user_id': action_1_user.id,
+                'action_attempted': action,
+                'blocked': rule.block_violation,
+                'document_reference': name,
+                'company_id': record.company_id.id if 'company_id' in record._fields else self.env.company.id,
+                'notes': f"Violation of rule '{rule.name}': {self.env.user.name} attempted to {action} "
+                         f"document {name} after {action_1_user.name} performed {rule.action_1}",
+            })
         
         try:
-            self.env['ops.segregation.of.duties.log'].create(log_vals)
-            _logger.info('SoD violation logged: rule=%s user=%s action=%s', 
-                         rule.id, self.env.user.id, action)
+            # Users only have read access to the audit log
+            self.env['ops.segregation.of.duties.log'].sudo().create(vals_list)
+            _logger.info('SoD violation logged: rule=%s user=%s action=%s records=%s',
+                         rule.id, self.env.user.id, action, len(vals_list))
         except Exception as e:
             _logger.error('Failed to log SoD violation: %s', str(e))
             # Don't raise - logging failure shouldn't block the enforcement
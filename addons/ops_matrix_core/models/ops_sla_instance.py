@@ -1,10 +1,18 @@
 from odoo import models, fields, api, _
+from collections import defaultdict
 from datetime import datetime, timedelta
 import pytz
 import logging
 
 _logger = logging.getLogger(__name__)
 
+# Maximum escalation level before an SLA is marked as failed
+ESCALATION_MAX_LEVEL = 3
+# Running SLAs whose deadline falls within this window get a warning
+WARNING_WINDOW_HOURS = 1
+# Instances listed in one digest mail; the rest are summarised
+DIGEST_MAX_LINES = 50
+
 class OpsSLAInstance(models.Model):
     _name = 'ops.sla.instance'
     _inherit = ['mail.thread', 'mail.activity.mixin']
@@ -40,6 +48,8 @@ class OpsSLAInstance(models.Model):
     
     escalation_level = fields.Integer('Escalation Level', default=0)
     current_approver_id = fields.Many2one('res.users', 'Current Approver')
+    warning_sent_date = fields.Datetime('Warning Sent', readonly=True, copy=False,
+                                        help='Set once the approaching-deadline warning went out')
     
     # Time tracking
     elapsed_hours = fields.Float('Elapsed Hours', compute='_compute_elapsed')
@@ -144,160 +154,233 @@ class OpsSLAInstance(models.Model):
         """
         Cron job to check and escalate overdue SLA instances
         Runs every 15 minutes
+
+        Breached instances are escalated as one batch and approaching ones
+        are warned once; approvers get one digest per run.
         """
+        now = fields.Datetime.now()
         overdue = self.search([
             ('state', '=', 'running'),
-            ('deadline', '<', fields.Datetime.now()),
+            ('deadline', '<', now),
         ])
-        
-        for sla in overdue:
-            sla.action_escalate()
-        
-        # Also check approaching deadlines (1 hour warning)
+        if overdue:
+            overdue.action_escalate()
+
+        # Also check approaching deadlines (1 hour warning), never warned twice
         approaching = self.search([
             ('state', '=', 'running'),
-            ('deadline', '>', fields.Datetime.now()),
-            ('deadline', '<', fields.Datetime.now() + timedelta(hours=1)),
+            ('deadline', '>', now),
+            ('deadline', '<', now + timedelta(hours=WARNING_WINDOW_HOURS)),
+            ('warning_sent_date', '=', False),
         ])
-        
-        for sla in approaching:
-            sla._send_warning_notification()
-    
+        if approaching:
+            approaching._send_warning_notification()
+
+        _logger.info(
+            "SLA check: %d instance(s) escalated, %d warned", len(overdue), len(approaching)
+        )
+
     def action_escalate(self):
-        """Escalate SLA to next approval level"""
-        self.ensure_one()
-        
-        # Determine next escalation level
-        next_level = self.escalation_level + 1
-        max_level = 3  # Maximum 3 escalation levels
-        
-        if next_level > max_level:
-            # No more escalation possible - mark as failed
-            self.write({
-                'state': 'failed',
-                'completion_date': fields.Datetime.now(),
-            })
-            self._send_failed_notification()
-            return
-        
-        # Find escalation approver
-        escalation_approver = self._get_escalation_approver(next_level)
-        
-        if not escalation_approver:
-            # No approver found - mark as failed
-            self.write({
+        """Escalate SLAs to their next approval level"""
+        now = fields.Datetime.now()
+
+        # No more escalation possible - mark as failed
+        exhausted = self.filtered(lambda s: s.escalation_level + 1 > ESCALATION_MAX_LEVEL)
+        candidates = self - exhausted
+
+        # Find escalation approvers for the whole batch
+        approvers = candidates._get_escalation_approvers()
+        # No approver found - mark as failed
+        unresolved = candidates.filtered(lambda s: s.id not in approvers)
+
+        failed = exhausted | unresolved
+        if failed:
+            failed.write({
                 'state': 'failed',
-                'completion_date': fields.Datetime.now(),
+                'completion_date': now,
             })
+            exhausted._send_failed_notification()
+
+        escalated = candidates - unresolved
+        if not escalated:
             return
-        
-        # Create escalated approval request
+
+        # Create escalated approval requests
         # Note: We assume ops.approval.request exists and has these fields
         try:
-            escalated_request = self.env['ops.approval.request'].create({
-                'name': f"ESCALATED (Level {next_level}): {self.name}",
-                'model_name': self.model_name,
-                'res_id': self.res_id,
-                'approver_ids': [(6, 0, [escalation_approver.id])],
-                'escalation_level': next_level,
+            self.env['ops.approval.request'].create([{
+                'name': f"ESCALATED (Level {sla.escalation_level + 1}): {sla.name}",
+                'model_name': sla.model_name,
+                'res_id': sla.res_id,
+                'approver_ids': [(6, 0, [approvers[sla.id].id])],
+                'escalation_level': sla.escalation_level + 1,
                 'state': 'pending',
-            })
+            } for sla in escalated])
         except Exception as e:
-            _logger.error(f"Failed to create escalated approval request: {e}")
-        
-        # Update SLA
-        self.write({
-            'state': 'escalated',
-            'escalation_level': next_level,
-            'current_approver_id': escalation_approver.id,
-        })
-        
+            _logger.error(f"Failed to create escalated approval requests: {e}")
+
+        # Update SLAs, one write per (level, approver)
+        groups = defaultdict(lambda: self.browse())
+        for sla in escalated:
+            groups[sla.escalation_level + 1, approvers[sla.id]] |= sla
+        by_approver = defaultdict(lambda: self.browse())
+        for (level, approver), slas in groups.items():
+            slas.write({
+                'state': 'escalated',
+                'escalation_level': level,
+                'current_approver_id': approver.id,
+            })
+            by_approver[approver] |= slas
+
         # Send notifications
-        self._send_escalation_notification(escalation_approver, next_level)
-        
+        self._send_escalation_digests(by_approver)
+
         # Log in chatter
-        self.message_post(
-            body=f"Escalated to Level {next_level} - Approver: {escalation_approver.name}",
-            subject="SLA Escalated"
-        )
-    
+        escalated._message_log_batch(bodies={
+            sla.id: f"Escalated to Level {sla.escalation_level} - Approver: {sla.current_approver_id.name}"
+            for sla in escalated
+        })
+
     def _get_escalation_approver(self, level):
         """Get approver for escalation level"""
-        # Level 1: Direct manager
-        # Level 2: Manager's manager
-        # Level 3: Executive (CEO/CFO)
-        
-        if level == 1:
-            # Original approver's manager
-            if self.current_approver_id and hasattr(self.current_approver_id, 'parent_id') and self.current_approver_id.parent_id:
-                return self.current_approver_id.parent_id
-            # Fallback to employee manager if hr module is used
-            employee = self.env['hr.employee'].search([('user_id', '=', self.current_approver_id.id)], limit=1)
-            if employee and employee.parent_id and employee.parent_id.user_id:
-                return employee.parent_id.user_id
-        
-        elif level == 2:
-            # Manager's manager or BU leader
-            if self.current_approver_id:
-                employee = self.env['hr.employee'].search([('user_id', '=', self.current_approver_id.id)], limit=1)
-                if employee and employee.parent_id and employee.parent_id.parent_id and employee.parent_id.parent_id.user_id:
-                    return employee.parent_id.parent_id.user_id
-            
-            # Fallback to BU manager
-            if self.template_id.company_id:
-                # Try to find a BU manager
-                bu = self.env['ops.business.unit'].search([('company_id', '=', self.template_id.company_id.id)], limit=1)
-                if bu and bu.manager_id:
-                    return bu.manager_id
-        
-        elif level == 3:
-            # Executive level - find CEO or CFO persona
+        self.ensure_one()
+        return self._get_escalation_approvers(level).get(self.id, False)
+
+    def _get_escalation_approvers(self, level=None):
+        """
+        Get the approver of the next escalation level of every SLA.
+
+        Level 1: Direct manager
+        Level 2: Manager's manager, or a BU leader of the company
+        Level 3: Executive (CEO/CFO)
+
+        Employees, business units and the executive persona are each
+        fetched once for the whole batch.
+
+        Args:
+            level: Escalation level to resolve; defaults to the next level
+                of each SLA
+
+        Returns:
+            dict: {sla_id: res.users}, SLAs without an approver are omitted
+        """
+        levels = {sla.id: level or sla.escalation_level + 1 for sla in self}
+
+        employee_by_user = {}
+        current_users = self.current_approver_id
+        if current_users:
+            employees = self.env['hr.employee'].search([('user_id', 'in', current_users.ids)])
+            for employee in employees:
+                employee_by_user.setdefault(employee.user_id.id, employee)
+
+        bu_leader = self.env['res.users']
+        if 2 in levels.values():
+            bu = self.env['ops.business.unit'].search([
+                ('company_ids', 'in', self.env.company.ids),
+                ('leader_id', '!=', False),
+            ], limit=1)
+            bu_leader = bu.leader_id
+
+        executive = self.env['res.users']
+        if 3 in levels.values():
             ceo_persona = self.env['ops.persona'].search([
                 ('code', 'in', ['CEO', 'CFO'])
             ], limit=1)
-            if ceo_persona and ceo_persona.user_ids:
-                return ceo_persona.user_ids[0]
-        
-        return False
-    
+            executive = ceo_persona.user_ids[:1]
+
+        approvers = {}
+        for sla in self:
+            sla_level = levels[sla.id]
+            employee = employee_by_user.get(sla.current_approver_id.id)
+            approver = self.env['res.users']
+            if sla_level == 1:
+                # Original approver's manager
+                if employee:
+                    approver = employee.parent_id.user_id
+            elif sla_level == 2:
+                # Manager's manager, falling back to the BU leader
+                if employee:
+                    approver = employee.parent_id.parent_id.user_id
+                approver = approver or bu_leader
+            elif sla_level == 3:
+                approver = executive
+            if approver:
+                approvers[sla.id] = approver
+        return approvers
+
     def _send_warning_notification(self):
         """Send warning notification for approaching deadline"""
-        self.ensure_one()
-        
-        if not self.current_approver_id:
+        to_warn = self.filtered('current_approver_id')
+        if not to_warn:
             return
-        
-        template = self.env.ref('ops_matrix_core.email_template_sla_warning', raise_if_not_found=False)
-        if template:
-            template.send_mail(self.id, force_send=True)
-        
-        # Also create activity
-        self.activity_schedule(
-            'mail.mail_activity_data_warning',
-            summary=f'SLA Deadline Approaching: {self.name}',
-            note=f'Deadline in {self.remaining_hours:.1f} hours',
-            user_id=self.current_approver_id.id,
-        )
-    
+        to_warn.write({'warning_sent_date': fields.Datetime.now()})
+
+        by_approver = to_warn.grouped('current_approver_id')
+        for approver, slas in by_approver.items():
+            # Also create activities
+            slas.activity_schedule(
+                'mail.mail_activity_data_warning',
+                summary=_('SLA Deadline Approaching'),
+                note=_('Deadline within %s hour(s)', WARNING_WINDOW_HOURS),
+                user_id=approver.id,
+            )
+            slas._send_digest_mail('ops_matrix_core.email_template_sla_warning_digest', approver)
+
+    def _send_escalation_digests(self, by_approver):
+        """Send one escalation digest per approver.
+
+        Args:
+            by_approver: {res.users: ops.sla.instance} of the escalated SLAs
+        """
+        for approver, slas in by_approver.items():
+            slas._send_digest_mail(
+                'ops_matrix_core.email_template_sla_escalation_digest', approver,
+                escalation_level=max(slas.mapped('escalation_level')),
+            )
+
     def _send_escalation_notification(self, approver, level):
         """Send escalation notification"""
         self.ensure_one()
-        
-        template = self.env.ref('ops_matrix_core.email_template_sla_escalation', raise_if_not_found=False)
-        if template:
-            ctx = {
-                'approver_name': approver.name,
-                'escalation_level': level,
-            }
-            template.with_context(ctx).send_mail(self.id, force_send=True)
-    
+        self._send_digest_mail(
+            'ops_matrix_core.email_template_sla_escalation_digest', approver, escalation_level=level,
+        )
+
+    def _send_digest_mail(self, template_xmlid, approver, **ctx):
+        """Queue one mail listing these SLAs for an approver.
+
+        The template is rendered once, on the first SLA, with the SLAs of
+        the digest in its context; it goes out with the mail queue.
+
+        Args:
+            template_xmlid: XML id of the SLA mail template
+            approver: res.users receiving the digest
+            **ctx: Extra render context (e.g. escalation_level)
+        """
+        if not self or not approver.email:
+            return
+        template = self.env.ref(template_xmlid, raise_if_not_found=False)
+        if not template:
+            return
+        try:
+            template.with_context(
+                digest_sla_ids=tuple(self[:DIGEST_MAX_LINES].ids),
+                digest_count=len(self),
+                digest_more=max(len(self) - DIGEST_MAX_LINES, 0),
+                approver_name=approver.name,
+                approver_email=approver.email,
+                **ctx,
+            ).send_mail(self[0].id, email_values={'email_to': approver.email})
+        except Exception as e:
+            _logger.error("Failed to queue SLA digest mail: %s", e)
+
     def _send_failed_notification(self):
         """Send notification when SLA fails (max escalation reached)"""
-        self.ensure_one()
-        
+        if not self:
+            return
+
         template = self.env.ref('ops_matrix_core.email_template_sla_failed', raise_if_not_found=False)
         if template:
-            template.send_mail(self.id, force_send=True)
+            template.send_mail_batch(self.ids)
     
     def action_complete(self):
         """Mark SLA as completed"""
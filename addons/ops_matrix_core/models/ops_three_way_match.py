@@ -24,23 +24,104 @@ class OpsThreeWayMatch(models.Model):
     @api.depends('purchase_line_id')
     def _compute_received_qty(self):
         """Calculate total received quantity from stock moves."""
+        quantities = self._get_match_quantities(self.purchase_line_id.ids)
         for record in self:
-            moves = self.env['stock.move'].search([
-                ('purchase_line_id', '=', record.purchase_line_id.id),
-                ('state', '=', 'done')
-            ])
-            record.received_qty = sum(moves.mapped('product_uom_qty'))
+            record.received_qty = quantities.get(record.purchase_line_id.id, {}).get('received', 0.0)
 
     @api.depends('purchase_line_id')
     def _compute_billed_qty(self):
         """Calculate total billed quantity from invoice lines."""
+        quantities = self._get_match_quantities(self.purchase_line_id.ids)
         for record in self:
-            invoice_lines = self.env['account.move.line'].search([
-                ('purchase_line_id', '=', record.purchase_line_id.id),
+            record.billed_qty = quantities.get(record.purchase_line_id.id, {}).get('billed', 0.0)
+
+    @api.model
+    def _get_match_quantities(self, purchase_line_ids):
+        """
+        Compute ordered, received and billed quantities for a batch of PO lines.
+
+        Runs three queries whatever the batch size: one read of the PO lines,
+        one grouped query on done stock moves and one grouped query on
+        non-cancelled vendor bill lines.
+
+        Args:
+            purchase_line_ids: list of purchase.order.line IDs
+
+        Returns:
+            dict: {purchase_line_id: {'ordered', 'qty_received', 'received', 'billed'}}
+                  where 'qty_received' is the PO line's own received quantity and
+                  'received' the sum of done stock moves.
+        """
+        purchase_line_ids = [pol_id for pol_id in set(purchase_line_ids) if pol_id]
+        if not purchase_line_ids:
+            return {}
+
+        quantities = {
+            line['id']: {
+                'ordered': line['product_qty'],
+                'qty_received': line['qty_received'],
+                'received': 0.0,
+                'billed': 0.0,
+            }
+            for line in self.env['purchase.order.line'].browse(purchase_line_ids).read(
+                ['product_qty', 'qty_received'], load=None
+            )
+        }
+
+        for purchase_line, qty in self.env['stock.move']._read_group(
+            domain=[
+                ('purchase_line_id', 'in', purchase_line_ids),
+                ('state', '=', 'done'),
+            ],
+            groupby=['purchase_line_id'],
+            aggregates=['product_uom_qty:sum'],
+        ):
+            if purchase_line.id in quantities:
+                quantities[purchase_line.id]['received'] = qty or 0.0
+
+        for purchase_line, qty in self.env['account.move.line']._read_group(
+            domain=[
+                ('purchase_line_id', 'in', purchase_line_ids),
                 ('move_id.move_type', '=', 'in_invoice'),
-                ('move_id.state', '!=', 'cancel')
-            ])
-            record.billed_qty = sum(invoice_lines.mapped('quantity'))
+                ('move_id.state', '!=', 'cancel'),
+            ],
+            groupby=['purchase_line_id'],
+            aggregates=['quantity:sum'],
+        ):
+            if purchase_line.id in quantities:
+                quantities[purchase_line.id]['billed'] = qty or 0.0
+
+        return quantities
+
+    @api.model
+    def _get_or_create_for_lines(self, purchase_lines):
+        """
+        Return the match record of every PO line, creating the missing ones at once.
+
+        Args:
+            purchase_lines: purchase.order.line recordset
+
+        Returns:
+            dict: {purchase_line_id: ops.three.way.match record}
+        """
+        purchase_lines = purchase_lines._origin
+        if not purchase_lines:
+            return {}
+
+        matches = {}
+        for match in self.search([('purchase_line_id', 'in', purchase_lines.ids)], order='id'):
+            matches.setdefault(match.purchase_line_id.id, match)
+
+        missing = purchase_lines.filtered(lambda l: l.id not in matches)
+        if missing:
+            for match in self.create([{
+                'purchase_order_id': line.order_id.id,
+                'purchase_line_id': line.id,
+                'ordered_qty': line.product_qty,
+            } for line in missing]):
+                matches[match.purchase_line_id.id] = match
+
+        return matches
 
     @api.depends('ordered_qty', 'received_qty', 'billed_qty')
     def _compute_match_state(self):
@@ -81,6 +81,22 @@ class ResPartner(models.Model):
         help='Total outstanding amount for this partner',
         currency_field='company_currency_id'
     )
+    ops_overdue_amount = fields.Monetary(
+        string='Overdue Amount',
+        compute='_compute_total_outstanding',
+        store=False,
+        compute_sudo=True,
+        help='Outstanding amount of invoices past their due date',
+        currency_field='company_currency_id'
+    )
+    ops_open_order_amount = fields.Monetary(
+        string='Open Order Exposure',
+        compute='_compute_total_outstanding',
+        store=False,
+        compute_sudo=True,
+        help='Untaxed amount of confirmed sale orders not invoiced yet',
+        currency_field='company_currency_id'
+    )
     
     company_currency_id = fields.Many2one(
         'res.currency',
@@ -104,27 +120,76 @@ class ResPartner(models.Model):
             if record.ops_state == 'archived' and record.active:
                 raise ValidationError(_('Archived partners should be marked as inactive'))
     
+    @api.depends(
+        'invoice_ids.amount_residual_signed',
+        'invoice_ids.payment_state',
+        'invoice_ids.state',
+        'sale_order_ids.state',
+        'sale_order_ids.order_line.untaxed_amount_to_invoice',
+    )
     def _compute_total_outstanding(self) -> None:
-        """Calculate total outstanding amount for partner"""
-        for partner in self:
-            total = 0.0
-            
-            # Sum outstanding invoices
-            invoices = self.env['account.move'].search([
-                ('partner_id', '=', partner.id),
-                ('move_type', 'in', ['out_invoice', 'out_refund']),
-                ('state', '!=', 'cancel'),
-                ('payment_state', 'in', ['not_paid', 'partial'])
-            ])
-            
-            for invoice in invoices:
-                if invoice.move_type == 'out_invoice':
-                    total += invoice.amount_residual
-                else:  # refund
-                    total -= invoice.amount_residual
-            
-            partner.ops_total_outstanding = total
-    
+        """
+        Calculate outstanding, overdue and open-order exposure per partner.
+
+        The three amounts are computed together for the whole recordset with
+        one _read_group per source. Being computed fields, the results stay
+        in the environment cache for the rest of the transaction, so the
+        credit firewall and the partner views share a single computation
+        until one of the dependencies changes.
+        """
+        partners = self.filtered('id')
+        (self - partners).update({
+            'ops_total_outstanding': 0.0,
+            'ops_overdue_amount': 0.0,
+            'ops_open_order_amount': 0.0,
+        })
+        if not partners:
+            return
+
+        today = fields.Date.context_today(self)
+
+        # Open invoices and refunds; signed residuals are negative for refunds
+        invoice_domain = [
+            ('partner_id', 'in', partners.ids),
+            ('move_type', 'in', ['out_invoice', 'out_refund']),
+            ('state', '!=', 'cancel'),
+            ('payment_state', 'in', ['not_paid', 'partial']),
+        ]
+        AccountMove = self.env['account.move']
+        outstanding = {
+            partner.id: amount
+            for partner, amount in AccountMove._read_group(
+                invoice_domain, ['partner_id'], ['amount_residual_signed:sum'],
+            )
+        }
+        overdue = {
+            partner.id: amount
+            for partner, amount in AccountMove._read_group(
+                invoice_domain + [('invoice_date_due', '<', today)],
+                ['partner_id'], ['amount_residual_signed:sum'],
+            )
+        }
+
+        # Confirmed orders not invoiced yet, converted per order currency
+        open_orders = {}
+        for partner, company, currency, amount in self.env['sale.order.line']._read_group(
+            [
+                ('order_partner_id', 'in', partners.ids),
+                ('state', '=', 'sale'),
+                ('untaxed_amount_to_invoice', '!=', 0),
+            ],
+            ['order_partner_id', 'company_id', 'currency_id'],
+            ['untaxed_amount_to_invoice:sum'],
+        ):
+            if currency != company.currency_id:
+                amount = currency._convert(amount, company.currency_id, company, today)
+            open_orders[partner.id] = open_orders.get(partner.id, 0.0) + amount
+
+        for partner in partners:
+            partner.ops_total_outstanding = outstanding.get(partner.id, 0.0)
+            partner.ops_overdue_amount = overdue.get(partner.id, 0.0)
+            partner.ops_open_order_amount = open_orders.get(partner.id, 0.0)
+
     def _compute_confirmation_restrictions(self) -> None:
         """Compute any restrictions that would prevent order confirmation"""
         for partner in self:
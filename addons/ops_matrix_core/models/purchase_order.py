@@ -39,11 +39,17 @@ class PurchaseOrder(models.Model):
         2. Governance rules are checked even if standard write() is bypassed
         3. Hard gate for purchase order confirmation
         """
+        is_admin = self.env.su or self.env.user.has_group('base.group_system')
+
+        # Check Segregation of Duties (SoD) rules BEFORE governance rules
+        if not is_admin:
+            self._check_sod_violation('confirm')
+
         for order in self:
             _logger.info("OPS Governance: Checking PO %s for confirmation rules", order.name)
             
             # ADMIN BYPASS: Skip governance for administrators
-            if self.env.su or self.env.user.has_group('base.group_system'):
+            if is_admin:
                 _logger.info("OPS Governance: Admin bypass for PO %s", order.name)
                 # Log admin override for audit trail
                 try:
@@ -56,9 +62,6 @@ class PurchaseOrder(models.Model):
                     _logger.warning("Failed to log admin override: %s", str(e))
                 continue
             
-            # Check Segregation of Duties (SoD) rules BEFORE governance rules
-            order._check_sod_violation('confirm')
-            
             # Explicitly trigger Governance check for 'on_write' trigger
             # This catches rules like "Purchase orders over $10K require approval"
             order._enforce_governance_rules(order, trigger_type='on_write')
@@ -256,10 +256,14 @@ class SaleOrder(models.Model):
 
         return False
 
-    def _check_partner_credit_firewall(self) -> Tuple[bool, str, bool]:
+    def _check_partner_credit_firewall(self, pending_exposure: float = 0.0) -> Tuple[bool, str, bool]:
         """
         Credit Firewall: Check if partner can have this order confirmed.
 
+        Args:
+            pending_exposure: Amount of other orders of the same partner
+                confirmed in the same batch, on top of the outstanding
+
         Returns tuple of (passed: bool, message: str, is_warning_only: bool)
 
         SMART GATE LOGIC ("Speed at Quote, Governance at Credit"):
@@ -331,7 +335,7 @@ class SaleOrder(models.Model):
         # The hard block is enforced at Picking validation (button_validate)
         if hasattr(partner, 'ops_credit_limit') and hasattr(partner, 'ops_total_outstanding'):
             if partner.ops_credit_limit > 0:
-                total_outstanding = partner.ops_total_outstanding
+                total_outstanding = partner.ops_total_outstanding + pending_exposure
                 potential_total = total_outstanding + self.amount_total
 
                 if potential_total > partner.ops_credit_limit:
@@ -366,25 +370,40 @@ class SaleOrder(models.Model):
                   False if no approval is needed (confirmation can proceed)
         """
         self.ensure_one()
+        return bool(self._evaluate_governance_rules_for_confirm_batch())
+
+    def _evaluate_governance_rules_for_confirm_batch(self) -> 'SaleOrder':
+        """
+        Evaluate the approval governance rules for a batch of orders.
+
+        Rules are searched once for all companies of the batch and each rule
+        is evaluated once across the orders it applies to (one filtered_domain
+        for domain rules). Missing approval requests are created with a
+        single create() and the blocked orders move to 'waiting_approval'.
 
+        Returns:
+            sale.order: Orders that require approval (confirmation blocked)
+        """
         # Skip if already in waiting_approval state
-        if self.state == 'waiting_approval':
-            return True
+        needs_approval = self.filtered(lambda o: o.state == 'waiting_approval')
+        orders = self - needs_approval
 
-        # Skip if there's an approved approval request for this order
+        # Skip if there's an approved approval request for the order
         ApprovalRequest = self.env['ops.approval.request']
-        approved_approval = ApprovalRequest.search([
+        approved = ApprovalRequest.search([
             ('model_name', '=', 'sale.order'),
-            ('res_id', '=', self.id),
+            ('res_id', 'in', orders.ids),
             ('state', '=', 'approved'),
-        ], limit=1)
-
-        if approved_approval:
+        ])
+        approved_ids = set(approved.mapped('res_id'))
+        for order in orders.filtered(lambda o: o.id in approved_ids):
             _logger.info(
                 "OPS Governance: SO %s has approved approval request - allowing confirmation",
-                self.name
+                order.name
             )
-            return False  # Allow confirmation to proceed
+        orders = orders.filtered(lambda o: o.id not in approved_ids)
+        if not orders:
+            return needs_approval
 
         # Find applicable governance rules that require approval
         GovernanceRule = self.env['ops.governance.rule']
@@ -395,101 +414,134 @@ class SaleOrder(models.Model):
             ('action_type', '=', 'require_approval'),
             '|',
                 ('company_id', '=', False),
-                ('company_id', '=', self.company_id.id),
+                ('company_id', 'in', orders.company_id.ids),
         ])
 
         if not rules:
-            return False  # No approval rules, allow confirmation
+            return needs_approval  # No approval rules, allow confirmation
 
-        # Evaluate each rule to see if it triggers
+        # Evaluate each rule once; an order is held by its first triggered rule
+        triggered_rule = {}
+        rule_messages = {}
         for rule in rules:
-            triggered = False
-            rule_message = ''
+            candidates = orders.filtered(
+                lambda o: o.id not in triggered_rule
+                and (not rule.company_id or o.company_id == rule.company_id)
+            )
+            if not candidates:
+                continue
+            rule_messages[rule.id] = rule.error_message or f"Rule '{rule.name}' triggered"
 
             try:
                 if rule.condition_code:
                     code = rule.condition_code.strip()
-                    if code:
+                    if not code:
+                        continue
+                    from odoo.tools.safe_eval import safe_eval
+                    matched = self.browse()
+                    for order in candidates:
                         safe_locals = {
-                            'self': self,
-                            'record': self,
+                            'self': order,
+                            'record': order,
                             'user': self.env.user,
                             'env': self.env,
                         }
-                        from odoo.tools.safe_eval import safe_eval
-                        triggered = safe_eval(code, safe_locals)
-                        rule_message = rule.error_message or f"Rule '{rule.name}' triggered"
+                        try:
+                            if safe_eval(code, safe_locals):
+                                matched |= order
+                        except Exception as e:
+                            _logger.error(
+                                "Error evaluating governance rule %s for SO %s: %s",
+                                rule.name, order.name, str(e)
+                            )
 
                 elif rule.condition_domain:
                     domain = rule._parse_domain_string(rule.condition_domain)
-                    triggered = bool(self.filtered_domain(domain))
-                    rule_message = rule.error_message or f"Rule '{rule.name}' triggered"
+                    matched = candidates.filtered_domain(domain)
+
+                else:
+                    continue
 
             except Exception as e:
                 _logger.error(
-                    "Error evaluating governance rule %s for SO %s: %s",
-                    rule.name, self.name, str(e)
+                    "Error evaluating governance rule %s for SOs %s: %s",
+                    rule.name, candidates.mapped('name'), str(e)
                 )
                 continue
 
-            if triggered:
+            for order in matched:
                 _logger.info(
                     "OPS Governance: Rule '%s' triggered for SO %s - requiring approval",
-                    rule.name, self.name
+                    rule.name, order.name
                 )
+                triggered_rule[order.id] = rule
 
-                # Check for existing pending approval
-                existing_approval = ApprovalRequest.search([
-                    ('model_name', '=', 'sale.order'),
-                    ('res_id', '=', self.id),
-                    ('rule_id', '=', rule.id),
-                    ('state', '=', 'pending'),
-                ], limit=1)
-
-                if not existing_approval:
-                    # Create approval request
-                    approvers = self._get_governance_approvers(rule)
-
-                    existing_approval = ApprovalRequest.create({
-                        'name': _("Approval Required: %s - %s") % (self.name, rule.name),
-                        'rule_id': rule.id,
-                        'model_name': 'sale.order',
-                        'res_id': self.id,
-                        'notes': rule_message,
-                        'approver_ids': [(6, 0, approvers.ids)] if approvers else [],
-                        'requested_by': self.env.user.id,
-                    })
-
-                    _logger.info(
-                        "OPS Governance: Created approval request %s for SO %s",
-                        existing_approval.id, self.name
-                    )
+        held = orders.filtered(lambda o: o.id in triggered_rule)
+        if not held:
+            return needs_approval
 
-                # Transition order to waiting_approval state
-                self.with_context(approval_unlock=True).write({
-                    'state': 'waiting_approval',
-                    'approval_locked': True,
-                    'approval_request_id': existing_approval.id,
-                })
+        # Check for existing pending approvals, for the whole batch
+        pending = ApprovalRequest.search([
+            ('model_name', '=', 'sale.order'),
+            ('res_id', 'in', held.ids),
+            ('rule_id', 'in', rules.ids),
+            ('state', '=', 'pending'),
+        ])
+        approval_by_key = {}
+        for request in pending:
+            approval_by_key.setdefault((request.res_id, request.rule_id.id), request)
+
+        # Create the missing approval requests in one go
+        approvers_cache = {}
+        to_create = held.filtered(
+            lambda o: (o.id, triggered_rule[o.id].id) not in approval_by_key
+        )
+        vals_list = []
+        for order in to_create:
+            rule = triggered_rule[order.id]
+            cache_key = (rule.id, order.company_id.id)
+            if cache_key not in approvers_cache:
+                approvers_cache[cache_key] = order._get_governance_approvers(rule)
+            approvers = approvers_cache[cache_key]
+            vals_list.append({
+                'name': _("Approval Required: %s - %s") % (order.name, rule.name),
+                'rule_id': rule.id,
+                'model_name': 'sale.order',
+                'res_id': order.id,
+                'notes': rule_messages[rule.id],
+                'approver_ids': [(6, 0, approvers.ids)] if approvers else [],
+                'requested_by': self.env.user.id,
+            })
+        for order, request in zip(to_create, ApprovalRequest.create(vals_list)):
+            approval_by_key[order.id, request.rule_id.id] = request
+            _logger.info(
+                "OPS Governance: Created approval request %s for SO %s",
+                request.id, order.name
+            )
 
-                # Post to chatter for visibility
-                if hasattr(self, 'message_post'):
-                    self.message_post(
-                        body=_(
-                            "<strong>🔒 Confirmation Blocked - Approval Required</strong><br/><br/>"
-                            "Rule: %s<br/>"
-                            "Reason: %s<br/><br/>"
-                            "This order cannot be confirmed until approval is granted.<br/>"
-                            "An approval request has been sent to authorized approvers."
-                        ) % (rule.name, rule_message),
-                        subject=_("Approval Required for Confirmation"),
-                        message_type='notification',
-                        subtype_xmlid='mail.mt_note',
-                    )
+        # Transition orders to waiting_approval state
+        held.with_context(approval_unlock=True).write({
+            'state': 'waiting_approval',
+            'approval_locked': True,
+        })
+        for order in held:
+            order.with_context(approval_unlock=True).write({
+                'approval_request_id': approval_by_key[order.id, triggered_rule[order.id].id].id,
+            })
 
-                return True  # Block confirmation
+        # Post to chatter for visibility
+        held._message_log_batch(bodies={
+            order.id: _(
+                "<strong>🔒 Confirmation Blocked - Approval Required</strong><br/><br/>"
+                "Rule: %s<br/>"
+                "Reason: %s<br/><br/>"
+                "This order cannot be confirmed until approval is granted.<br/>"
+                "An approval request has been sent to authorized approvers."
+            ) % (triggered_rule[order.id].name, rule_messages[triggered_rule[order.id].id])
+            for order in held
+        })
 
-        return False  # No rules triggered, allow confirmation
+        return needs_approval | held
 
     def _get_governance_approvers(self, rule) -> 'models.Model':
         """
@@ -556,60 +608,52 @@ class SaleOrder(models.Model):
         If a rule requires approval, the order transitions to 'waiting_approval'
         state and the confirmation is blocked until approval is granted.
         """
-        for order in self:
-            _logger.info("OPS Governance: Checking SO %s for confirmation rules", order.name)
+        is_admin = self.env.su or self.env.user.has_group('base.group_system')
+        _logger.info("OPS Governance: Checking SOs %s for confirmation rules", self.mapped('name'))
 
+        needs_approval = self.browse()
+        if is_admin:
             # ADMIN BYPASS: Skip governance for administrators
-            if self.env.su or self.env.user.has_group('base.group_system'):
-                _logger.info("OPS Governance: Admin bypass for SO %s", order.name)
-                # Log admin override for audit trail
-                try:
-                    self.env['ops.security.audit'].sudo().log_security_override(
-                        model_name=order._name,
-                        record_id=order.id,
-                        reason='Admin bypass used to confirm Sale Order without governance checks'
-                    )
-                except Exception as e:
-                    _logger.warning("Failed to log admin override: %s", str(e))
-            else:
-                # Check Segregation of Duties (SoD) rules BEFORE governance rules
-                order._check_sod_violation('confirm')
-
-                # =================================================================
-                # GOVERNANCE INTERCEPTOR: Evaluate rules BEFORE super().action_confirm()
-                # =================================================================
-                # This must happen BEFORE the confirmation proceeds to ensure:
-                # - Rules like ">$10K requires approval" block confirmation
-                # - Orders transition to 'waiting_approval' if approval is needed
-                # - The confirmation does NOT proceed until approval is granted
-                # =================================================================
-                approval_required = order._evaluate_governance_rules_for_confirm()
-
-                if approval_required:
-                    _logger.info(
-                        "OPS Governance: SO %s requires approval - transitioning to waiting_approval",
-                        order.name
-                    )
-                    # Order already transitioned to waiting_approval by the method
-                    # Return early - do NOT call super().action_confirm()
-                    return {
-                        'type': 'ir.actions.client',
-                        'tag': 'display_notification',
-                        'params': {
-                            'title': _('Approval Required'),
-                            'message': _(
-                                'Order %s requires approval before confirmation. '
-                                'An approval request has been created.'
-                            ) % order.name,
-                            'type': 'warning',
-                            'sticky': True,
-                        }
-                    }
-
-                _logger.info("OPS Governance: SO %s passed all governance checks", order.name)
+            _logger.info("OPS Governance: Admin bypass for SOs %s", self.mapped('name'))
+            # Log admin override for audit trail, once for the batch
+            self.env['ops.security.audit'].sudo().log_security_override_batch(
+                model_name=self._name,
+                record_ids=self.ids,
+                reason='Admin bypass used to confirm Sale Order without governance checks'
+            )
+        else:
+            # Check Segregation of Duties (SoD) rules BEFORE governance rules
+            self._check_sod_violation('confirm')
+
+            # =================================================================
+            # GOVERNANCE INTERCEPTOR: Evaluate rules BEFORE super().action_confirm()
+            # =================================================================
+            # This must happen BEFORE the confirmation proceeds to ensure:
+            # - Rules like ">$10K requires approval" block confirmation
+            # - Orders transition to 'waiting_approval' if approval is needed
+            # - The confirmation does NOT proceed until approval is granted
+            # =================================================================
+            needs_approval = self._evaluate_governance_rules_for_confirm_batch()
+            for order in needs_approval:
+                _logger.info(
+                    "OPS Governance: SO %s requires approval - transitioning to waiting_approval",
+                    order.name
+                )
 
-            # Perform credit check
-            passed, message, is_warning_only = order._check_partner_credit_firewall()
+        to_confirm = self - needs_approval
+
+        # Perform credit checks; outstanding amounts of all partners are
+        # computed together and orders of the same partner add up
+        to_confirm.partner_id.mapped('ops_total_outstanding')
+        pending_exposure = {}
+        notes_by_result = {}
+        warned = {}
+        for order in to_confirm:
+            partner_id = order.partner_id.id
+            passed, message, is_warning_only = order._check_partner_credit_firewall(
+                pending_exposure.get(partner_id, 0.0)
+            )
+            pending_exposure[partner_id] = pending_exposure.get(partner_id, 0.0) + order.amount_total
 
             if not passed:
                 order.write({
@@ -618,37 +662,56 @@ class SaleOrder(models.Model):
                 })
                 raise UserError(_('Credit Firewall: ' + message))
 
-            # Handle credit limit warnings (soft block at SO, hard block at Picking)
+            # Credit limit warnings are a soft block at SO, hard block at Picking
+            key = (not is_warning_only, message)
+            notes_by_result[key] = notes_by_result.get(key, self.browse()) | order
             if is_warning_only:
-                order.write({
-                    'ops_credit_check_passed': False,  # Mark as not fully passed
-                    'ops_credit_check_notes': message
-                })
                 # Log the warning
                 _logger.warning(
                     "Credit Warning on SO %s: %s (Delivery will be blocked)",
                     order.name, message
                 )
-                # Post warning to chatter for visibility
-                if hasattr(order, 'message_post'):
-                    order.message_post(
-                        body=_(
-                            "<strong>⚠️ Credit Limit Warning</strong><br/>"
-                            "%s<br/><br/>"
-                            "<em>Order confirmed, but delivery will be blocked until credit is cleared.</em>"
-                        ) % message,
-                        subject=_("Credit Limit Warning"),
-                        message_type='notification',
-                        subtype_xmlid='mail.mt_note',
-                    )
-            else:
-                order.write({
-                    'ops_credit_check_passed': True,
-                    'ops_credit_check_notes': message
-                })
+                warned[order.id] = message
+
+        for (credit_passed, message), orders in notes_by_result.items():
+            orders.write({
+                'ops_credit_check_passed': credit_passed,
+                'ops_credit_check_notes': message
+            })
+
+        # Post warnings to chatter for visibility
+        if warned:
+            self.browse(list(warned))._message_log_batch(bodies={
+                order_id: _(
+                    "<strong>⚠️ Credit Limit Warning</strong><br/>"
+                    "%s<br/><br/>"
+                    "<em>Order confirmed, but delivery will be blocked until credit is cleared.</em>"
+                ) % message
+                for order_id, message in warned.items()
+            })
 
-        # Call parent method to confirm
-        return super().action_confirm()
+        # Orders that passed are confirmed together
+        result = super(SaleOrder, to_confirm).action_confirm() if to_confirm else True
+
+        if needs_approval:
+            # Orders held for approval are reported in a single notification
+            return {
+                'type': 'ir.actions.client',
+                'tag': 'display_notification',
+                'params': {
+                    'title': _('Approval Required'),
+                    'message': _(
+                        '%(held)s order(s) require approval before confirmation: %(names)s. '
+                        'Approval requests have been created. %(confirmed)s order(s) confirmed.',
+                        held=len(needs_approval),
+                        names=', '.join(needs_approval.mapped('name')),
+                        confirmed=len(to_confirm),
+                    ),
+                    'type': 'warning',
+                    'sticky': True,
+                }
+            }
+        return result
     
     def action_quotation_send(self):
         """
@@ -1,5 +1,5 @@
 from odoo import models, fields, api
-from odoo.tools.float_utils import float_compare
+from odoo.tools import SQL
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -114,24 +114,18 @@ class StockQuant(models.Model):
         if owner_id:
             domain.append(('owner_id', '=', owner_id.id))
         
-        # Search with pure SQL domain (ORM will optimize at DB level)
-        quants = self.search(domain)
-        
+        # Quantities are compared to zero at 2 digits, as float_compare() does
+        quantity_filters = []
         if strict:
             # Only positive quantities
-            quants = quants.filtered(lambda q: float_compare(q.quantity, 0, precision_digits=2) > 0)
+            quantity_filters.append('>')
         
-        if allow_negative:
-            # Include negative quants
-            pass
-        else:
+        if not allow_negative:
             # Only non-negative
-            quants = quants.filtered(lambda q: float_compare(q.quantity, 0, precision_digits=2) >= 0)
-        
-        # Sum the available quantity
-        total_quantity = sum(quants.mapped('quantity'))
+            quantity_filters.append('>=')
         
-        return total_quantity
+        # Sum the available quantity in a single aggregate query
+        return self._sum_bu_quants(domain, 'quantity', quantity_filters)
     
     # ========================================================================
     # RESERVED QUANTITY OVERRIDE with BU Constraint
@@ -182,13 +176,34 @@ class StockQuant(models.Model):
         if owner_id:
             domain.append(('owner_id', '=', owner_id.id))
         
-        # Search with pure SQL domain
-        quants = self.search(domain)
+        # Sum reserved quantities in a single aggregate query
+        return self._sum_bu_quants(domain, 'reserved_quantity')
+    
+    def _sum_bu_quants(self, domain, field_name, quantity_filters=()):
+        """
+        Sum a quant column over a domain with one aggregate query.
         
-        # Sum reserved quantities
-        total_reserved = sum(quants.mapped('reserved_quantity'))
+        The domain goes through _search so record rules apply exactly as
+        they would for search(). Served by the
+        (product_id, location_id, ops_business_unit_id) index.
         
-        return total_reserved
+        :param domain: Quant domain
+        :param field_name: Stored numeric column to sum
+        :param quantity_filters: Operators ('>' or '>=') comparing the quantity
+            rounded to 2 digits against zero
+        :return: Sum as float
+        """
+        self.flush_model()
+        query = self._search(domain)
+        for operator in quantity_filters:
+            query.add_where(SQL(
+                "ROUND(%s::numeric, 2) %s 0",
+                SQL.identifier(query.table, 'quantity'), SQL(operator),
+            ))
+        self.env.cr.execute(query.select(
+            SQL("COALESCE(SUM(%s), 0)", SQL.identifier(query.table, field_name))
+        ))
+        return float(self.env.cr.fetchone()[0])
     
     # ========================================================================
     # CONSTRAINT: Prevent Invalid Cross-BU Reservations
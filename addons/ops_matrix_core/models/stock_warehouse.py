@@ -25,6 +25,12 @@ class StockWarehouse(models.Model):
         
         return super().create(vals_list)
 
+    def unlink(self):
+        """Drop the cached warehouse→branch map with the warehouses."""
+        result = super().unlink()
+        self.env.registry.clear_cache()
+        return result
+
     @api.onchange('company_id')
     def _onchange_company_id(self):
         """When company changes, update branch_id to match."""
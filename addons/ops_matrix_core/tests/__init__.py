@@ -3,3 +3,6 @@ from . import test_matrix_access
 from . import test_branch_model
 from . import test_business_unit_model
 from . import test_security_audit
+from . import test_sod_batch
+from . import test_sale_order_batch_confirm
+from . import test_commitment_gate
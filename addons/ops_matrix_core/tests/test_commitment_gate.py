@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+"""
+Commitment Gate Tests
+Tests the batch governance check run before printing documents
+"""
+
+from odoo.tests import tagged, TransactionCase
+from odoo.exceptions import UserError
+import logging
+
+_logger = logging.getLogger(__name__)
+
+
+@tagged('post_install', '-at_install', 'ops_governance')
+class TestCommitmentGate(TransactionCase):
+    """Test _get_commitment_blocks and the print gate on sale orders."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        cls.company = cls.env.company
+        cls.branch = cls.env['ops.branch'].create({
+            'name': 'Gate Branch',
+            'code': 'BR-GATE',
+            'company_id': cls.company.id,
+        })
+        cls.business_unit = cls.env['ops.business.unit'].create({
+            'name': 'Gate BU',
+            'code': 'BU-GATE',
+            'company_ids': [(6, 0, [cls.company.id])],
+            'branch_ids': [(6, 0, [cls.branch.id])],
+        })
+
+        groups = (
+            cls.env.ref('sales_team.group_sale_salesman_all_leads')
+            | cls.env.ref('ops_matrix_core.group_ops_user')
+        )
+        cls.sales_user = cls.env['res.users'].with_context(no_reset_password=True).create({
+            'name': 'Gate Sales User',
+            'login': 'gate_sales@test.com',
+            'company_id': cls.company.id,
+            'company_ids': [(6, 0, [cls.company.id])],
+            'group_ids': [(6, 0, groups.ids)],
+            'ops_allowed_branch_ids': [(6, 0, [cls.branch.id])],
+            'ops_allowed_business_unit_ids': [(6, 0, [cls.business_unit.id])],
+        })
+
+        cls.customer = cls.env['res.partner'].create({'name': 'Gate Customer'})
+        cls.product = cls.env['product.product'].create({
+            'name': 'Gate Service',
+            'type': 'service',
+            'list_price': 100.0,
+        })
+
+        cls.small_order = cls._create_order(100.0)
+        cls.large_order = cls._create_order(5000.0)
+        cls.orders = cls.small_order | cls.large_order
+
+        # Only the rules created by the tests are enforced
+        cls.env['ops.governance.rule'].search([
+            ('model_id.model', '=', 'sale.order'),
+        ]).write({'enabled': False})
+        cls.ApprovalRequest = cls.env['ops.approval.request']
+
+    @classmethod
+    def _create_order(cls, price):
+        return cls.env['sale.order'].with_user(cls.sales_user).create({
+            'partner_id': cls.customer.id,
+            'ops_branch_id': cls.branch.id,
+            'ops_business_unit_id': cls.business_unit.id,
+            'order_line': [(0, 0, {
+                'product_id': cls.product.id,
+                'product_uom_qty': 1,
+                'price_unit': price,
+            })],
+        })
+
+    def _create_rule(self, action_type, condition_domain="[('amount_total', '>=', 1000)]"):
+        return self.env['ops.governance.rule'].create({
+            'name': f'Large orders: {action_type}',
+            'model_id': self.env.ref('sale.model_sale_order').id,
+            'company_id': self.company.id,
+            'trigger_type': 'on_write',
+            'action_type': action_type,
+            'condition_domain': condition_domain,
+            'enabled': True,
+        })
+
+    def _create_request(self, order, state, rule=False):
+        return self.ApprovalRequest.create({
+            'name': f'{order.name} approval',
+            'rule_id': rule and rule.id,
+            'model_name': 'sale.order',
+            'res_id': order.id,
+            'state': state,
+        })
+
+    def test_pending_approval_blocks(self):
+        """A pending approval blocks its document only."""
+        self._create_request(self.large_order, 'pending')
+
+        blocked = self.orders.with_user(self.sales_user)._get_commitment_blocks()
+
+        self.assertEqual(set(blocked), {self.large_order.id})
+
+    def test_block_rule_applies_to_matching_records(self):
+        """A blocking rule holds the records matching its domain."""
+        self._create_rule('block')
+
+        blocked = self.orders.with_user(self.sales_user)._get_commitment_blocks()
+
+        self.assertEqual(set(blocked), {self.large_order.id})
+
+    def test_approved_request_lifts_approval_rule(self):
+        """An approved request of the rule lets the document through."""
+        rule = self._create_rule('require_approval')
+        self.assertIn(self.large_order.id, self.orders.with_user(self.sales_user)._get_commitment_blocks())
+
+        self._create_request(self.large_order, 'approved', rule)
+
+        self.assertFalse(self.orders.with_user(self.sales_user)._get_commitment_blocks())
+
+    def test_admin_only_held_by_pending_approvals(self):
+        """Administrators skip the rules but not the pending approvals."""
+        self._create_rule('block', "[]")
+        self._create_request(self.small_order, 'pending')
+
+        blocked = self.orders._get_commitment_blocks()
+
+        self.assertEqual(set(blocked), {self.small_order.id})
+
+    def test_print_skips_blocked_documents(self):
+        """A batch print leaves blocked documents out; printing only those fails."""
+        self._create_rule('block')
+        Report = self.env['ir.actions.report'].with_user(self.sales_user)
+
+        content, __ = Report._render_qweb_pdf('sale.action_report_saleorder', self.orders.ids)
+        self.assertIn(self.small_order.name, content.decode())
+        self.assertNotIn(self.large_order.name, content.decode())
+
+        with self.assertRaises(UserError):
+            Report._render_qweb_pdf('sale.action_report_saleorder', self.large_order.ids)
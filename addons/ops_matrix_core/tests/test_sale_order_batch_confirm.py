@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+"""
+Sale Order Batch Confirmation Tests
+Tests that action_confirm holds the orders needing approval and confirms the rest
+"""
+
+from odoo.tests import tagged, TransactionCase
+import logging
+
+_logger = logging.getLogger(__name__)
+
+
+@tagged('post_install', '-at_install', 'ops_governance')
+class TestSaleOrderBatchConfirm(TransactionCase):
+    """Test governance evaluation of action_confirm on a batch of orders."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        cls.company = cls.env.company
+        cls.branch = cls.env['ops.branch'].create({
+            'name': 'Batch Branch',
+            'code': 'BR-BATCH',
+            'company_id': cls.company.id,
+        })
+        cls.business_unit = cls.env['ops.business.unit'].create({
+            'name': 'Batch BU',
+            'code': 'BU-BATCH',
+            'company_ids': [(6, 0, [cls.company.id])],
+            'branch_ids': [(6, 0, [cls.branch.id])],
+        })
+
+        groups = (
+            cls.env.ref('sales_team.group_sale_salesman_all_leads')
+            | cls.env.ref('ops_matrix_core.group_ops_manager')
+        )
+        cls.sales_user = cls.env['res.users'].with_context(no_reset_password=True).create({
+            'name': 'Batch Sales User',
+            'login': 'batch_sales@test.com',
+            'company_id': cls.company.id,
+            'company_ids': [(6, 0, [cls.company.id])],
+            'group_ids': [(6, 0, groups.ids)],
+            'ops_allowed_branch_ids': [(6, 0, [cls.branch.id])],
+            'ops_allowed_business_unit_ids': [(6, 0, [cls.business_unit.id])],
+        })
+
+        cls.customer = cls.env['res.partner'].create({'name': 'Batch Customer'})
+        cls.product = cls.env['product.product'].create({
+            'name': 'Batch Service',
+            'type': 'service',
+            'list_price': 100.0,
+        })
+
+        # Only the rule created by the tests is enforced
+        cls.env['ops.governance.rule'].search([
+            ('model_id.model', '=', 'sale.order'),
+        ]).write({'enabled': False})
+        cls.rule = cls.env['ops.governance.rule'].create({
+            'name': 'Large orders require approval',
+            'model_id': cls.env.ref('sale.model_sale_order').id,
+            'company_id': cls.company.id,
+            'action_type': 'require_approval',
+            'condition_domain': "[('amount_total', '>=', 1000)]",
+            'enabled': True,
+        })
+        cls.ApprovalRequest = cls.env['ops.approval.request']
+
+    def _create_order(self, price):
+        return self.env['sale.order'].with_user(self.sales_user).create({
+            'partner_id': self.customer.id,
+            'ops_branch_id': self.branch.id,
+            'ops_business_unit_id': self.business_unit.id,
+            'order_line': [(0, 0, {
+                'product_id': self.product.id,
+                'product_uom_qty': 1,
+                'price_unit': price,
+            })],
+        })
+
+    def _requests(self, orders, state):
+        return self.ApprovalRequest.search([
+            ('model_name', '=', 'sale.order'),
+            ('res_id', 'in', orders.ids),
+            ('state', '=', state),
+        ])
+
+    def test_held_and_confirmed_orders(self):
+        """Large orders wait for approval while the others are confirmed."""
+        large = self._create_order(5000.0) | self._create_order(2500.0)
+        small = self._create_order(100.0)
+
+        result = (large | small).with_user(self.sales_user).action_confirm()
+
+        self.assertEqual(result['type'], 'ir.actions.client')
+        self.assertEqual(small.state, 'sale')
+        self.assertEqual(set(large.mapped('state')), {'waiting_approval'})
+        self.assertTrue(all(large.mapped('approval_locked')))
+
+        requests = self._requests(large, 'pending')
+        self.assertEqual(sorted(requests.mapped('res_id')), sorted(large.ids))
+        self.assertEqual(requests.rule_id, self.rule)
+        for order in large:
+            self.assertEqual(order.approval_request_id.res_id, order.id)
+        self.assertFalse(self._requests(small, 'pending'))
+
+    def test_approved_order_is_confirmed(self):
+        """An order with an approved request is confirmed with the batch."""
+        approved, held = self._create_order(5000.0), self._create_order(5000.0)
+        self.ApprovalRequest.create({
+            'name': 'Approved large order',
+            'rule_id': self.rule.id,
+            'model_name': 'sale.order',
+            'res_id': approved.id,
+            'state': 'approved',
+        })
+
+        (approved | held).with_user(self.sales_user).action_confirm()
+
+        self.assertEqual(approved.state, 'sale')
+        self.assertEqual(held.state, 'waiting_approval')
+
+    def test_pending_request_is_reused(self):
+        """A pending request of the rule is linked instead of creating a new one."""
+        order = self._create_order(5000.0)
+        pending = self.ApprovalRequest.create({
+            'name': 'Pending large order',
+            'rule_id': self.rule.id,
+            'model_name': 'sale.order',
+            'res_id': order.id,
+            'state': 'pending',
+        })
+
+        (order | self._create_order(100.0)).with_user(self.sales_user).action_confirm()
+
+        self.assertEqual(order.state, 'waiting_approval')
+        self.assertEqual(order.approval_request_id, pending)
+        self.assertEqual(self._requests(order, 'pending'), pending)
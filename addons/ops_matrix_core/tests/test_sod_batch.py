@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+"""
+Segregation of Duties Batch Tests
+Tests the cached rule lookup and the recordset-wide violation check
+"""
+
+from odoo.tests import tagged, TransactionCase
+from odoo.exceptions import UserError
+import logging
+
+_logger = logging.getLogger(__name__)
+
+
+@tagged('post_install', '-at_install', 'ops_security')
+class TestSoDBatch(TransactionCase):
+    """Test _check_sod_violation on a batch of sale orders."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        cls.company = cls.env.company
+        cls.branch = cls.env['ops.branch'].create({
+            'name': 'SoD Branch',
+            'code': 'BR-SOD',
+            'company_id': cls.company.id,
+        })
+        cls.business_unit = cls.env['ops.business.unit'].create({
+            'name': 'SoD BU',
+            'code': 'BU-SOD',
+            'company_ids': [(6, 0, [cls.company.id])],
+            'branch_ids': [(6, 0, [cls.branch.id])],
+        })
+
+        groups = (
+            cls.env.ref('base.group_user')
+            | cls.env.ref('sales_team.group_sale_salesman_all_leads')
+            | cls.env.ref('ops_matrix_core.group_ops_user')
+        )
+        cls.user_a, cls.user_b = cls.env['res.users'].with_context(no_reset_password=True).create([{
+            'name': f'SoD User {suffix}',
+            'login': f'sod_user_{suffix.lower()}@test.com',
+            'company_id': cls.company.id,
+            'company_ids': [(6, 0, [cls.company.id])],
+            'group_ids': [(6, 0, groups.ids)],
+            'ops_allowed_branch_ids': [(6, 0, [cls.branch.id])],
+            'ops_allowed_business_unit_ids': [(6, 0, [cls.business_unit.id])],
+        } for suffix in ('A', 'B')])
+
+        cls.customer = cls.env['res.partner'].create({'name': 'SoD Customer'})
+        cls.product = cls.env['product.product'].create({
+            'name': 'SoD Service',
+            'type': 'service',
+            'list_price': 100.0,
+        })
+
+        cls.SoDRule = cls.env['ops.segregation.of.duties']
+        # Only the rules created by the tests are enforced
+        cls.SoDRule.search([
+            ('model_name', '=', 'sale.order'),
+            ('action_2', '=', 'confirm'),
+        ]).write({'enabled': False})
+
+    def _create_order(self, user, price=100.0):
+        return self.env['sale.order'].with_user(user).create({
+            'partner_id': self.customer.id,
+            'ops_branch_id': self.branch.id,
+            'ops_business_unit_id': self.business_unit.id,
+            'order_line': [(0, 0, {
+                'product_id': self.product.id,
+                'product_uom_qty': 1,
+                'price_unit': price,
+            })],
+        })
+
+    def _create_rule(self, **values):
+        return self.SoDRule.create({
+            'name': 'Creator cannot confirm',
+            'model_name': 'sale.order',
+            'action_1': 'create',
+            'action_2': 'confirm',
+            'enabled': True,
+            **values,
+        })
+
+    def _violation_logs(self, rule):
+        return self.env['ops.segregation.of.duties.log'].search([('rule_id', '=', rule.id)])
+
+    def test_rule_cache_invalidation(self):
+        """Creating, updating and deleting a rule refreshes the cached lookup."""
+        def enforced_ids():
+            return self.SoDRule._get_enforced_rule_ids('sale.order', 'confirm', self.company.id)
+
+        self.assertFalse(enforced_ids())
+
+        rule = self._create_rule()
+        self.assertEqual(enforced_ids(), (rule.id,))
+
+        rule.write({'enabled': False})
+        self.assertFalse(enforced_ids())
+
+        rule.write({'enabled': True})
+        self.assertEqual(enforced_ids(), (rule.id,))
+
+        rule.unlink()
+        self.assertFalse(enforced_ids())
+
+    def test_batch_violations_logged_together(self):
+        """Every order of the batch created by the user is logged as a violation."""
+        own_orders = self._create_order(self.user_a) | self._create_order(self.user_a)
+        other_order = self._create_order(self.user_b)
+        rule = self._create_rule(block_violation=False)
+
+        (own_orders | other_order).with_user(self.user_a)._check_sod_violation('confirm')
+
+        logs = self._violation_logs(rule)
+        self.assertEqual(sorted(logs.mapped('res_id')), sorted(own_orders.ids))
+        self.assertEqual(logs.user_id, self.user_a)
+        self.assertEqual(logs.action_1_user_id, self.user_a)
+        self.assertFalse(any(logs.mapped('blocked')))
+
+    def test_threshold_limits_the_batch(self):
+        """Orders below the rule threshold are not checked."""
+        small = self._create_order(self.user_a, price=100.0)
+        large = self._create_order(self.user_a, price=5000.0)
+        rule = self._create_rule(block_violation=False, threshold_amount=1000.0)
+
+        (small | large).with_user(self.user_a)._check_sod_violation('confirm')
+
+        self.assertEqual(self._violation_logs(rule).mapped('res_id'), large.ids)
+
+    def test_blocking_rule(self):
+        """A blocking rule stops the batch only when the user created an order."""
+        own_order = self._create_order(self.user_a)
+        other_order = self._create_order(self.user_b)
+        self._create_rule(block_violation=True)
+
+        other_order.with_user(self.user_a)._check_sod_violation('confirm')
+        with self.assertRaises(UserError):
+            (own_order | other_order).with_user(self.user_a)._check_sod_violation('confirm')